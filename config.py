@@ -23,3 +23,7 @@ TIMEZONE = ZoneInfo(os.getenv("TIMEZONE", "Asia/Seoul"))
 # Server
 HOST = os.getenv("HOST", "127.0.0.1")
 PORT = int(os.getenv("PORT", "8000"))
+
+# 동기 엔드포인트를 실행하는 스레드풀 크기 (anyio 기본값 40)
+# DB 커넥션 풀 최대 크기도 이 값에 맞춤 (database.py)
+API_THREAD_LIMIT = int(os.getenv("API_THREAD_LIMIT", "100"))
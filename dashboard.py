@@ -5,20 +5,31 @@ Provides ADMIN and WORKER interfaces with WorkLog support.
 NOTE: Real-time second-by-second timers are NOT implemented per Step 0 rules.
 Time display shows "started at HH:MM" or "accumulated time at refresh".
 """
+import bisect
+import html
 import json
 import os
+import re
 import uuid
+from collections import defaultdict
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 import streamlit as st
-from sqlalchemy.orm import Session
-from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, JsCode
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from config import TIMEZONE
 
+# orjson이 설치되어 있으면 Auto-QC/피드백 JSON 파싱에 사용 (없으면 표준 json)
+# orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스라 예외 처리는 동일
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # ============================================================
 # 컬럼 설정 저장/로드 (로컬 JSON 파일)
 # ============================================================
@@ -76,6 +87,8 @@ from services import (
     create_feedback,
     update_feedback,
     delete_feedback,
+    get_or_create_part,
+    get_or_create_project,
 )
 from models import (
     ActionType,
@@ -87,7 +100,6 @@ from models import (
     Event,
     EventType,
     Part,
-    PreQcSummary,
     Project,
     ReviewerQcFeedback,
     ReviewNote,
@@ -110,7 +122,7 @@ st.set_page_config(
 # ============================================================
 # 전역 CSS (모든 페이지에 동일 적용)
 # ============================================================
-st.markdown("""
+GLOBAL_CSS = """
 <style>
 /* =========================================================
 AG Grid: 헤더 / 셀 왼쪽 정렬 + 줄바꿈
@@ -246,7 +258,23 @@ border-bottom: 3px solid #FF4B4B !important;
 font-weight: 600 !important;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def _minified_global_css() -> str:
+    """GLOBAL_CSS에서 주석/공백 제거 (프로세스당 1회만 계산)."""
+    css = re.sub(r"/\*.*?\*/", "", GLOBAL_CSS, flags=re.DOTALL)
+    return re.sub(r"\s+", " ", css).strip()
+
+
+def inject_global_css() -> None:
+    """
+    전역 CSS 주입.
+    Streamlit은 rerun 때 다시 그리지 않은 요소를 제거하므로 매 실행마다 호출해야 함.
+    대신 최소화된 문자열만 전송해 rerun당 payload를 줄임.
+    """
+    st.markdown(_minified_global_css(), unsafe_allow_html=True)
 
 # Pause reason options
 PAUSE_REASONS = [
@@ -279,6 +307,16 @@ TABLE_FOOTER_HEIGHT = 50  # 페이지네이션 영역 높이 (px)
 TABLE_MIN_ROWS = 5  # 최소 표시 행 수
 TABLE_DEFAULT_PAGE_SIZE = 25  # 기본 페이지 사이즈
 
+# 대용량 테이블: 이 행 수를 넘으면 블록 단위로 잘라서 AG Grid에 전달
+TABLE_SERVER_SIDE_THRESHOLD = 1000  # 서버 측 분할 기준 행 수
+TABLE_SERVER_SIDE_BLOCK_SIZE = 100  # 한 번에 전송하는 행 수
+
+# 선택/툴바가 없는 소형 표는 AG Grid 대신 st.dataframe 사용
+TABLE_SMALL_READONLY_MAX_ROWS = 50
+
+# 케이스 목록이 이 행 수를 넘으면 AG Grid 대신 st.dataframe(행 선택 지원) 사용
+TABLE_NATIVE_SELECT_THRESHOLD = 500
+
 # st.dataframe용 상수 (페이지네이션 없음)
 DATAFRAME_ROW_HEIGHT = 35  # 행 높이 (px)
 DATAFRAME_HEADER_HEIGHT = 38  # 헤더 높이 (px)
@@ -386,6 +424,14 @@ def render_table_df(
     # 높이 자동 계산 (height가 None일 때만)
     calculated_height = height if height is not None else calculate_dataframe_height(row_count, max_rows, min_rows)
 
+    # 문자열만 담긴 object 컬럼은 Arrow 문자열 dtype으로 지정 (Arrow 변환 시 값별 타입 추론 생략)
+    string_cols = [
+        col for col in df.columns
+        if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == "string"
+    ]
+    if string_cols:
+        df = df.astype({col: ARROW_STRING_DTYPE for col in string_cols})
+
     st.dataframe(
         df,
         height=calculated_height,
@@ -395,6 +441,37 @@ def render_table_df(
     )
 
 
+def render_cases_st_dataframe(
+    df: pd.DataFrame,
+    key: str,
+    height: int = None,
+    hide_columns: list = None,
+) -> dict:
+    """
+    st.dataframe 기반 단일 행 선택 테이블 (대용량 케이스 목록용).
+    AG Grid와 달리 iframe 직렬화/JS 컬럼 맞춤이 없어 행 수가 많아도 가벼움.
+
+    Returns:
+        AG Grid 응답과 같은 형태의 dict ({"selected_rows": DataFrame})
+    """
+    if df.empty:
+        st.info("표시할 데이터가 없습니다.")
+        return None
+
+    hidden = set(hide_columns or [])
+    event = st.dataframe(
+        df,
+        height=height,
+        hide_index=True,
+        use_container_width=True,
+        column_order=[col for col in df.columns if col not in hidden],
+        on_select="rerun",
+        selection_mode="single-row",
+        key=key,
+    )
+    return {"selected_rows": df.iloc[event.selection.rows]}
+
+
 # 테이블 컬럼 라벨 (공통)
 UI_LABELS = {
     "id": "번호",
@@ -418,6 +495,205 @@ UI_LABELS = {
     "unassigned": "미지정",
 }
 
+# ============================================================
+# st.fragment 호환 (Streamlit 1.37 미만은 experimental_fragment / 일반 함수)
+# ============================================================
+
+def _fragment(func):
+    """지원되는 fragment 데코레이터를 적용 (없으면 일반 함수로 동작)."""
+    decorator = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    return decorator(func) if decorator else func
+
+
+def _rerun_fragment():
+    """
+    현재 fragment만 rerun.
+    scope 인자를 지원하지 않는 버전이거나 전체 실행 중 호출되면 전체 rerun.
+    """
+    from streamlit.errors import StreamlitAPIException
+
+    try:
+        st.rerun(scope="fragment")
+    except (TypeError, StreamlitAPIException):
+        st.rerun()
+
+
+# ============================================================
+# AG Grid 공통 JS 콜백 / CSS (정적 상수)
+# ============================================================
+
+# 렌더 직후: 값 기준 autoSize → 화면폭에 맞게 sizeColumnsToFit
+GRID_ON_FIRST_DATA_RENDERED_JS = """
+function(params) {
+    const allCols = params.columnApi.getAllColumns().map(c => c.getColId());
+    params.columnApi.autoSizeColumns(allCols, false);
+    params.api.sizeColumnsToFit();
+}
+"""
+
+# 화면 크기 변경 시 다시 맞춤
+GRID_ON_GRID_SIZE_CHANGED_JS = """
+function(params) {
+    params.api.sizeColumnsToFit();
+}
+"""
+
+# 공통 테이블 CSS: 왼쪽 정렬 + 정렬 아이콘 숨김
+STYLED_GRID_CUSTOM_CSS = {
+    ".ag-header-cell-label": {"justify-content": "flex-start"},
+    ".ag-header-cell-text": {"text-align": "left"},
+    ".ag-cell": {
+        "display": "flex",
+        "align-items": "center",
+        "justify-content": "flex-start",
+    },
+    ".ag-cell-value": {"white-space": "normal", "line-height": "1.3"},
+    ".ag-sort-indicator-icon": {"display": "none"},
+    ".ag-header-icon": {"display": "none"},
+}
+
+# 케이스 그리드 CSS: iframe 내부에 직접 주입 (확실한 가운데 정렬)
+CASES_GRID_CUSTOM_CSS = {
+    ".ag-header-cell-label": {"justify-content": "center"},
+    ".ag-header-cell-text": {"text-align": "center", "width": "100%"},
+    ".ag-cell": {
+        "display": "flex",
+        "align-items": "center",
+        "justify-content": "center",
+    },
+    ".ag-cell-value": {"white-space": "normal", "line-height": "1.2"},
+}
+
+
+@st.cache_resource
+def _grid_js_callbacks() -> dict:
+    """컬럼 맞춤 JsCode 콜백 (프로세스당 1회 생성)."""
+    from st_aggrid import JsCode
+
+    return {
+        "onFirstDataRendered": JsCode(GRID_ON_FIRST_DATA_RENDERED_JS),
+        "onGridSizeChanged": JsCode(GRID_ON_GRID_SIZE_CHANGED_JS),
+    }
+
+
+# ============================================================
+# AG Grid 캐시 헬퍼 (DataFrame 해시 기반)
+# ============================================================
+
+def _dataframe_schema(df: pd.DataFrame) -> tuple:
+    """컬럼/dtype/행 수 튜플 (캐시 키용)."""
+    return (tuple(df.columns), tuple(str(t) for t in df.dtypes), len(df))
+
+
+def _dataframe_hash(df: pd.DataFrame) -> int:
+    """DataFrame 값 기반 해시 (캐시 키용)."""
+    return int(pd.util.hash_pandas_object(df, index=False).sum())
+
+
+def _column_max_lengths(df: pd.DataFrame) -> dict:
+    """컬럼별 문자열 최대 길이 (전체 컬럼 한 번에 벡터 연산, 결측은 0)."""
+    if df.empty:
+        return {}
+    return df.astype(str).apply(lambda c: c.str.len().max()).fillna(0).astype(int).to_dict()
+
+
+def _get_csv_bytes(state_key: str, schema: tuple, values_hash: int, df: pd.DataFrame) -> bytes:
+    """
+    CSV 인코딩 결과를 세션에 보관하고 데이터가 바뀐 경우에만 다시 인코딩.
+    st.cache_data와 달리 rerun마다 bytes를 역직렬화(복사)하지 않음.
+    """
+    cached = st.session_state.get(state_key)
+    if cached is None or cached[0] != (schema, values_hash):
+        cached = ((schema, values_hash), df.to_csv(index=False).encode("utf-8-sig"))
+        st.session_state[state_key] = cached
+    return cached[1]
+
+
+@st.cache_data(show_spinner=False)
+def _build_grid_options(
+    schema: tuple,
+    values_hash: int,
+    pinned_columns: tuple,
+    enable_selection: bool,
+    page_size: int,
+    _df: pd.DataFrame,
+) -> dict:
+    """
+    render_styled_dataframe용 gridOptions 생성 (캐시).
+    동일 데이터/설정이면 GridOptionsBuilder, columnDefs 순회를 건너뜀.
+    """
+    from st_aggrid import GridOptionsBuilder
+
+    gb = GridOptionsBuilder.from_dataframe(_df)
+
+    # 기본 컬럼 설정: 왼쪽 정렬, 메뉴/정렬 제거, flex
+    gb.configure_default_column(
+        filter=False,
+        sortable=False,  # 정렬 아이콘 제거
+        resizable=True,
+        suppressMenu=True,  # 메뉴 제거
+        floatingFilter=False,
+        cellStyle={"textAlign": "left"},  # 왼쪽 정렬
+        wrapText=True,
+        autoHeight=True,
+        flex=1,  # 화면 크기에 맞춰 자동 조절
+        minWidth=80,
+    )
+
+    # 컬럼별 최대 값 길이 (전체 컬럼 한 번에 벡터 연산)
+    max_lens = _column_max_lengths(_df)
+
+    # 컬럼별 minWidth 추정 (값/헤더 길이 기반)
+    def _estimate_min_width(col: str) -> int:
+        header_len = len(str(col))
+        val_len = int(max_lens.get(col, 0))
+        max_len = max(header_len, val_len)
+        # NAS 경로 등 긴 컬럼은 넓게
+        if "경로" in col or "path" in col.lower():
+            return max(200, min(400, max_len * 8 + 20))
+        return int(min(300, max(60, max_len * 8 + 16)))
+
+    for col in _df.columns:
+        is_pinned = col in pinned_columns
+        gb.configure_column(
+            col,
+            minWidth=_estimate_min_width(col),
+            pinned="left" if is_pinned else None,
+        )
+
+    if enable_selection:
+        gb.configure_selection(selection_mode="single", use_checkbox=False)
+
+    gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=page_size)
+
+    grid_options = gb.build()
+
+    # Page Size 옵션 설정
+    grid_options["paginationPageSizeSelector"] = [25, 50, 100]
+
+    # 행 수가 page_size보다 적을 때 자동 높이 적용 (빈 공간 제거)
+    if len(_df) < page_size:
+        grid_options["domLayout"] = "autoHeight"
+
+    # columnDefs 강제 덮어쓰기 (메뉴/정렬 완전 제거 + 왼쪽 정렬)
+    for col in grid_options.get("columnDefs", []):
+        col["suppressMenu"] = True
+        col["suppressHeaderContextMenu"] = True  # 헤더 우클릭 메뉴 제거
+        col["sortable"] = False  # 정렬 아이콘 제거
+        col["cellStyle"] = {"textAlign": "left"}
+        col["headerClass"] = "ag-header-cell-left"
+        col["wrapText"] = True
+        col["autoHeight"] = True
+
+    # 렌더 후 컬럼 자동 크기 조절 + 화면 맞춤
+    grid_options.update(_grid_js_callbacks())
+
+    # 셀/헤더 우클릭 메뉴 비활성화
+    grid_options["suppressContextMenu"] = True
+
+    return grid_options
+
+
 # ============================================================
 # 공통 데이터프레임 렌더링 함수
 # ============================================================
@@ -456,6 +732,52 @@ def render_styled_dataframe(
     Returns:
         grid_response (enable_selection=True) 또는 None
     """
+    if enable_selection:
+        # 선택 결과를 호출 측에서 바로 사용해야 하므로 전체 rerun 경로 유지
+        return _render_styled_dataframe(
+            df,
+            key=key,
+            height=height,
+            hide_columns=hide_columns,
+            enable_selection=True,
+            show_toolbar=show_toolbar,
+            pinnable_columns=pinnable_columns,
+            user_role=user_role,
+            page_size=page_size,
+        )
+
+    # 읽기 전용 표: 컬럼 설정/구간 이동 등 표 내부 상호작용은 fragment만 rerun
+    _render_readonly_dataframe_fragment(
+        df,
+        key=key,
+        height=height,
+        hide_columns=hide_columns,
+        show_toolbar=show_toolbar,
+        pinnable_columns=pinnable_columns,
+        user_role=user_role,
+        page_size=page_size,
+    )
+    return None
+
+
+@_fragment
+def _render_readonly_dataframe_fragment(df: pd.DataFrame, **kwargs) -> None:
+    """읽기 전용 표 렌더링 fragment (페이지 나머지 부분은 다시 실행하지 않음)."""
+    _render_styled_dataframe(df, enable_selection=False, **kwargs)
+
+
+def _render_styled_dataframe(
+    df: pd.DataFrame,
+    key: str = None,
+    height: int = None,
+    hide_columns: list = None,
+    enable_selection: bool = True,
+    show_toolbar: bool = True,
+    pinnable_columns: list = None,
+    user_role: str = None,
+    page_size: int = TABLE_DEFAULT_PAGE_SIZE,
+) -> dict:
+    """render_styled_dataframe 실제 구현 (인자 설명은 render_styled_dataframe 참고)."""
     if df.empty:
         st.info("표시할 데이터가 없습니다.")
         return None
@@ -583,9 +905,19 @@ def render_styled_dataframe(
     visible_columns = visible_cols_state if visible_cols_state else all_columns
     display_df = display_df[visible_columns]
 
+    # 읽기 전용 소형 표: AG Grid 컴포넌트 마운트/deepcopy 없이 st.dataframe으로 렌더링
+    if not enable_selection and not show_toolbar and len(display_df) <= TABLE_SMALL_READONLY_MAX_ROWS:
+        render_table_df(display_df, max_rows=page_size, key=key)
+        return None
+
+    # 캐시 키: 스키마 + 값 해시 (데이터가 같으면 gridOptions/CSV 재사용)
+    schema = _dataframe_schema(display_df)
+    values_hash = _dataframe_hash(display_df)
+
     # CSV 내보내기 (표 바로 위)
     if show_toolbar:
-        csv_data = display_df.to_csv(index=False).encode("utf-8-sig")
+        csv_state_key = f"{key}_csv_bytes" if key else "_csv_bytes"
+        csv_data = _get_csv_bytes(csv_state_key, schema, values_hash, display_df)
         st.download_button(
             label="CSV 내보내기",
             data=csv_data,
@@ -594,117 +926,60 @@ def render_styled_dataframe(
             key=f"{key}_csv_download" if key else None,
         )
 
+    # 대용량 테이블: 현재 블록만 브라우저로 전송 (서버 측 분할)
+    # - 전체 DataFrame 직렬화/deepcopy 대신 O(block) 크기만 전달
+    # - CSV 내보내기는 위에서 전체 데이터 기준으로 처리됨
+    grid_df = display_df
+    grid_key = key
+    total_rows = len(display_df)
+    if total_rows > TABLE_SERVER_SIDE_THRESHOLD:
+        block_count = -(-total_rows // TABLE_SERVER_SIDE_BLOCK_SIZE)
+        block_key = f"{key}_block" if key else "_block"
+        # 필터 등으로 행 수가 줄어든 경우 범위 보정
+        if st.session_state.get(block_key, 1) > block_count:
+            st.session_state[block_key] = block_count
+        block = st.number_input(
+            f"구간 (총 {total_rows}건, {TABLE_SERVER_SIDE_BLOCK_SIZE}건 단위)",
+            min_value=1,
+            max_value=block_count,
+            step=1,
+            key=block_key,
+        )
+        block_start = (int(block) - 1) * TABLE_SERVER_SIDE_BLOCK_SIZE
+        grid_df = display_df.iloc[block_start:block_start + TABLE_SERVER_SIDE_BLOCK_SIZE]
+        schema = _dataframe_schema(grid_df)
+        values_hash = _dataframe_hash(grid_df)
+        grid_key = f"{key}_block_{int(block)}" if key else None
+
     # 고정 컬럼
     pinned_columns = st.session_state.get(pinned_key, [])
 
-    gb = GridOptionsBuilder.from_dataframe(display_df)
-
-    # 기본 컬럼 설정: 왼쪽 정렬, 메뉴/정렬 제거, flex
-    gb.configure_default_column(
-        filter=False,
-        sortable=False,  # 정렬 아이콘 제거
-        resizable=True,
-        suppressMenu=True,  # 메뉴 제거
-        floatingFilter=False,
-        cellStyle={"textAlign": "left"},  # 왼쪽 정렬
-        wrapText=True,
-        autoHeight=True,
-        flex=1,  # 화면 크기에 맞춰 자동 조절
-        minWidth=80,
+    grid_options = _build_grid_options(
+        schema,
+        values_hash,
+        tuple(pinned_columns),
+        enable_selection,
+        page_size,
+        grid_df,
     )
 
-    # 컬럼별 minWidth 추정 (값/헤더 길이 기반)
-    def _estimate_min_width(col: str) -> int:
-        header_len = len(str(col))
-        s = display_df[col].astype(str)
-        if len(s) > 100:
-            s = s.sample(100, random_state=0)
-        val_len = int(s.map(len).max()) if len(s) else 0
-        max_len = max(header_len, val_len)
-        # NAS 경로 등 긴 컬럼은 넓게
-        if "경로" in col or "path" in col.lower():
-            return max(200, min(400, max_len * 8 + 20))
-        return int(min(300, max(60, max_len * 8 + 16)))
-
-    for col in display_df.columns:
-        is_pinned = col in pinned_columns
-        gb.configure_column(
-            col,
-            minWidth=_estimate_min_width(col),
-            pinned="left" if is_pinned else None,
-        )
-
-    if enable_selection:
-        gb.configure_selection(selection_mode="single", use_checkbox=False)
-
-    gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=page_size)
-
-    grid_options = gb.build()
-
-    # Page Size 옵션 설정
-    grid_options["paginationPageSizeSelector"] = [25, 50, 100]
-
     # 동적 높이 계산 (height가 None이면 자동 계산)
-    row_count = len(display_df)
+    row_count = len(grid_df)
     calculated_height = height if height is not None else calculate_table_height(row_count, page_size)
 
-    # 행 수가 page_size보다 적을 때 자동 높이 적용 (빈 공간 제거)
-    if row_count < page_size:
-        grid_options["domLayout"] = "autoHeight"
-
-    # columnDefs 강제 덮어쓰기 (메뉴/정렬 완전 제거 + 왼쪽 정렬)
-    for col in grid_options.get("columnDefs", []):
-        col["suppressMenu"] = True
-        col["suppressHeaderContextMenu"] = True  # 헤더 우클릭 메뉴 제거
-        col["sortable"] = False  # 정렬 아이콘 제거
-        col["cellStyle"] = {"textAlign": "left"}
-        col["headerClass"] = "ag-header-cell-left"
-        col["wrapText"] = True
-        col["autoHeight"] = True
-
-    # 렌더 후 컬럼 자동 크기 조절 + 화면 맞춤
-    grid_options["onFirstDataRendered"] = JsCode("""
-    function(params) {
-        const allCols = params.columnApi.getAllColumns().map(c => c.getColId());
-        params.columnApi.autoSizeColumns(allCols, false);
-        params.api.sizeColumnsToFit();
-    }
-    """)
-
-    # 화면 크기 변경 시 다시 맞춤
-    grid_options["onGridSizeChanged"] = JsCode("""
-    function(params) {
-        params.api.sizeColumnsToFit();
-    }
-    """)
-
-    # 셀/헤더 우클릭 메뉴 비활성화
-    grid_options["suppressContextMenu"] = True
-
-    # CSS: 왼쪽 정렬 + 정렬 아이콘 숨김
-    custom_css = {
-        ".ag-header-cell-label": {"justify-content": "flex-start"},
-        ".ag-header-cell-text": {"text-align": "left"},
-        ".ag-cell": {
-            "display": "flex",
-            "align-items": "center",
-            "justify-content": "flex-start",
-        },
-        ".ag-cell-value": {"white-space": "normal", "line-height": "1.3"},
-        ".ag-sort-indicator-icon": {"display": "none"},
-        ".ag-header-icon": {"display": "none"},
-    }
+    from st_aggrid import AgGrid, GridUpdateMode
 
     grid_response = AgGrid(
-        display_df,
+        grid_df,
         gridOptions=grid_options,
-        update_mode=GridUpdateMode.MODEL_CHANGED,
+        # 선택이 필요 없는 표는 그리드 상호작용으로 rerun하지 않음
+        update_mode=GridUpdateMode.MODEL_CHANGED if enable_selection else GridUpdateMode.NO_UPDATE,
         fit_columns_on_grid_load=False,
         allow_unsafe_jscode=True,
         height=calculated_height,
-        key=key,
+        key=grid_key,
         theme="streamlit",
-        custom_css=custom_css,
+        custom_css=STYLED_GRID_CUSTOM_CSS,
     )
 
     return grid_response if enable_selection else None
@@ -723,6 +998,56 @@ def _reset_case_filters(prefix: str, show_assignee: bool):
     st.session_state[f"{prefix}_filter_status"] = []
     if show_assignee:
         st.session_state[f"{prefix}_filter_assignee"] = []
+    # 옵션 검색어 (옵션이 많은 필터에만 존재)
+    for filter_key in ("project", "part", "hospital", "status", "assignee"):
+        if f"{prefix}_filter_{filter_key}_search" in st.session_state:
+            st.session_state[f"{prefix}_filter_{filter_key}_search"] = ""
+
+
+# 케이스 필터 대상 컬럼 (UI_LABELS 키)
+CASE_FILTER_KEYS = ("project", "part", "hospital", "status", "assignee")
+
+# 필터 multiselect에 한 번에 전달하는 최대 옵션 수 (초과 시 검색/빈도 상위만 표시)
+FILTER_MAX_SHOWN_OPTIONS = 200
+
+# 케이스ID 검색용 소문자 컬럼 (테이블에는 표시하지 않음)
+CASE_UID_SEARCH_COLUMN = "_case_uid_lc"
+
+# 케이스별로 값이 다른 자유 텍스트 컬럼 (UI_LABELS 키) - Arrow 문자열로 보관
+CASE_TEXT_KEYS = ("case_uid", "display_name", "original_name")
+
+# Arrow 기반 문자열 dtype (pyarrow는 streamlit 의존성으로 항상 설치됨)
+ARROW_STRING_DTYPE = "string[pyarrow]"
+
+
+def prepare_case_filter_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    케이스 필터용 컬럼 준비 (in-place).
+    - 필터 대상 컬럼을 category dtype으로 변환 (unique/isin/정렬 가속)
+    - 자유 텍스트 컬럼은 Arrow 문자열로 변환 (행별 Python str 객체 대신 연속 버퍼,
+      해시/검색/그리드 직렬화 시 이동하는 바이트 감소)
+    - 케이스ID 검색용 소문자 컬럼 추가 (검색 시 행별 대소문자 변환 생략)
+    """
+    for filter_key in CASE_FILTER_KEYS:
+        col = UI_LABELS[filter_key]
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    for text_key in CASE_TEXT_KEYS:
+        col = UI_LABELS[text_key]
+        if col in df.columns:
+            df[col] = df[col].astype(ARROW_STRING_DTYPE)
+    if UI_LABELS["case_uid"] in df.columns:
+        df[CASE_UID_SEARCH_COLUMN] = df[UI_LABELS["case_uid"]].str.lower()
+    return df
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _extract_filter_options(columns_hash: int, columns: tuple, _df: pd.DataFrame) -> dict:
+    """
+    필터 컬럼별 정렬된 고유값 목록 (캐시).
+    _df는 캐시 키에서 제외되고 필터 대상 컬럼 값의 해시가 키로 사용됨.
+    """
+    return {col: sorted(_df[col].dropna().unique().tolist()) for col in columns}
 
 
 def render_case_filters(
@@ -754,13 +1079,29 @@ def render_case_filters(
     if show_assignee:
         st.session_state.setdefault(f"{prefix}_filter_assignee", [])
 
-    filtered_df = df.copy()
+    # 필터 옵션 추출
+    # - category 컬럼: categories가 이미 정렬/중복 제거되어 있어 그대로 사용 (데이터 스캔 없음)
+    # - 그 외 컬럼: 컬럼 값 해시 기준 캐시 재사용
+    option_columns = [UI_LABELS[k] for k in CASE_FILTER_KEYS if UI_LABELS[k] in df.columns]
+    filter_options = {
+        col: df[col].cat.categories.tolist()
+        for col in option_columns
+        if isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+    other_columns = tuple(col for col in option_columns if col not in filter_options)
+    if other_columns:
+        filter_options.update(_extract_filter_options(
+            _dataframe_hash(df[list(other_columns)]),
+            other_columns,
+            df,
+        ))
 
     # 전체 선택 체크박스 처리 헬퍼
-    def _render_filter_with_select_all(label: str, checkbox_key: str, filter_key: str, options: list):
+    def _render_filter_with_select_all(label: str, checkbox_key: str, filter_key: str, options: list, column: str = None):
         """라벨과 전체선택 체크박스를 렌더링하고 multiselect 반환."""
         current = st.session_state.get(filter_key, [])
-        is_all = len(current) == len(options) and set(current) == set(options) if options else False
+        # multiselect 값은 항상 options의 부분집합이므로 개수 비교만으로 충분
+        is_all = bool(options) and len(current) == len(options)
 
         # 체크박스 상태를 위젯 렌더링 전에 동기화 (핵심!)
         # 이미 존재하는 경우에도 multiselect 상태에 맞춰 업데이트
@@ -784,10 +1125,29 @@ def render_case_filters(
                 disabled=not options,
             )
 
+        # 옵션이 많으면 검색어 일치(없으면 빈도 상위) 항목만 전달 (현재 선택값은 항상 포함)
+        shown_options = options
+        if len(options) > FILTER_MAX_SHOWN_OPTIONS:
+            search = st.text_input(
+                f"{label} 검색",
+                key=f"{filter_key}_search",
+                placeholder=f"{label} 검색... (상위 {FILTER_MAX_SHOWN_OPTIONS}개 표시 중)",
+                label_visibility="collapsed",
+            )
+            if search:
+                needle = search.lower()
+                candidates = [opt for opt in options if needle in str(opt).lower()]
+            elif column is not None:
+                candidates = df[column].value_counts().index.tolist()
+            else:
+                candidates = options
+            picked = set(candidates[:FILTER_MAX_SHOWN_OPTIONS]) | set(current)
+            shown_options = [opt for opt in options if opt in picked]
+
         # multiselect 렌더링
         st.multiselect(
             label,
-            options=options,
+            options=shown_options,
             key=filter_key,
             label_visibility="collapsed",
         )
@@ -807,64 +1167,61 @@ def render_case_filters(
             )
 
         with col2:
-            project_options = []
-            if UI_LABELS["project"] in df.columns:
-                project_options = sorted(df[UI_LABELS["project"]].dropna().unique().tolist())
+            project_options = filter_options.get(UI_LABELS["project"], [])
             _render_filter_with_select_all(
                 "프로젝트",
                 f"{prefix}_select_all_project",
                 f"{prefix}_filter_project",
                 project_options,
+                UI_LABELS["project"],
             )
 
         with col3:
-            part_options = []
-            if UI_LABELS["part"] in df.columns:
-                part_options = sorted(df[UI_LABELS["part"]].dropna().unique().tolist())
+            part_options = filter_options.get(UI_LABELS["part"], [])
             _render_filter_with_select_all(
                 "부위",
                 f"{prefix}_select_all_part",
                 f"{prefix}_filter_part",
                 part_options,
+                UI_LABELS["part"],
             )
 
         # 2행: 병원 + 상태 + 담당자
         col4, col5, col6 = st.columns(3)
 
         with col4:
-            hospital_options = []
-            if UI_LABELS["hospital"] in df.columns:
-                hospital_options = sorted(df[UI_LABELS["hospital"]].dropna().unique().tolist())
+            hospital_options = filter_options.get(UI_LABELS["hospital"], [])
             _render_filter_with_select_all(
                 "병원",
                 f"{prefix}_select_all_hospital",
                 f"{prefix}_filter_hospital",
                 hospital_options,
+                UI_LABELS["hospital"],
             )
 
         with col5:
-            status_options = []
-            if UI_LABELS["status"] in df.columns:
-                status_options = sorted(df[UI_LABELS["status"]].dropna().unique().tolist())
+            status_options = filter_options.get(UI_LABELS["status"], [])
             _render_filter_with_select_all(
                 "상태",
                 f"{prefix}_select_all_status",
                 f"{prefix}_filter_status",
                 status_options,
+                UI_LABELS["status"],
             )
 
         with col6:
             if show_assignee and UI_LABELS["assignee"] in df.columns:
                 # "-"나 빈 문자열 제외
-                assignee_options = sorted([
-                    x for x in df[UI_LABELS["assignee"]].dropna().unique().tolist()
+                assignee_options = [
+                    x for x in filter_options.get(UI_LABELS["assignee"], [])
                     if x and x.strip() and x != "-"
-                ])
+                ]
                 _render_filter_with_select_all(
                     "담당자",
                     f"{prefix}_select_all_assignee",
                     f"{prefix}_filter_assignee",
                     assignee_options,
+                    UI_LABELS["assignee"],
                 )
             else:
                 st.write("")  # 빈 공간
@@ -878,40 +1235,34 @@ def render_case_filters(
             kwargs={"prefix": prefix, "show_assignee": show_assignee},
         )
 
-    # 필터 적용
+    # 필터 적용 (조건별 마스크를 AND로 합친 뒤 한 번만 인덱싱)
+    mask = pd.Series(True, index=df.index)
+    any_active = False
+
     # 케이스ID 텍스트 검색
     case_id_val = st.session_state.get(f"{prefix}_case_id_search", "")
     if case_id_val:
-        filtered_df = filtered_df[
-            filtered_df[UI_LABELS["case_uid"]].astype(str).str.contains(case_id_val, case=False, na=False)
-        ]
-
-    # 프로젝트 필터
-    selected_projects = st.session_state.get(f"{prefix}_filter_project", [])
-    if selected_projects and UI_LABELS["project"] in df.columns:
-        filtered_df = filtered_df[filtered_df[UI_LABELS["project"]].isin(selected_projects)]
-
-    # 부위 필터
-    selected_parts = st.session_state.get(f"{prefix}_filter_part", [])
-    if selected_parts and UI_LABELS["part"] in df.columns:
-        filtered_df = filtered_df[filtered_df[UI_LABELS["part"]].isin(selected_parts)]
-
-    # 병원 필터
-    selected_hospitals = st.session_state.get(f"{prefix}_filter_hospital", [])
-    if selected_hospitals and UI_LABELS["hospital"] in df.columns:
-        filtered_df = filtered_df[filtered_df[UI_LABELS["hospital"]].isin(selected_hospitals)]
-
-    # 상태 필터
-    selected_statuses = st.session_state.get(f"{prefix}_filter_status", [])
-    if selected_statuses and UI_LABELS["status"] in df.columns:
-        filtered_df = filtered_df[filtered_df[UI_LABELS["status"]].isin(selected_statuses)]
+        any_active = True
+        if CASE_UID_SEARCH_COLUMN in df.columns:
+            mask &= df[CASE_UID_SEARCH_COLUMN].str.contains(case_id_val.lower(), regex=False, na=False)
+        else:
+            mask &= df[UI_LABELS["case_uid"]].astype(str).str.contains(case_id_val, case=False, na=False)
 
-    # 담당자 필터
-    selected_assignees = st.session_state.get(f"{prefix}_filter_assignee", [])
-    if selected_assignees and show_assignee and UI_LABELS["assignee"] in df.columns:
-        filtered_df = filtered_df[filtered_df[UI_LABELS["assignee"]].isin(selected_assignees)]
+    # 프로젝트 / 부위 / 병원 / 상태 / 담당자 필터
+    filter_keys = ["project", "part", "hospital", "status"]
+    if show_assignee:
+        filter_keys.append("assignee")
+    for filter_key in filter_keys:
+        selected = st.session_state.get(f"{prefix}_filter_{filter_key}", [])
+        if selected and UI_LABELS[filter_key] in df.columns:
+            any_active = True
+            mask &= df[UI_LABELS[filter_key]].isin(selected)
+
+    # 활성 필터가 없으면 원본 그대로 반환 (불필요한 복사 방지)
+    if not any_active:
+        return df
 
-    return filtered_df
+    return df[mask]
 
 
 def render_cases_aggrid(
@@ -926,6 +1277,8 @@ def render_cases_aggrid(
         st.info("표시할 데이터가 없습니다.")
         return None
 
+    from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode
+
     # 동적 높이 계산 (height가 None이면 행 수에 따라 자동 계산)
     row_count = len(df)
     calculated_height = height if height is not None else calculate_table_height(row_count, page_size)
@@ -938,7 +1291,7 @@ def render_cases_aggrid(
         filter=enable_filter,
         sortable=True,
         resizable=True,
-        suppressMenu=False,  # 메뉴 활성화
+        suppressMenu=not enable_filter,  # 필터 활성화 시 메뉴도 활성화
         floatingFilter=False,
         cellStyle={"textAlign": "center", "whiteSpace": "normal"},
         headerClass="ag-header-cell-center",
@@ -951,13 +1304,12 @@ def render_cases_aggrid(
     # ✅ 헤더/값 길이 중 큰 쪽으로 minWidth 추정 (너무 과하지 않게 상한/하한)
     # - 길이가 긴 컬럼만 더 넓게 잡히고
     # - 화면 폭에 따라 sizeColumnsToFit으로 다시 맞춰짐
+    # 값 길이 - 너무 비싸면 앞 200개만 (전체 컬럼 한 번에 벡터 연산)
+    max_lens = _column_max_lengths(df.head(200))
+
     def _estimate_min_width(col: str) -> int:
         header_len = len(str(col))
-        # 값 길이(샘플링) - 너무 비싸면 200개만
-        s = df[col].astype(str)
-        if len(s) > 200:
-            s = s.sample(200, random_state=0)
-        val_len = int(s.map(len).max()) if len(s) else 0
+        val_len = max_lens.get(col, 0)
 
         max_len = max(header_len, val_len)
         # 대충 1글자 ~ 9px 정도로 잡고, 최소/최대 캡
@@ -983,47 +1335,8 @@ def render_cases_aggrid(
     if row_count < page_size:
         grid_options["domLayout"] = "autoHeight"
 
-    # columnDefs 강제 덮어쓰기 (가운데 헤더 + 필터 설정 반영)
-    for col in grid_options.get("columnDefs", []):
-        col["filter"] = enable_filter  # enable_filter 파라미터 반영
-        col["floatingFilter"] = False
-        col["suppressMenu"] = not enable_filter  # 필터 활성화 시 메뉴도 활성화
-        col["sortable"] = True
-        col["headerClass"] = "ag-header-cell-center"
-        col["wrapText"] = True
-        col["autoHeight"] = True
-
-    # ✅ 렌더 직후: 값 기준 autoSize → 화면폭에 맞게 sizeColumnsToFit
-    grid_options["onFirstDataRendered"] = JsCode("""
-    function(params) {
-        const allCols = params.columnApi.getAllColumns().map(c => c.getColId());
-
-        // 1) 내용(값) 기준으로 먼저 늘림
-        params.columnApi.autoSizeColumns(allCols, false);
-
-        // 2) 화면 폭에 맞게 반응형으로 맞춤
-        params.api.sizeColumnsToFit();
-    }
-    """)
-
-    # ✅ 화면 크기 변경 시 다시 맞춤 (진짜 “반응형”)
-    grid_options["onGridSizeChanged"] = JsCode("""
-    function(params) {
-        params.api.sizeColumnsToFit();
-    }
-    """)
-
-    # custom_css: iframe 내부에 직접 주입 (확실한 가운데 정렬)
-    custom_css = {
-        ".ag-header-cell-label": {"justify-content": "center"},
-        ".ag-header-cell-text": {"text-align": "center", "width": "100%"},
-        ".ag-cell": {
-            "display": "flex",
-            "align-items": "center",
-            "justify-content": "center",
-        },
-        ".ag-cell-value": {"white-space": "normal", "line-height": "1.2"},
-    }
+    # ✅ 렌더 직후 autoSize → sizeColumnsToFit, 화면 크기 변경 시 다시 맞춤
+    grid_options.update(_grid_js_callbacks())
 
     grid_response = AgGrid(
         df,
@@ -1034,98 +1347,163 @@ def render_cases_aggrid(
         height=calculated_height,
         key=grid_key,
         theme="streamlit",
-        custom_css=custom_css,
+        custom_css=CASES_GRID_CUSTOM_CSS,
     )
 
     return grid_response
 
 
+def add_timeoff_range(db: Session, user_id: int, start: date, end: date, timeoff_type: TimeOffType) -> tuple[int, list]:
+    """
+    기간 내 날짜별 휴무 추가 (commit은 호출자가 수행).
+    기존 휴무 날짜는 한 번의 SELECT로 조회하고, pd.date_range 후보 중 신규 날짜만 add_all.
+
+    Returns:
+        (추가 건수, 건너뛴 날짜 문자열 목록)
+    """
+    existing_dates = {
+        row.date
+        for row in db.query(UserTimeOff.date).filter(
+            UserTimeOff.user_id == user_id,
+            UserTimeOff.date.between(start, end),
+        ).all()
+    }
+
+    candidate_dates = pd.date_range(start, end, freq="D").date
+    skipped_dates = [str(d) for d in candidate_dates if d in existing_dates]
+    new_rows = [
+        UserTimeOff(user_id=user_id, date=d, type=timeoff_type)
+        for d in candidate_dates
+        if d not in existing_dates
+    ]
+
+    db.add_all(new_rows)
+    return len(new_rows), skipped_dates
+
+
+def delete_timeoffs(db: Session, timeoff_ids: list[int]) -> int:
+    """휴무 일괄 삭제 (DELETE ... WHERE id IN 한 번, commit은 호출자가 수행). 삭제 건수 반환."""
+    if not timeoff_ids:
+        return 0
+    return db.query(UserTimeOff).filter(
+        UserTimeOff.id.in_(timeoff_ids)
+    ).delete(synchronize_session=False)
+
+
 def group_consecutive_timeoffs(timeoffs: list) -> list[dict]:
     """
     Group consecutive time-offs by user and type.
     Returns list of grouped periods.
+
+    ORM 객체 대신 (id, user_id, username, type, date) 튜플을 캐시 키로 넘겨
+    위젯 조작만으로 인한 rerun에서는 그룹핑을 다시 계산하지 않음.
     """
     if not timeoffs:
         return []
 
+    rows = tuple(
+        (t.id, t.user_id, t.user.username, t.type.value, t.date)
+        for t in timeoffs
+    )
+    return _group_timeoff_rows(rows)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _group_timeoff_rows(rows: tuple) -> list[dict]:
+    """(id, user_id, username, type, date) 튜플 기준 연속 휴무 그룹핑 (캐시)."""
+    ids, user_ids, usernames, types, dates = zip(*rows)
+    df = pd.DataFrame({
+        "user_id": user_ids,
+        "username": usernames,
+        "type": types,
+        "date": pd.to_datetime(dates),
+        "id": ids,
+    })
+
     # Sort by user, type, date
-    sorted_timeoffs = sorted(timeoffs, key=lambda t: (t.user.username, t.type.value, t.date))
-
-    groups = []
-    current_group = None
-
-    for t in sorted_timeoffs:
-        if current_group is None:
-            # Start new group
-            current_group = {
-                "user_id": t.user_id,
-                "username": t.user.username,
-                "type": t.type,
-                "start_date": t.date,
-                "end_date": t.date,
-                "days": 1,
-                "ids": [t.id],
-            }
-        elif (
-            current_group["user_id"] == t.user_id
-            and current_group["type"] == t.type
-            and (t.date - current_group["end_date"]).days == 1
-        ):
-            # Extend current group (consecutive date)
-            current_group["end_date"] = t.date
-            current_group["days"] += 1
-            current_group["ids"].append(t.id)
-        else:
-            # Save current group and start new one
-            groups.append(current_group)
-            current_group = {
-                "user_id": t.user_id,
-                "username": t.user.username,
-                "type": t.type,
-                "start_date": t.date,
-                "end_date": t.date,
-                "days": 1,
-                "ids": [t.id],
-            }
+    df = df.sort_values(["username", "type", "date"], kind="stable", ignore_index=True)
 
-    # Don't forget the last group
-    if current_group:
-        groups.append(current_group)
+    # 사용자/유형이 바뀌거나 날짜가 연속되지 않으면 새 그룹 시작
+    new_group = (
+        (df["date"].diff().dt.days != 1)
+        | (df["user_id"] != df["user_id"].shift())
+        | (df["type"] != df["type"].shift())
+    )
+    grouped = df.groupby(new_group.cumsum(), sort=False).agg(
+        user_id=("user_id", "first"),
+        username=("username", "first"),
+        type=("type", "first"),
+        start_date=("date", "min"),
+        end_date=("date", "max"),
+        days=("id", "size"),
+        ids=("id", list),
+    )
 
     # Calculate hours and format period
-    for g in groups:
-        if g["type"] == TimeOffType.VACATION:
-            g["hours"] = g["days"] * 8
-            g["days_display"] = f"{g['days']}일"
-        else:  # HALF_DAY
-            g["hours"] = g["days"] * 4
-            g["days_display"] = f"{g['days'] * 0.5}일"
-
-        # Format period string
-        if g["start_date"] == g["end_date"]:
-            g["period"] = g["start_date"].strftime("%Y-%m-%d")
-        else:
-            g["period"] = f"{g['start_date'].strftime('%Y-%m-%d')} ~ {g['end_date'].strftime('%m-%d')}"
+    is_vacation = grouped["type"] == TimeOffType.VACATION.value
+    grouped["hours"] = grouped["days"] * is_vacation.map({True: 8, False: 4})
+    grouped["days_display"] = (
+        grouped["days"].astype(str).where(is_vacation, (grouped["days"] * 0.5).astype(str)) + "일"
+    )
+    start_str = grouped["start_date"].dt.strftime("%Y-%m-%d")
+    grouped["period"] = start_str.where(
+        grouped["start_date"] == grouped["end_date"],
+        start_str + " ~ " + grouped["end_date"].dt.strftime("%m-%d"),
+    )
 
     # Sort by start_date descending
-    groups.sort(key=lambda x: x["start_date"], reverse=True)
+    grouped = grouped.sort_values("start_date", ascending=False, kind="stable")
+
+    grouped["start_date"] = grouped["start_date"].dt.date
+    grouped["end_date"] = grouped["end_date"].dt.date
 
+    groups = grouped.to_dict("records")
+    for g in groups:
+        g["type"] = TimeOffType(g["type"])
     return groups
 
 
 def get_db() -> Session:
-    """Get database session."""
+    """
+    Get database session.
+
+    엔진/커넥션 풀은 database 모듈 import 시 프로세스당 1회 생성되어
+    rerun 간 재사용됨 (st.cache_resource와 같은 수명).
+    Session은 스레드 안전하지 않으므로 캐시하지 않고 실행마다 열고 닫음.
+    """
     return SessionLocal()
 
 
 def get_config_value(db: Session, key: str, default=None):
-    """Get config value from AppConfig."""
-    config = db.query(AppConfig).filter(AppConfig.key == key).first()
+    """Get config value from AppConfig (60초 캐시)."""
+    return _cached_config_value(key, default, db)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_config_value(key: str, default, _db: Session):
+    """
+    AppConfig 조회 결과 캐시.
+    설정값은 seed 스크립트에서만 변경되므로 rerun마다 조회하지 않음.
+    """
+    config = _db.query(AppConfig).filter(AppConfig.key == key).first()
     if config:
         return json.loads(config.value_json)
     return default
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_active_workers(_db: Session) -> list[tuple[int, str]]:
+    """
+    활성 작업자 (id, username) 목록 (60초 캐시).
+    사용자는 seed 스크립트에서만 변경되므로 어드민 화면마다 rerun 시 재조회하지 않음.
+    """
+    rows = _db.query(User.id, User.username).filter(
+        User.role == UserRole.WORKER,
+        User.is_active == True
+    ).order_by(User.id).all()
+    return [(row.id, row.username) for row in rows]
+
+
 def authenticate(api_key: str) -> Optional[User]:
     """Authenticate user by API key."""
     db = get_db()
@@ -1144,15 +1522,65 @@ def generate_idempotency_key(case_id: int, event_type: str) -> str:
     return f"{case_id}-{event_type}-{uuid.uuid4().hex[:8]}"
 
 
-def get_last_worklog_action(db: Session, case_id: int) -> Optional[ActionType]:
-    """Get the last worklog action for a case."""
-    last_log = (
-        db.query(WorkLog)
-        .filter(WorkLog.case_id == case_id)
-        .order_by(WorkLog.timestamp.desc())
-        .first()
+def get_confirmation_idempotency_key(case_id: int, event_type: str) -> str:
+    """
+    확인 폼 단위 멱등성 키.
+    폼을 여는 시점에 한 번 생성해 session_state에 두므로 rerun/중복 클릭에도 같은 키를 사용.
+    확정/취소 시 clear_confirmation_idempotency_key로 제거 (다음 확인은 새 키).
+    """
+    state_key = f"idempotency_{event_type}_{case_id}"
+    if state_key not in st.session_state:
+        st.session_state[state_key] = generate_idempotency_key(case_id, event_type)
+    return st.session_state[state_key]
+
+
+def clear_confirmation_idempotency_key(case_id: int, event_type: str) -> None:
+    """확인 폼 멱등성 키 제거."""
+    st.session_state.pop(f"idempotency_{event_type}_{case_id}", None)
+
+
+def get_worklog_rows_by_case(db: Session, case_ids: list) -> dict:
+    """
+    케이스별 WorkLog 행 목록 (timestamp 오름차순, 한 번의 쿼리).
+    ORM 객체 대신 (case_id, action_type, reason_code, timestamp) 컬럼만 조회.
+    작업시간 계산은 metrics.compute_work_seconds에서 수행.
+    """
+    rows_by_case = defaultdict(list)
+    if not case_ids:
+        return rows_by_case
+    rows = (
+        db.query(WorkLog.case_id, WorkLog.action_type, WorkLog.reason_code, WorkLog.timestamp)
+        .filter(WorkLog.case_id.in_(case_ids))
+        .order_by(WorkLog.case_id, WorkLog.timestamp)
+        .all()
     )
-    return last_log.action_type if last_log else None
+    for row in rows:
+        rows_by_case[row.case_id].append(row)
+    return rows_by_case
+
+
+def get_last_worklog_rows_by_case(db: Session, case_ids: list) -> dict:
+    """
+    케이스별 마지막 WorkLog 행 (case_id → (action_type, reason_code), 한 번의 쿼리).
+    상태 표시만 필요한 목록에서 전체 로그를 가져오지 않도록 윈도 함수로 마지막 행만 조회.
+    """
+    from sqlalchemy import func
+
+    if not case_ids:
+        return {}
+    last_logs = db.query(
+        WorkLog.case_id,
+        WorkLog.action_type,
+        WorkLog.reason_code,
+        func.row_number().over(
+            partition_by=WorkLog.case_id,
+            order_by=(WorkLog.timestamp.desc(), WorkLog.id.desc()),
+        ).label("rn"),
+    ).filter(WorkLog.case_id.in_(case_ids)).subquery()
+    rows = db.query(
+        last_logs.c.case_id, last_logs.c.action_type, last_logs.c.reason_code,
+    ).filter(last_logs.c.rn == 1).all()
+    return {row.case_id: row for row in rows}
 
 
 def get_user_wip_count(db: Session, user_id: int, exclude_paused: bool = True) -> int:
@@ -1163,27 +1591,33 @@ def get_user_wip_count(db: Session, user_id: int, exclude_paused: bool = True) -
         user_id: User ID
         exclude_paused: If True, exclude cases where last action is PAUSE
     """
-    cases = db.query(Case).filter(
+    from sqlalchemy import and_, func
+
+    query = db.query(func.count(Case.id)).filter(
         Case.assigned_user_id == user_id,
         Case.status == CaseStatus.IN_PROGRESS,
-    ).all()
+    )
 
     if not exclude_paused:
-        return len(cases)
+        return query.scalar() or 0
+
+    # 케이스별 마지막 WorkLog를 윈도 함수로 한 번에 조회 (케이스당 쿼리 방지)
+    last_logs = db.query(
+        WorkLog.case_id,
+        WorkLog.action_type,
+        func.row_number().over(
+            partition_by=WorkLog.case_id,
+            order_by=(WorkLog.timestamp.desc(), WorkLog.id.desc()),
+        ).label("rn"),
+    ).subquery()
 
     # Count only actively working cases (last action is START, RESUME, or REWORK_START)
-    active_count = 0
-    for case in cases:
-        last_log = (
-            db.query(WorkLog)
-            .filter(WorkLog.case_id == case.id)
-            .order_by(WorkLog.timestamp.desc())
-            .first()
-        )
-        if last_log and last_log.action_type in (ActionType.START, ActionType.RESUME, ActionType.REWORK_START):
-            active_count += 1
-
-    return active_count
+    active_count = (
+        query.join(last_logs, and_(last_logs.c.case_id == Case.id, last_logs.c.rn == 1))
+        .filter(last_logs.c.action_type.in_([ActionType.START, ActionType.RESUME, ActionType.REWORK_START]))
+        .scalar()
+    )
+    return active_count or 0
 
 
 # ============== Session State ==============
@@ -1242,15 +1676,82 @@ def show_worker_dashboard():
     # Tabs for worker
     tab1, tab2 = st.tabs(["내 작업", "휴무 관리"])
 
-    db = get_db()
-    try:
-        with tab1:
-            show_worker_tasks(db, user)
+    db = get_db()
+    try:
+        with tab1:
+            show_worker_tasks(db, user)
+
+        with tab2:
+            show_worker_timeoff(db, user)
+    finally:
+        db.close()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_worker_cases_df(
+    user_id: int,
+    data_version: tuple,
+    auto_timeout: int,
+    workday_hours: int,
+    reference_time: datetime,
+    _db: Session,
+) -> tuple[pd.DataFrame, list]:
+    """
+    작업자 케이스 테이블 DataFrame과 selectbox 옵션 구성 (캐시).
+    data_version(케이스 수, 최신 Event/WorkLog id)과 기준 시각(분)이 같으면
+    필터 클릭 등 rerun에서 ORM 조회/작업시간 계산을 건너뜀.
+    """
+    # 본인 케이스 전체 조회 (DB 필터 없음 - AG Grid에서 필터링)
+    cases = _db.query(Case).options(
+        selectinload(Case.project),
+        selectinload(Case.part),
+    ).filter(
+        Case.assigned_user_id == user_id
+    ).order_by(Case.created_at.desc()).all()
+
+    # 전체 케이스의 WorkLog를 한 번에 조회 후 케이스별 그룹핑 (N+1 방지)
+    logs_by_case = get_worklog_rows_by_case(_db, [c.id for c in cases])
+
+    # DataFrame 구성 (AG Grid용, 컬럼 단위로 누적해 행별 dtype 추론 방지)
+    columns = {
+        UI_LABELS[k]: []
+        for k in (
+            "id", "case_uid", "display_name", "project", "part", "hospital", "status",
+            "difficulty", "revision", "work_days_time", "created_at",
+        )
+    }
+    for c in cases:
+        worklogs = logs_by_case[c.id]
+        work_seconds = compute_work_seconds(worklogs, auto_timeout, reference_time)
+
+        # Determine status with pause info
+        status_display = c.status.value
+        last_action = worklogs[-1].action_type if worklogs else None
+        is_paused = last_action == ActionType.PAUSE
+        if c.status == CaseStatus.IN_PROGRESS and is_paused:
+            status_display = "IN_PROGRESS (PAUSED)"
+
+        # 작업일수/시간 통합 포맷
+        man_days = compute_man_days(work_seconds, workday_hours)
+        work_time_str = format_duration(work_seconds)
+        work_days_time = f"{man_days:.2f}일 ({work_time_str})" if work_seconds > 0 else "-"
+
+        columns[UI_LABELS["id"]].append(c.id)
+        columns[UI_LABELS["case_uid"]].append(c.case_uid)
+        columns[UI_LABELS["display_name"]].append(c.display_name)
+        columns[UI_LABELS["project"]].append(c.project.name)
+        columns[UI_LABELS["part"]].append(c.part.name)
+        columns[UI_LABELS["hospital"]].append(c.hospital or UI_LABELS["unassigned"])
+        columns[UI_LABELS["status"]].append(status_display)
+        columns[UI_LABELS["difficulty"]].append(c.difficulty.value)
+        columns[UI_LABELS["revision"]].append(c.revision)
+        columns[UI_LABELS["work_days_time"]].append(work_days_time)
+        columns[UI_LABELS["created_at"]].append(c.created_at.strftime("%Y-%m-%d"))
 
-        with tab2:
-            show_worker_timeoff(db, user)
-    finally:
-        db.close()
+    df = prepare_case_filter_columns(pd.DataFrame(columns))
+    case_options = [(c.id, f"{c.display_name} ({c.case_uid}) - {c.status.value}") for c in cases]
+
+    return df, case_options
 
 
 def show_worker_tasks(db: Session, user: dict):
@@ -1271,65 +1772,72 @@ def show_worker_tasks(db: Session, user: dict):
     else:
         st.info(f"진행 중: {current_wip}/{wip_limit} (진행 중인 케이스)")
 
-    # 본인 케이스 전체 조회 (DB 필터 없음 - AG Grid에서 필터링)
-    cases = db.query(Case).filter(
+    # 데이터 버전: 케이스 변경은 Event, 작업시간 변경은 WorkLog로만 발생
+    from sqlalchemy import func
+
+    total_count = db.query(func.count(Case.id)).filter(
         Case.assigned_user_id == user["id"]
-    ).order_by(Case.created_at.desc()).all()
-    total_count = len(cases)
+    ).scalar()
+    data_version = (
+        total_count,
+        db.query(func.max(Event.id)).scalar(),
+        db.query(func.max(WorkLog.id)).scalar(),
+    )
 
     # 건수 표시
     st.caption(f"총 {total_count}건 표시 중")
 
-    if not cases:
+    if not total_count:
         st.info("배정된 작업이 없습니다.")
         return
 
-    # DataFrame 구성 (AG Grid용)
-    table_data = []
-    for c in cases:
-        worklogs = db.query(WorkLog).filter(WorkLog.case_id == c.id).order_by(WorkLog.timestamp).all()
-        work_seconds = compute_work_seconds(worklogs, auto_timeout)
-
-        # Determine status with pause info
-        status_display = c.status.value
-        last_action = get_last_worklog_action(db, c.id)
-        is_paused = last_action == ActionType.PAUSE
-        if c.status == CaseStatus.IN_PROGRESS and is_paused:
-            status_display = "IN_PROGRESS (PAUSED)"
-
-        # 작업일수/시간 통합 포맷
-        man_days = compute_man_days(work_seconds, workday_hours)
-        work_time_str = format_duration(work_seconds)
-        work_days_time = f"{man_days:.2f}일 ({work_time_str})" if work_seconds > 0 else "-"
+    # 진행 중 세션 시간은 분 단위로 표시되므로 기준 시각도 분 단위로 맞춤
+    reference_time = datetime.now(TIMEZONE).replace(second=0, microsecond=0)
+    df, case_options = _build_worker_cases_df(
+        user["id"], data_version, auto_timeout, workday_hours, reference_time, db,
+    )
 
-        row = {
-            UI_LABELS["id"]: c.id,
-            UI_LABELS["case_uid"]: c.case_uid,
-            UI_LABELS["display_name"]: c.display_name,
-            UI_LABELS["project"]: c.project.name,
-            UI_LABELS["part"]: c.part.name,
-            UI_LABELS["hospital"]: c.hospital or UI_LABELS["unassigned"],
-            UI_LABELS["status"]: status_display,
-            UI_LABELS["difficulty"]: c.difficulty.value,
-            UI_LABELS["revision"]: c.revision,
-            UI_LABELS["work_days_time"]: work_days_time,
-            UI_LABELS["created_at"]: c.created_at.strftime("%Y-%m-%d"),
-        }
-        table_data.append(row)
+    # 필터 + 테이블 + 상세는 fragment로 렌더링 (필터 클릭 시 이 영역만 rerun)
+    _render_worker_cases_fragment(
+        df, case_options, user, wip_limit, current_wip, auto_timeout, workday_hours,
+    )
 
-    df = pd.DataFrame(table_data)
 
+@_fragment
+def _render_worker_cases_fragment(
+    df: pd.DataFrame,
+    case_options: list,
+    user: dict,
+    wip_limit: int,
+    current_wip: int,
+    auto_timeout: int,
+    workday_hours: int,
+):
+    """작업자 케이스 필터/테이블/상세 영역 (fragment 단위 rerun)."""
     # 필터 UI + DataFrame 필터링
     filtered_df = render_case_filters(df, "worker", show_assignee=False)
+    if filtered_df.empty:
+        # 그리드/케이스 선택/상세 렌더링 생략
+        st.info("조건에 맞는 케이스가 없습니다.")
+        return
 
     # 공통 AG Grid 렌더링 (담당자 컬럼 제외)
-    grid_response = render_styled_dataframe(
-        filtered_df,
-        key="worker_cases_grid",
-        height=350,
-        hide_columns=[UI_LABELS["assignee"]],
-        user_role="worker",
-    )
+    # 대용량이면 st.dataframe 행 선택으로 대체 (AG Grid 직렬화/JS 비용 회피)
+    if len(filtered_df) > TABLE_NATIVE_SELECT_THRESHOLD:
+        grid_response = render_cases_st_dataframe(
+            filtered_df,
+            key="worker_cases_table",
+            height=350,
+            hide_columns=[UI_LABELS["assignee"], CASE_UID_SEARCH_COLUMN],
+        )
+    else:
+        grid_response = render_styled_dataframe(
+            filtered_df,
+            key="worker_cases_grid",
+            height=350,
+            hide_columns=[UI_LABELS["assignee"], CASE_UID_SEARCH_COLUMN],
+            user_role="worker",
+        )
 
     # 선택된 케이스 ID 추출 (AG Grid)
     selected_case_id = None
@@ -1341,7 +1849,6 @@ def show_worker_tasks(db: Session, user: dict):
     # 선택되지 않은 경우 selectbox로 선택
     if selected_case_id is None:
         st.markdown("---")
-        case_options = [(c.id, f"{c.display_name} ({c.case_uid}) - {c.status.value}") for c in cases]
         selected_case_id = st.selectbox(
             "케이스 선택",
             options=[opt[0] for opt in case_options],
@@ -1349,10 +1856,20 @@ def show_worker_tasks(db: Session, user: dict):
         )
 
     # 선택된 케이스 상세 및 작업 버튼
+    # fragment rerun 시 바깥 세션은 이미 닫혀 있으므로 세션을 따로 염
     if selected_case_id:
-        case = db.query(Case).filter(Case.id == selected_case_id).first()
-        if case:
-            show_worker_case_detail(db, case, user, wip_limit, current_wip, auto_timeout, workday_hours)
+        db = get_db()
+        try:
+            case = db.query(Case).options(
+                joinedload(Case.project),
+                joinedload(Case.part),
+                joinedload(Case.preqc_summary),
+                joinedload(Case.autoqc_summary),
+            ).filter(Case.id == selected_case_id).first()
+            if case:
+                show_worker_case_detail(db, case, user, wip_limit, current_wip, auto_timeout, workday_hours)
+        finally:
+            db.close()
 
 
 def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int, current_wip: int, auto_timeout: int, workday_hours: int):
@@ -1366,7 +1883,8 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
         WorkLog.case_id == case.id
     ).order_by(WorkLog.timestamp).all()
 
-    last_action = get_last_worklog_action(db, case.id)
+    # 마지막 작업 기록은 timestamp 순으로 이미 조회한 worklogs에서 사용 (추가 쿼리 없음)
+    last_action = worklogs[-1].action_type if worklogs else None
     is_working = last_action in (ActionType.START, ActionType.RESUME, ActionType.REWORK_START)
     is_paused = last_action == ActionType.PAUSE
 
@@ -1435,8 +1953,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
 
                 # 사유 수정 UI
                 edit_key = f"edit_pause_{case.id}"
-                if edit_key not in st.session_state:
-                    st.session_state[edit_key] = False
+                st.session_state.setdefault(edit_key, False)
 
                 if not st.session_state[edit_key]:
                     if st.button("사유 수정", key=f"edit_pause_btn_{case.id}"):
@@ -1466,6 +1983,9 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                             else:
                                 last_pause.reason_code = new_reason
                             db.commit()
+                            # 기존 WorkLog를 제자리 수정하므로 id 기반 data_version이 바뀌지 않음
+                            # → 전체 케이스 표(중단 사유 컬럼) 캐시를 직접 비움
+                            _build_all_cases_df.clear()
                             st.session_state[edit_key] = False
                             st.success("사유가 수정되었습니다")
                             st.rerun()
@@ -1482,7 +2002,9 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
 
     # Show review notes if REWORK
     if case.status == CaseStatus.REWORK:
-        notes = db.query(ReviewNote).filter(
+        notes = db.query(ReviewNote).options(
+            selectinload(ReviewNote.reviewer)
+        ).filter(
             ReviewNote.case_id == case.id
         ).order_by(ReviewNote.created_at.desc()).limit(3).all()
         if notes:
@@ -1491,8 +2013,8 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                 st.write(f"- {note.note_text} ({note.reviewer.username})")
 
     # ========== Pre-QC / Auto-QC 정보 표시 (Worker용) ==========
-    preqc = db.query(PreQcSummary).filter(PreQcSummary.case_id == case.id).first()
-    autoqc = db.query(AutoQcSummary).filter(AutoQcSummary.case_id == case.id).first()
+    preqc = case.preqc_summary
+    autoqc = case.autoqc_summary
 
     st.markdown("---")
     st.markdown("### QC 정보")
@@ -1578,7 +2100,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                     current_issue_count = 0
                     if autoqc.issue_count_json:
                         try:
-                            counts = json.loads(autoqc.issue_count_json)
+                            counts = _json_loads(autoqc.issue_count_json)
                             current_issue_count = counts.get("warn_level", 0) + counts.get("incomplete_level", 0)
                         except json.JSONDecodeError:
                             pass
@@ -1598,7 +2120,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                 st.write("📋 누락 세그먼트:")
                 if autoqc.missing_segments_json:
                     try:
-                        missing = json.loads(autoqc.missing_segments_json)
+                        missing = _json_loads(autoqc.missing_segments_json)
                         if missing:
                             for seg in missing:
                                 st.caption(f"  • {seg}")
@@ -1614,7 +2136,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                 mismatches = []
                 if autoqc.name_mismatches_json:
                     try:
-                        mismatches = json.loads(autoqc.name_mismatches_json)
+                        mismatches = _json_loads(autoqc.name_mismatches_json)
                         mismatch_count = len(mismatches) if mismatches else 0
                     except json.JSONDecodeError:
                         pass
@@ -1634,7 +2156,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                 st.write("📋 이슈 목록:")
                 if autoqc.issues_json:
                     try:
-                        issues = json.loads(autoqc.issues_json)
+                        issues = _json_loads(autoqc.issues_json)
                         if issues:
                             severity_icons = {"WARN": "⚠️", "INCOMPLETE": "❌", "INFO": "ℹ️"}
                             for issue in issues[:10]:
@@ -1656,7 +2178,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                 extra_segments_display = "없음"
                 if autoqc.extra_segments_json:
                     try:
-                        extra = json.loads(autoqc.extra_segments_json)
+                        extra = _json_loads(autoqc.extra_segments_json)
                         if extra:
                             extra_segments_display = ", ".join(extra)
                     except json.JSONDecodeError:
@@ -1670,7 +2192,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                 inc_cnt = 0
                 if autoqc.issue_count_json:
                     try:
-                        counts = json.loads(autoqc.issue_count_json)
+                        counts = _json_loads(autoqc.issue_count_json)
                         warn_cnt = counts.get("warn_level", 0)
                         inc_cnt = counts.get("incomplete_level", 0)
                     except json.JSONDecodeError:
@@ -1724,10 +2246,8 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                 edit_mode_key = f"edit_feedback_{fb.id}"
                 delete_confirm_key = f"delete_feedback_{fb.id}"
 
-                if edit_mode_key not in st.session_state:
-                    st.session_state[edit_mode_key] = False
-                if delete_confirm_key not in st.session_state:
-                    st.session_state[delete_confirm_key] = False
+                st.session_state.setdefault(edit_mode_key, False)
+                st.session_state.setdefault(delete_confirm_key, False)
 
                 with st.container():
                     # 수정 모드
@@ -1850,10 +2370,8 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                 st.session_state[additional_fixes_key] = []
 
         # 입력 필드 초기화 (위젯 생성 전에 해야 함)
-        if add_fix_segment_key not in st.session_state:
-            st.session_state[add_fix_segment_key] = ""
-        if add_fix_desc_key not in st.session_state:
-            st.session_state[add_fix_desc_key] = ""
+        st.session_state.setdefault(add_fix_segment_key, "")
+        st.session_state.setdefault(add_fix_desc_key, "")
 
         # 추가 완료 플래그 처리 (위젯 생성 전에 초기화)
         clear_add_fix_key = f"clear_add_fix_{case.id}"
@@ -1869,7 +2387,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
         issues_list = []
         if autoqc.issues_json:
             try:
-                issues_list = json.loads(autoqc.issues_json)
+                issues_list = _json_loads(autoqc.issues_json)
             except:
                 pass
 
@@ -1940,8 +2458,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
 
             # 새 항목 입력
             add_fix_type_key = f"add_fix_type_{case.id}"
-            if add_fix_type_key not in st.session_state:
-                st.session_state[add_fix_type_key] = "missed"
+            st.session_state.setdefault(add_fix_type_key, "missed")
 
             add_col1, add_col2, add_col3, add_col4 = st.columns([1.5, 2, 2.5, 1])
             with add_col1:
@@ -2007,8 +2524,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
             st.warning(f"시작 불가: WIP 한도 도달 ({current_wip}/{wip_limit})")
         else:
             confirm_key = f"confirm_start_{case.id}"
-            if confirm_key not in st.session_state:
-                st.session_state[confirm_key] = False
+            st.session_state.setdefault(confirm_key, False)
 
             if not st.session_state[confirm_key]:
                 if st.button("작업 시작", key=f"start_{case.id}", type="primary"):
@@ -2063,8 +2579,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
             with col_a:
                 # PAUSE with reason
                 pause_key = f"pause_mode_{case.id}"
-                if pause_key not in st.session_state:
-                    st.session_state[pause_key] = False
+                st.session_state.setdefault(pause_key, False)
 
                 if not st.session_state[pause_key]:
                     if st.button("일시중지", key=f"pause_{case.id}"):
@@ -2107,8 +2622,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
             with col_b:
                 # SUBMIT
                 submit_key = f"confirm_submit_{case.id}"
-                if submit_key not in st.session_state:
-                    st.session_state[submit_key] = False
+                st.session_state.setdefault(submit_key, False)
 
                 if not st.session_state[submit_key]:
                     if st.button("제출", key=f"submit_{case.id}", type="primary"):
@@ -2116,6 +2630,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                         st.rerun()
                 else:
                     st.markdown("**검수를 위해 제출**")
+                    submit_idempotency_key = get_confirmation_idempotency_key(case.id, "SUBMITTED")
 
                     # Phase 4: 확장된 QC 피드백 표시
                     qc_fixes_key = f"qc_fixes_{case.id}"
@@ -2147,7 +2662,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                     if submit_clicked:
                         now = datetime.now(TIMEZONE)
 
-                        # Phase 4: 확장된 QC 피드백 저장
+                        # Phase 4: 확장된 QC 피드백 저장 (제출과 같은 commit에 포함)
                         if autoqc and has_feedback:
                             save_or_update_worker_feedback(
                                 db=db,
@@ -2156,6 +2671,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                                 qc_fixes=qc_fixes if qc_fixes else None,
                                 additional_fixes=additional_fixes if additional_fixes else None,
                                 memo=memo.strip() if memo and memo.strip() else None,
+                                commit=False,
                             )
 
                         # Create WorkLog SUBMIT
@@ -2165,7 +2681,6 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                             action_type=ActionType.SUBMIT,
                             timestamp=now,
                         )
-                        db.add(worklog)
 
                         # Create Event SUBMITTED
                         fixed_count = sum(1 for f in qc_fixes if f.get("fixed", False)) if qc_fixes else 0
@@ -2182,19 +2697,24 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                             case_id=case.id,
                             user_id=user["id"],
                             event_type=EventType.SUBMITTED,
-                            idempotency_key=generate_idempotency_key(case.id, "SUBMITTED"),
+                            idempotency_key=submit_idempotency_key,
                             event_code=submit_event_code,
                             payload_json=json.dumps(submit_payload, ensure_ascii=False),
                             created_at=now,
                         )
-                        db.add(event)
+                        db.add_all([worklog, event])
 
                         # Update case
                         case.status = CaseStatus.SUBMITTED
                         case.worker_completed_at = now
 
+                        # 최종 작업시간: 이미 조회한 worklogs + 새 SUBMIT 로그로 계산
+                        # (commit 후에는 객체가 만료되어 다시 조회되므로 commit 전에 계산)
+                        final_seconds = compute_work_seconds(worklogs + [worklog], auto_timeout)
+
                         db.commit()
                         st.session_state[submit_key] = False
+                        clear_confirmation_idempotency_key(case.id, "SUBMITTED")
 
                         # Clear QC feedback session state (Phase 4 keys)
                         for key_suffix in ["qc_fixes_", "additional_fixes_", "memo_", "add_fix_segment_", "add_fix_desc_", "clear_add_fix_"]:
@@ -2203,10 +2723,6 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                                 del st.session_state[key_to_clear]
 
                         # Show final time
-                        final_worklogs = db.query(WorkLog).filter(
-                            WorkLog.case_id == case.id
-                        ).order_by(WorkLog.timestamp).all()
-                        final_seconds = compute_work_seconds(final_worklogs, auto_timeout)
                         final_duration = format_duration(final_seconds)
                         final_md = compute_man_days(final_seconds, workday_hours)
 
@@ -2214,6 +2730,7 @@ def show_worker_case_detail(db: Session, case: Case, user: dict, wip_limit: int,
                         st.rerun()
                     if cancel_clicked:
                         st.session_state[submit_key] = False
+                        clear_confirmation_idempotency_key(case.id, "SUBMITTED")
                         st.rerun()
 
         elif is_paused:
@@ -2259,11 +2776,15 @@ def show_admin_dashboard():
 
     db = get_db()
     try:
+        # 작업시간 설정은 한 번만 읽어 탭에 전달
+        auto_timeout = get_config_value(db, "auto_timeout_minutes", 120)
+        workday_hours = get_config_value(db, "workday_hours", 8)
+
         with tab1:
-            show_review_queue(db, user)
+            show_review_queue(db, user, auto_timeout, workday_hours)
 
         with tab2:
-            show_all_cases(db)
+            show_all_cases(db, auto_timeout, workday_hours)
 
         with tab3:
             show_register_case(db, user)
@@ -2289,6 +2810,33 @@ def show_admin_dashboard():
         db.close()
 
 
+@st.cache_data(ttl=60, show_spinner=False, max_entries=8)
+def _build_recent_cases_df(data_version: tuple, _db: Session) -> pd.DataFrame:
+    """
+    최근 등록된 케이스 10건 DataFrame (캐시).
+    data_version(케이스 수, 최대 id)이 같으면 폼 입력 등 rerun에서 조회를 건너뜀.
+    등록 외 필드 수정(Pre-QC 업로드 등)은 ttl 경과 후 반영.
+    """
+    recent_cases = _db.query(Case).options(
+        selectinload(Case.project),
+        selectinload(Case.part),
+    ).order_by(Case.created_at.desc()).limit(10).all()
+
+    # 컬럼 단위 구성 (행별 dict 생성 없이)
+    return pd.DataFrame({
+        UI_LABELS["id"]: [c.id for c in recent_cases],
+        UI_LABELS["case_uid"]: [c.case_uid for c in recent_cases],
+        UI_LABELS["original_name"]: [c.original_name or c.display_name for c in recent_cases],
+        UI_LABELS["project"]: [c.project.name for c in recent_cases],
+        UI_LABELS["part"]: [c.part.name for c in recent_cases],
+        UI_LABELS["hospital"]: [c.hospital or UI_LABELS["unassigned"] for c in recent_cases],
+        UI_LABELS["slice_thickness"]: [c.slice_thickness_mm or "-" for c in recent_cases],
+        UI_LABELS["difficulty"]: [c.difficulty.value for c in recent_cases],
+        UI_LABELS["nas_path"]: [c.nas_path or "-" for c in recent_cases],
+        UI_LABELS["created_at"]: [c.created_at.strftime("%Y-%m-%d %H:%M") for c in recent_cases],
+    })
+
+
 def show_register_case(db: Session, user: dict):
     """Show case registration form."""
     st.subheader("케이스 등록")
@@ -2372,19 +2920,9 @@ def show_register_case(db: Session, user: dict):
                 st.error(f"케이스 ID '{case_uid}'가 이미 존재합니다.")
                 return
 
-            # Get or create project
-            project = db.query(Project).filter(Project.name == project_name.strip()).first()
-            if not project:
-                project = Project(name=project_name.strip(), is_active=True)
-                db.add(project)
-                db.flush()
-
-            # Get or create part
-            part = db.query(Part).filter(Part.name == part_name.strip()).first()
-            if not part:
-                part = Part(name=part_name.strip(), is_active=True)
-                db.add(part)
-                db.flush()
+            # Get or create project / part (UPSERT)
+            project = get_or_create_project(db, project_name.strip())
+            part = get_or_create_part(db, part_name.strip())
 
             # Create case
             original_name_value = original_name.strip() if original_name else None
@@ -2469,21 +3007,9 @@ def show_register_case(db: Session, user: dict):
                                 continue
 
                             try:
-                                # Project 생성/조회
-                                project_name = str(row["project"]).strip()
-                                project = db.query(Project).filter(Project.name == project_name).first()
-                                if not project:
-                                    project = Project(name=project_name, is_active=True)
-                                    db.add(project)
-                                    db.flush()
-
-                                # Part 생성/조회
-                                part_name = str(row["part"]).strip()
-                                part = db.query(Part).filter(Part.name == part_name).first()
-                                if not part:
-                                    part = Part(name=part_name, is_active=True)
-                                    db.add(part)
-                                    db.flush()
+                                # Project / Part 생성/조회 (UPSERT)
+                                project = get_or_create_project(db, str(row["project"]).strip())
+                                part = get_or_create_part(db, str(row["part"]).strip())
 
                                 # 난이도 파싱
                                 difficulty_val = str(row.get("difficulty", "NORMAL")).strip().upper()
@@ -2555,38 +3081,29 @@ def show_register_case(db: Session, user: dict):
     st.markdown("---")
     st.markdown("### 최근 등록된 케이스")
 
-    recent_cases = db.query(Case).order_by(Case.created_at.desc()).limit(10).all()
-    if recent_cases:
-        data = []
-        for c in recent_cases:
-            data.append({
-                UI_LABELS["id"]: c.id,
-                UI_LABELS["case_uid"]: c.case_uid,
-                UI_LABELS["original_name"]: c.original_name if c.original_name else c.display_name,
-                UI_LABELS["project"]: c.project.name,
-                UI_LABELS["part"]: c.part.name,
-                UI_LABELS["hospital"]: c.hospital or UI_LABELS["unassigned"],
-                UI_LABELS["slice_thickness"]: c.slice_thickness_mm if c.slice_thickness_mm else "-",
-                UI_LABELS["difficulty"]: c.difficulty.value,
-                UI_LABELS["nas_path"]: c.nas_path if c.nas_path else "-",
-                UI_LABELS["created_at"]: c.created_at.strftime("%Y-%m-%d %H:%M"),
-            })
+    # 데이터 버전: 케이스 등록(대시보드/API)이 있을 때만 갱신
+    from sqlalchemy import func
+
+    data_version = tuple(db.query(func.count(Case.id), func.max(Case.id)).one())
+    recent_df = _build_recent_cases_df(data_version, db)
+    if not recent_df.empty:
         # 데이터 개수에 따라 높이 자동 계산 (최대 25행)
-        row_count = len(data)
+        row_count = len(recent_df)
         auto_height = min(max(row_count * 35 + 100, 200), 975)
-        render_styled_dataframe(pd.DataFrame(data), key="recent_cases_grid", enable_selection=False, height=auto_height, user_role="admin")
+        render_styled_dataframe(recent_df, key="recent_cases_grid", enable_selection=False, height=auto_height, user_role="admin")
     else:
         st.info("등록된 케이스가 없습니다.")
 
 
-def show_review_queue(db: Session, user: dict):
+def show_review_queue(db: Session, user: dict, auto_timeout: int, workday_hours: int):
     """Show cases pending review with metrics and AutoQC summary."""
     st.subheader("검수 대기 목록")
 
-    auto_timeout = get_config_value(db, "auto_timeout_minutes", 120)
-    workday_hours = get_config_value(db, "workday_hours", 8)
-
-    cases = db.query(Case).filter(
+    cases = db.query(Case).options(
+        selectinload(Case.project),
+        selectinload(Case.part),
+        selectinload(Case.assigned_user),
+    ).filter(
         Case.status == CaseStatus.SUBMITTED
     ).order_by(Case.worker_completed_at.asc()).all()
 
@@ -2594,617 +3111,874 @@ def show_review_queue(db: Session, user: dict):
         st.info("검수 대기 중인 케이스가 없습니다.")
         return
 
+    case_ids = [c.id for c in cases]
+
+    # 목록 표에는 작업시간/Auto-QC 상태만 필요 → 컬럼만 한 번에 조회 (N+1 방지)
+    worklogs_by_case = get_worklog_rows_by_case(db, case_ids)
+    autoqc_status_by_case = dict(
+        db.query(AutoQcSummary.case_id, AutoQcSummary.status)
+        .filter(AutoQcSummary.case_id.in_(case_ids))
+        .all()
+    )
+
+    qc_col, work_col = [], []
     for case in cases:
-        # Get worklogs and compute metrics
-        worklogs = db.query(WorkLog).filter(
-            WorkLog.case_id == case.id
-        ).order_by(WorkLog.timestamp).all()
+        qc_status = autoqc_status_by_case.get(case.id)
+        qc_icon = {"PASS": "✅", "WARN": "⚠️", "INCOMPLETE": "❌"}.get(qc_status, "⚪")
+        qc_col.append(f"{qc_icon} {qc_status or '-'}")
 
-        work_seconds = compute_work_seconds(worklogs, auto_timeout)
-        work_duration = format_duration(work_seconds)
+        work_seconds = compute_work_seconds(worklogs_by_case[case.id], auto_timeout)
         man_days = compute_man_days(work_seconds, workday_hours)
-        first_start, last_end = get_timeline_dates(worklogs)
-        timeline = compute_timeline(first_start, last_end)
-
-        # Get AutoQC summary
-        autoqc = db.query(AutoQcSummary).filter(AutoQcSummary.case_id == case.id).first()
-
-        # Determine icon based on AutoQC result
-        if autoqc:
-            if autoqc.status == "PASS":
-                qc_icon = "✅"
-            elif autoqc.status == "WARN":
-                qc_icon = "⚠️"
-            elif autoqc.status == "INCOMPLETE":
-                qc_icon = "❌"
-            else:
-                qc_icon = "⚪"
-        else:
-            qc_icon = "⚪"
-
-        original_name_display = case.original_name if case.original_name else case.display_name
-        with st.expander(
-            f"{qc_icon} {original_name_display} ({case.case_uid}) - {UI_LABELS['revision']} {case.revision}",
-            expanded=False
-        ):
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.write(f"**{UI_LABELS['case_uid']}:** {case.case_uid}")
-                st.write(f"**{UI_LABELS['original_name']}:** {original_name_display}")
-                st.write(f"**{UI_LABELS['nas_path']}:** {case.nas_path if case.nas_path else '-'}")
-                st.write(f"**{UI_LABELS['project']}:** {case.project.name}")
-            with col2:
-                st.write(f"**{UI_LABELS['part']}:** {case.part.name}")
-                st.write(f"**{UI_LABELS['hospital']}:** {case.hospital or UI_LABELS['unassigned']}")
-                st.write(f"**{UI_LABELS['slice_thickness']}:** {case.slice_thickness_mm if case.slice_thickness_mm else '-'}")
-            with col3:
-                st.write(f"**{UI_LABELS['difficulty']}:** {case.difficulty.value}")
-                st.write(f"**{UI_LABELS['assignee']}:** {case.assigned_user.username if case.assigned_user else UI_LABELS['unassigned']}")
-                if case.started_at:
-                    st.write(f"**시작일:** {case.started_at.strftime('%Y-%m-%d %H:%M')}")
-                if case.worker_completed_at:
-                    st.write(f"**제출일:** {case.worker_completed_at.strftime('%Y-%m-%d %H:%M')}")
-
-            # ====== QC 이슈 + 작업자 수정 현황 상세 표시 ======
-            st.markdown("---")
+        work_col.append(f"{man_days:.2f}일 ({format_duration(work_seconds)})" if work_seconds > 0 else "-")
+
+    # 케이스당 expander 대신 표 하나 + 선택 케이스 상세만 렌더링 (위젯 수 감소)
+    df = pd.DataFrame({
+        UI_LABELS["id"]: case_ids,
+        "Auto-QC": qc_col,
+        UI_LABELS["original_name"]: [c.original_name or c.display_name for c in cases],
+        UI_LABELS["case_uid"]: [c.case_uid for c in cases],
+        UI_LABELS["project"]: [c.project.name for c in cases],
+        UI_LABELS["part"]: [c.part.name for c in cases],
+        UI_LABELS["assignee"]: [c.assigned_user.username if c.assigned_user else UI_LABELS["unassigned"] for c in cases],
+        UI_LABELS["revision"]: [c.revision for c in cases],
+        UI_LABELS["work_days_time"]: work_col,
+        "제출일": [
+            c.worker_completed_at.strftime("%Y-%m-%d %H:%M") if c.worker_completed_at else "-"
+            for c in cases
+        ],
+    })
+
+    # 일괄 승인 (선택 케이스를 한 번의 트랜잭션으로 승인)
+    with st.expander("선택 승인", expanded=False):
+        case_labels = {
+            c.id: f"{c.original_name or c.display_name} ({c.case_uid})"
+            for c in cases
+        }
+        bulk_ids = st.multiselect(
+            "승인할 케이스",
+            options=case_ids,
+            format_func=lambda x: case_labels[x],
+            key="bulk_accept_ids",
+        )
+        bulk_note = st.text_input("승인 메모 (선택)", key="bulk_accept_note")
+        if st.button("선택 승인", key="bulk_accept_btn", type="primary", disabled=not bulk_ids):
+            revisions = {c.id: c.revision for c in cases}
+            accepted = _bulk_accept_submitted_cases(
+                {case_id: revisions[case_id] for case_id in bulk_ids}, user, bulk_note,
+            )
+            st.success(f"{accepted}건이 승인되었습니다!")
+            st.rerun()
 
-            # 작업자 피드백 로드
-            worker_feedback = db.query(WorkerQcFeedback).filter(
-                WorkerQcFeedback.case_id == case.id
-            ).order_by(WorkerQcFeedback.created_at.desc()).first()
-
-            # QC 수정 현황 파싱
-            qc_fixes_map = {}  # {issue_id or segment: {"fixed": bool, ...}}
-            additional_fixes = []
-            worker_memo = ""
-            if worker_feedback:
-                if worker_feedback.qc_fixes_json:
-                    try:
-                        qc_fixes_list = json.loads(worker_feedback.qc_fixes_json)
-                        for fix in qc_fixes_list:
-                            key = fix.get("issue_id") or fix.get("segment", "")
-                            qc_fixes_map[key] = fix
-                    except json.JSONDecodeError:
-                        pass
-                if worker_feedback.additional_fixes_json:
-                    try:
-                        additional_fixes = json.loads(worker_feedback.additional_fixes_json)
-                    except json.JSONDecodeError:
-                        pass
-                worker_memo = worker_feedback.memo or ""
+    row_count = len(df)
+    auto_height = min(max(row_count * 35 + 100, 200), 975)
+    grid_response = render_styled_dataframe(
+        df,
+        key="review_queue_grid",
+        height=auto_height,
+        user_role="admin",
+    )
 
-            if autoqc:
-                # 상태 아이콘
-                status_icon = {"PASS": "✅", "WARN": "⚠️", "INCOMPLETE": "❌"}.get(autoqc.status, "")
+    # 선택된 케이스 ID 추출 (AG Grid)
+    selected_case_id = None
+    if grid_response:
+        selected_rows = grid_response.get("selected_rows", None)
+        if selected_rows is not None and len(selected_rows) > 0:
+            selected_case_id = int(selected_rows.iloc[0][UI_LABELS["id"]])
 
-                # 이슈 목록 파싱
-                issues = []
-                if autoqc.issues_json:
-                    try:
-                        issues = json.loads(autoqc.issues_json)
-                    except json.JSONDecodeError:
-                        pass
+    # 그리드는 키가 고정이라 승인/재작업 후에도 이전 선택 행을 돌려줄 수 있음
+    # → 현재 검수 대기 목록에 없으면 선택되지 않은 것으로 처리
+    case = next((c for c in cases if c.id == selected_case_id), None)
 
-                # 수정율 계산
-                total_issues = len(issues)
-                fixed_count = sum(1 for i, issue in enumerate(issues) if qc_fixes_map.get(i, {}).get("fixed", False) or qc_fixes_map.get(issue.get("segment", ""), {}).get("fixed", False))
-
-                st.markdown("**📋 Auto-QC 이슈 목록 (작업자 수정 → 검수자 확인):**")
-                with st.container(border=True):
-                    if issues:
-                        severity_icons = {"WARN": "⚠️", "INCOMPLETE": "❌", "INFO": "ℹ️"}
-                        for i, issue in enumerate(issues):
-                            level = issue.get("level", "")
-                            segment = issue.get("segment", "")
-                            msg = issue.get("message", str(issue))
-                            code = issue.get("code", "")
-                            sev_icon = severity_icons.get(level, "•")
-
-                            # 작업자 수정 여부 확인 (index 또는 segment로 매칭)
-                            is_fixed = qc_fixes_map.get(i, {}).get("fixed", False) or qc_fixes_map.get(segment, {}).get("fixed", False)
-                            fix_status = "수정완료" if is_fixed else "미수정"
-
-                            # 검수자 확인 체크박스 (session_state 전용)
-                            reviewer_check_key = f"reviewer_check_{case.id}_{i}"
-                            col_check, col_info = st.columns([1, 5])
-                            with col_check:
-                                st.checkbox(
-                                    "확인",
-                                    key=reviewer_check_key,
-                                    label_visibility="collapsed"
-                                )
-                            with col_info:
-                                fix_icon = "✅" if is_fixed else "❌"
-                                st.markdown(f"{fix_icon} {sev_icon} {level}: {segment} - {msg} [{fix_status}]")
-                    else:
-                        st.caption("이슈 없음")
-
-                    # 범례
-                    st.caption("체크박스 = 검수자 확인용 / ✅ = 작업자 수정완료 / ❌ = 작업자 미수정")
-
-                # 추가 수정 사항 (QC에 없던 것)
-                if additional_fixes:
-                    st.markdown("**📋 추가 수정 사항 (QC에 없던 것):**")
-                    with st.container(border=True):
-                        for idx, fix in enumerate(additional_fixes):
-                            seg = fix.get("segment", "")
-                            desc = fix.get("description", "")
-                            fix_type = fix.get("fix_type", "")
-                            type_label = "🔴 놓침" if fix_type == "missed" else "🟡 잘못된 경고" if fix_type == "false_alarm" else ""
-
-                            # 검수자 확인 체크박스
-                            reviewer_addfix_check_key = f"reviewer_addfix_check_{case.id}_{idx}"
-                            col_check, col_info = st.columns([1, 5])
-                            with col_check:
-                                st.checkbox(
-                                    "확인",
-                                    key=reviewer_addfix_check_key,
-                                    label_visibility="collapsed"
-                                )
-                            with col_info:
-                                st.markdown(f"{type_label} {seg}: {desc}")
-
-                # 작업자 메모
-                if worker_memo:
-                    st.markdown("**📋 작업자 메모:**")
-                    with st.container(border=True):
-                        st.markdown(f'"{worker_memo}"')
-
-                # 요약
-                st.markdown("**[요약]**")
-                summary_cols = st.columns(3)
-                with summary_cols[0]:
-                    fix_rate = (fixed_count / total_issues * 100) if total_issues > 0 else 0
-                    st.metric("Auto-QC 이슈", f"{total_issues}건 중 {fixed_count}건 수정 ({fix_rate:.0f}%)")
-                with summary_cols[1]:
-                    st.metric("추가 수정", f"{len(additional_fixes)}건")
-                with summary_cols[2]:
-                    st.metric("상태", f"{status_icon} {autoqc.status or '-'}")
-
-                st.caption(f"Auto-QC 실행: {autoqc.created_at.strftime('%Y-%m-%d %H:%M')}")
-            else:
-                st.markdown("**Auto-QC**")
-                with st.container(border=True):
-                    st.caption("Auto-QC 데이터 없음")
+    # 선택되지 않은 경우 selectbox로 선택
+    if case is None:
+        case_labels = dict(zip(case_ids, df[UI_LABELS["original_name"]]))
+        selected_case_id = st.selectbox(
+            "검수할 케이스",
+            options=case_ids,
+            format_func=lambda x: f"{case_labels[x]} (번호 {x})",
+            key="review_queue_select",
+        )
+        case = next((c for c in cases if c.id == selected_case_id), None)
 
-            # Metrics display
-            st.markdown("---")
-            st.markdown("**작업 지표:**")
-            metric_cols = st.columns(3)
-            with metric_cols[0]:
-                st.metric("총 시간", work_duration)
-            with metric_cols[1]:
-                st.metric("공수(MD)", f"{man_days:.2f} MD")
-            with metric_cols[2]:
-                st.metric("소요 일수", timeline)
-
-            # WorkLog timeline
-            if worklogs:
-                st.markdown("**작업 기록:**")
-                for wl in worklogs:
-                    reason_str = f" ({wl.reason_code})" if wl.reason_code else ""
-                    st.write(f"- {wl.timestamp.strftime('%Y-%m-%d %H:%M')} | {wl.action_type.value}{reason_str} | {wl.user.username}")
+    if case:
+        _render_review_case_detail(db, case, user, auto_timeout, workday_hours)
 
-            st.markdown("---")
 
-            # ====== 검수자 Auto-QC 불일치 기록 섹션 ======
-            if autoqc:
-                st.markdown("**Auto-QC 불일치 기록**")
-
-                # 기존 불일치 기록 로드
-                existing_reviewer_fb = db.query(ReviewerQcFeedback).filter(
-                    ReviewerQcFeedback.case_id == case.id,
-                    ReviewerQcFeedback.reviewer_id == user["id"]
-                ).first()
-
-                # 세션 키 정의
-                edit_mode_key = f"disagree_edit_mode_{case.id}"
-                add_mode_key = f"disagree_add_mode_{case.id}"
-
-                if edit_mode_key not in st.session_state:
-                    st.session_state[edit_mode_key] = False
-                if add_mode_key not in st.session_state:
-                    st.session_state[add_mode_key] = False
-
-                has_record = existing_reviewer_fb and existing_reviewer_fb.has_disagreement
-                is_editing = st.session_state[edit_mode_key]
-                is_adding = st.session_state[add_mode_key]
-
-                # 상단 [불일치 추가] 버튼 (편집/추가 모드가 아닐 때만)
-                if not is_editing and not is_adding:
-                    # 기존 기록이 있으면 추가 버튼 비활성화 (case당 1개 제한)
-                    if not has_record:
-                        if st.button("불일치 추가", key=f"add_disagree_btn_{case.id}"):
-                            st.session_state[add_mode_key] = True
-                            st.rerun()
+def _render_review_case_detail(db: Session, case: Case, user: dict, auto_timeout: int, workday_hours: int):
+    """검수 대기 케이스 1건 상세 (Auto-QC 이슈/작업자 수정 현황/작업 지표/검수 액션)."""
+    worklogs = db.query(WorkLog).options(selectinload(WorkLog.user)).filter(
+        WorkLog.case_id == case.id
+    ).order_by(WorkLog.timestamp).all()
 
-                # 저장된 불일치 기록 목록 표시 (편집/추가 모드가 아닐 때)
-                if has_record and not is_editing and not is_adding:
-                    with st.container(border=True):
-                        # 세그먼트 파싱
-                        segments_str = "-"
-                        if existing_reviewer_fb.disagreement_segments_json:
-                            try:
-                                segments = json.loads(existing_reviewer_fb.disagreement_segments_json)
-                                segments_str = ", ".join(segments) if segments else "-"
-                            except json.JSONDecodeError:
-                                pass
-
-                        # 유형 표시
-                        type_display = "놓친 문제" if existing_reviewer_fb.disagreement_type == "MISSED" else "잘못된 경고"
-
-                        # 테이블 형식으로 표시
-                        col_type, col_detail, col_seg = st.columns([1, 2, 1.5])
-                        with col_type:
-                            st.markdown(f"**유형:** {type_display}")
-                        with col_detail:
-                            st.markdown(f"**상세:** {existing_reviewer_fb.disagreement_detail or '-'}")
-                        with col_seg:
-                            st.markdown(f"**세그먼트:** {segments_str}")
-
-                        # 수정/삭제 버튼
-                        col_edit, col_del, col_space = st.columns([1, 1, 3])
-                        with col_edit:
-                            if st.button("수정", key=f"edit_disagree_{case.id}"):
-                                st.session_state[edit_mode_key] = True
-                                st.rerun()
-                        with col_del:
-                            if st.button("삭제", key=f"delete_disagree_{case.id}"):
-                                existing_reviewer_fb.has_disagreement = False
-                                existing_reviewer_fb.disagreement_type = None
-                                existing_reviewer_fb.disagreement_detail = None
-                                existing_reviewer_fb.disagreement_segments_json = None
-                                db.commit()
-                                st.success("불일치 기록이 삭제되었습니다.")
-                                st.rerun()
+    work_seconds = compute_work_seconds(worklogs, auto_timeout)
+    work_duration = format_duration(work_seconds)
+    man_days = compute_man_days(work_seconds, workday_hours)
+    first_start, last_end = get_timeline_dates(worklogs)
+    timeline = compute_timeline(first_start, last_end)
 
-                # 기록이 없고 추가 모드도 아닐 때 안내 문구
-                elif not has_record and not is_adding:
-                    st.caption("아직 저장된 불일치 기록이 없습니다.")
-
-                # 불일치 기록 입력 폼 (추가 또는 수정 모드)
-                if is_editing or is_adding:
-                    mode_label = "수정" if is_editing else "추가"
-                    st.info(f"불일치 기록 {mode_label} 중...")
-
-                    with st.container(border=True):
-                        st.markdown("**불일치 유형:**")
-                        disagree_type_options = ["놓친 문제 (PASS였는데 문제 발견)", "잘못된 경고 (WARN/INCOMPLETE였는데 문제 없음)"]
-
-                        # 수정 모드일 때 기존 값으로 초기화
-                        default_type_idx = 0
-                        if is_editing and existing_reviewer_fb and existing_reviewer_fb.disagreement_type == "FALSE_ALARM":
-                            default_type_idx = 1
-
-                        disagree_type = st.radio(
-                            "유형 선택",
-                            options=disagree_type_options,
-                            index=default_type_idx,
-                            key=f"disagree_type_{case.id}",
-                            label_visibility="collapsed"
-                        )
+    autoqc = db.query(AutoQcSummary).filter(AutoQcSummary.case_id == case.id).first()
+
+    # 최신 작업자 피드백 (created_at 내림차순 첫 건)
+    worker_feedback = db.query(WorkerQcFeedback).filter(
+        WorkerQcFeedback.case_id == case.id
+    ).order_by(WorkerQcFeedback.created_at.desc()).first()
+
+    original_name_display = case.original_name if case.original_name else case.display_name
+    st.markdown("---")
+    st.markdown(f"#### {original_name_display} ({case.case_uid}) - {UI_LABELS['revision']} {case.revision}")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.write(f"**{UI_LABELS['case_uid']}:** {case.case_uid}")
+        st.write(f"**{UI_LABELS['original_name']}:** {original_name_display}")
+        st.write(f"**{UI_LABELS['nas_path']}:** {case.nas_path if case.nas_path else '-'}")
+        st.write(f"**{UI_LABELS['project']}:** {case.project.name}")
+    with col2:
+        st.write(f"**{UI_LABELS['part']}:** {case.part.name}")
+        st.write(f"**{UI_LABELS['hospital']}:** {case.hospital or UI_LABELS['unassigned']}")
+        st.write(f"**{UI_LABELS['slice_thickness']}:** {case.slice_thickness_mm if case.slice_thickness_mm else '-'}")
+    with col3:
+        st.write(f"**{UI_LABELS['difficulty']}:** {case.difficulty.value}")
+        st.write(f"**{UI_LABELS['assignee']}:** {case.assigned_user.username if case.assigned_user else UI_LABELS['unassigned']}")
+        if case.started_at:
+            st.write(f"**시작일:** {case.started_at.strftime('%Y-%m-%d %H:%M')}")
+        if case.worker_completed_at:
+            st.write(f"**제출일:** {case.worker_completed_at.strftime('%Y-%m-%d %H:%M')}")
+
+    # ====== QC 이슈 + 작업자 수정 현황 상세 표시 ======
+    st.markdown("---")
+
+    # QC 수정 현황 파싱
+    qc_fixes_map = {}  # {issue_id or segment: {"fixed": bool, ...}}
+    additional_fixes = []
+    worker_memo = ""
+    if worker_feedback:
+        if worker_feedback.qc_fixes_json:
+            try:
+                qc_fixes_list = _json_loads(worker_feedback.qc_fixes_json)
+                for fix in qc_fixes_list:
+                    key = fix.get("issue_id") or fix.get("segment", "")
+                    qc_fixes_map[key] = fix
+            except json.JSONDecodeError:
+                pass
+        if worker_feedback.additional_fixes_json:
+            try:
+                additional_fixes = _json_loads(worker_feedback.additional_fixes_json)
+            except json.JSONDecodeError:
+                pass
+        worker_memo = worker_feedback.memo or ""
+
+    if autoqc:
+        # 상태 아이콘
+        status_icon = {"PASS": "✅", "WARN": "⚠️", "INCOMPLETE": "❌"}.get(autoqc.status, "")
+
+        # 이슈 목록 파싱
+        issues = []
+        if autoqc.issues_json:
+            try:
+                issues = _json_loads(autoqc.issues_json)
+            except json.JSONDecodeError:
+                pass
 
-                        st.markdown("**상세 내용 (선택):**")
-                        default_detail = ""
-                        if is_editing and existing_reviewer_fb and existing_reviewer_fb.disagreement_detail:
-                            default_detail = existing_reviewer_fb.disagreement_detail
+        # 수정율 계산
+        total_issues = len(issues)
+        fixed_count = sum(1 for i, issue in enumerate(issues) if qc_fixes_map.get(i, {}).get("fixed", False) or qc_fixes_map.get(issue.get("segment", ""), {}).get("fixed", False))
 
-                        disagree_detail = st.text_area(
-                            "상세 내용",
-                            value=default_detail,
-                            key=f"disagree_detail_{case.id}",
-                            placeholder="어떤 문제를 놓쳤는지 / 왜 문제없는지 입력...",
+        st.markdown("**📋 Auto-QC 이슈 목록 (작업자 수정 → 검수자 확인):**")
+        with st.container(border=True):
+            if issues:
+                severity_icons = {"WARN": "⚠️", "INCOMPLETE": "❌", "INFO": "ℹ️"}
+                for i, issue in enumerate(issues):
+                    level = issue.get("level", "")
+                    segment = issue.get("segment", "")
+                    msg = issue.get("message", str(issue))
+                    code = issue.get("code", "")
+                    sev_icon = severity_icons.get(level, "•")
+
+                    # 작업자 수정 여부 확인 (index 또는 segment로 매칭)
+                    is_fixed = qc_fixes_map.get(i, {}).get("fixed", False) or qc_fixes_map.get(segment, {}).get("fixed", False)
+                    fix_status = "수정완료" if is_fixed else "미수정"
+
+                    # 검수자 확인 체크박스 (session_state 전용)
+                    reviewer_check_key = f"reviewer_check_{case.id}_{i}"
+                    col_check, col_info = st.columns([1, 5])
+                    with col_check:
+                        st.checkbox(
+                            "확인",
+                            key=reviewer_check_key,
                             label_visibility="collapsed"
                         )
+                    with col_info:
+                        fix_icon = "✅" if is_fixed else "❌"
+                        st.markdown(f"{fix_icon} {sev_icon} {level}: {segment} - {msg} [{fix_status}]")
+            else:
+                st.caption("이슈 없음")
 
-                        st.markdown("**해당 세그먼트 (선택):**")
-                        # 기존 세그먼트 목록 로드
-                        existing_segments = []
-                        if is_editing and existing_reviewer_fb and existing_reviewer_fb.disagreement_segments_json:
-                            try:
-                                existing_segments = json.loads(existing_reviewer_fb.disagreement_segments_json)
-                            except json.JSONDecodeError:
-                                pass
-
-                        # 세그먼트 입력 (쉼표 구분)
-                        segment_input = st.text_input(
-                            "세그먼트 (쉼표 구분)",
-                            value=", ".join(existing_segments) if existing_segments else "",
-                            key=f"disagree_segments_{case.id}",
-                            placeholder="예: IVC, Aorta, Portal_vein",
+            # 범례
+            st.caption("체크박스 = 검수자 확인용 / ✅ = 작업자 수정완료 / ❌ = 작업자 미수정")
+
+        # 추가 수정 사항 (QC에 없던 것)
+        if additional_fixes:
+            st.markdown("**📋 추가 수정 사항 (QC에 없던 것):**")
+            with st.container(border=True):
+                for idx, fix in enumerate(additional_fixes):
+                    seg = fix.get("segment", "")
+                    desc = fix.get("description", "")
+                    fix_type = fix.get("fix_type", "")
+                    type_label = "🔴 놓침" if fix_type == "missed" else "🟡 잘못된 경고" if fix_type == "false_alarm" else ""
+
+                    # 검수자 확인 체크박스
+                    reviewer_addfix_check_key = f"reviewer_addfix_check_{case.id}_{idx}"
+                    col_check, col_info = st.columns([1, 5])
+                    with col_check:
+                        st.checkbox(
+                            "확인",
+                            key=reviewer_addfix_check_key,
                             label_visibility="collapsed"
                         )
+                    with col_info:
+                        st.markdown(f"{type_label} {seg}: {desc}")
+
+        # 작업자 메모
+        if worker_memo:
+            st.markdown("**📋 작업자 메모:**")
+            with st.container(border=True):
+                st.markdown(f'"{worker_memo}"')
+
+        # 요약
+        st.markdown("**[요약]**")
+        summary_cols = st.columns(3)
+        with summary_cols[0]:
+            fix_rate = (fixed_count / total_issues * 100) if total_issues > 0 else 0
+            st.metric("Auto-QC 이슈", f"{total_issues}건 중 {fixed_count}건 수정 ({fix_rate:.0f}%)")
+        with summary_cols[1]:
+            st.metric("추가 수정", f"{len(additional_fixes)}건")
+        with summary_cols[2]:
+            st.metric("상태", f"{status_icon} {autoqc.status or '-'}")
+
+        st.caption(f"Auto-QC 실행: {autoqc.created_at.strftime('%Y-%m-%d %H:%M')}")
+    else:
+        st.markdown("**Auto-QC**")
+        with st.container(border=True):
+            st.caption("Auto-QC 데이터 없음")
+
+    # Metrics display
+    st.markdown("---")
+    st.markdown("**작업 지표:**")
+    metric_cols = st.columns(3)
+    with metric_cols[0]:
+        st.metric("총 시간", work_duration)
+    with metric_cols[1]:
+        st.metric("공수(MD)", f"{man_days:.2f} MD")
+    with metric_cols[2]:
+        st.metric("소요 일수", timeline)
 
-                        # 버튼 행
-                        col_save, col_cancel, col_sp = st.columns([1, 1, 3])
+    # WorkLog timeline
+    if worklogs:
+        # 기록 전체를 markdown 요소 1개로 전송 (행마다 요소 생성 방지)
+        st.markdown("**작업 기록:**\n" + "\n".join(
+            f"- {wl.timestamp.strftime('%Y-%m-%d %H:%M')} | {wl.action_type.value}"
+            f"{f' ({wl.reason_code})' if wl.reason_code else ''} | {wl.user.username}"
+            for wl in worklogs
+        ))
 
-                        with col_save:
-                            if st.button("저장", key=f"save_disagree_{case.id}", type="primary"):
-                                # 유형 변환
-                                disagree_type_code = "MISSED" if "놓친 문제" in disagree_type else "FALSE_ALARM"
-
-                                # 세그먼트 파싱
-                                segments_list = [s.strip() for s in segment_input.split(",") if s.strip()] if segment_input.strip() else []
-                                segments_json = json.dumps(segments_list, ensure_ascii=False) if segments_list else None
-
-                                if existing_reviewer_fb:
-                                    # 기존 레코드 업데이트
-                                    existing_reviewer_fb.has_disagreement = True
-                                    existing_reviewer_fb.disagreement_type = disagree_type_code
-                                    existing_reviewer_fb.disagreement_detail = disagree_detail.strip() or None
-                                    existing_reviewer_fb.disagreement_segments_json = segments_json
-                                else:
-                                    # 새로 생성
-                                    new_fb = ReviewerQcFeedback(
-                                        case_id=case.id,
-                                        reviewer_id=user["id"],
-                                        has_disagreement=True,
-                                        disagreement_type=disagree_type_code,
-                                        disagreement_detail=disagree_detail.strip() or None,
-                                        disagreement_segments_json=segments_json,
-                                    )
-                                    db.add(new_fb)
-
-                                db.commit()
-                                st.session_state[edit_mode_key] = False
-                                st.session_state[add_mode_key] = False
-                                st.success("불일치 기록이 저장되었습니다!")
-                                st.rerun()
+    st.markdown("---")
+
+    # ====== 검수자 Auto-QC 불일치 기록 섹션 ======
+    if autoqc:
+        _render_reviewer_disagreement_fragment(case.id, user)
+
+    st.markdown("---")
+
+    # Review actions with enhanced ReviewNote input
+    _render_review_actions_fragment(case.id, user, autoqc is not None)
+
+
+def _accept_submitted_case(
+    case_id: int, user: dict, accept_note: str, qc_confirmed: bool, accept_tags: str, idempotency_key: str,
+) -> None:
+    """
+    검수 승인 저장 (ReviewNote + 검수 코멘트 + ACCEPTED Event + Case 상태를 한 번에 commit).
+    같은 idempotency_key의 Event가 이미 있으면 (중복 확정) 아무것도 하지 않음.
+    """
+    db = get_db()
+    try:
+        if db.query(Event.id).filter(Event.idempotency_key == idempotency_key).first():
+            return
+        case = db.query(Case).filter(Case.id == case_id).first()
+        now = datetime.now(TIMEZONE)
+        new_rows = []
+
+        # Create review note if there's any input
+        if accept_note.strip() or qc_confirmed or accept_tags.strip():
+            tags_json = None
+            if accept_tags.strip():
+                tags_list = [t.strip() for t in accept_tags.split(",") if t.strip()]
+                tags_json = json.dumps(tags_list)
+
+            note = ReviewNote(
+                case_id=case.id,
+                reviewer_user_id=user["id"],
+                note_text=accept_note.strip() or "승인됨",
+                qc_summary_confirmed=qc_confirmed,
+                extra_tags_json=tags_json,
+                created_at=now,
+            )
+            new_rows.append(note)
+
+        # ReviewerQcFeedback에 코멘트 추가 (불일치 기록은 이미 별도 저장됨)
+        if accept_note.strip():
+            existing_fb = db.query(ReviewerQcFeedback).filter(
+                ReviewerQcFeedback.case_id == case.id,
+                ReviewerQcFeedback.reviewer_id == user["id"]
+            ).first()
+
+            if existing_fb:
+                existing_fb.review_memo = accept_note.strip()
+            else:
+                new_fb = ReviewerQcFeedback(
+                    case_id=case.id,
+                    reviewer_id=user["id"],
+                    has_disagreement=False,
+                    review_memo=accept_note.strip(),
+                )
+                new_rows.append(new_fb)
+
+        event = Event(
+            case_id=case.id,
+            user_id=user["id"],
+            event_type=EventType.ACCEPTED,
+            idempotency_key=idempotency_key,
+            event_code=f"승인: {accept_note.strip()[:30] if accept_note.strip() else '메모 없음'}",
+            payload_json=json.dumps({"feedback": accept_note.strip() or ""}, ensure_ascii=False),
+            created_at=now,
+        )
+        new_rows.append(event)
+        db.add_all(new_rows)
+        case.status = CaseStatus.ACCEPTED
+        case.accepted_at = now
+        db.commit()
+    finally:
+        db.close()
+
+
+def _bulk_accept_submitted_cases(case_revisions: dict, user: dict, accept_note: str) -> int:
+    """
+    선택 케이스 일괄 승인 (한 번에 commit).
+    Case 상태는 SUBMITTED + 선택 시점 revision 조건의 UPDATE 한 번으로 변경하고,
+    실제로 변경된 케이스에만 ACCEPTED Event/ReviewNote/검수 코멘트를 추가.
+
+    Args:
+        case_revisions: {case_id: 선택 시점 revision}
+    Returns: 승인된 케이스 수
+    """
+    from sqlalchemy import tuple_
+
+    if not case_revisions:
+        return 0
+
+    db = get_db()
+    try:
+        now = datetime.now(TIMEZONE)
+        note_text = accept_note.strip()
+
+        # 그 사이 재작업 요청/재제출된 케이스는 WHERE 조건에서 제외됨 (상태 변경은 UPDATE 한 번)
+        db.query(Case).filter(
+            tuple_(Case.id, Case.revision).in_(list(case_revisions.items())),
+            Case.status == CaseStatus.SUBMITTED,
+        ).update(
+            {Case.status: CaseStatus.ACCEPTED, Case.accepted_at: now},
+            synchronize_session=False,
+        )
+        # 같은 트랜잭션에서 이번 UPDATE로 승인된 케이스만 조회 (accepted_at == now)
+        accepted_ids = [
+            case_id for (case_id,) in db.query(Case.id).filter(
+                Case.id.in_(list(case_revisions)),
+                Case.status == CaseStatus.ACCEPTED,
+                Case.accepted_at == now,
+            ).all()
+        ]
+        if not accepted_ids:
+            db.rollback()
+            return 0
+
+        new_rows = [
+            Event(
+                case_id=case_id,
+                user_id=user["id"],
+                event_type=EventType.ACCEPTED,
+                idempotency_key=generate_idempotency_key(case_id, "ACCEPTED"),
+                event_code=f"일괄 승인: {note_text[:30] if note_text else '메모 없음'}",
+                payload_json=json.dumps({"feedback": note_text, "bulk": True}, ensure_ascii=False),
+                created_at=now,
+            )
+            for case_id in accepted_ids
+        ]
+        if note_text:
+            new_rows.extend(
+                ReviewNote(
+                    case_id=case_id,
+                    reviewer_user_id=user["id"],
+                    note_text=note_text,
+                    qc_summary_confirmed=False,
+                    created_at=now,
+                )
+                for case_id in accepted_ids
+            )
+
+            # 단건 승인과 동일하게 ReviewerQcFeedback에 코멘트 저장 (작업자 결과 화면이 여기서 읽음)
+            existing_fbs = {
+                fb.case_id: fb
+                for fb in db.query(ReviewerQcFeedback).filter(
+                    ReviewerQcFeedback.case_id.in_(accepted_ids),
+                    ReviewerQcFeedback.reviewer_id == user["id"],
+                ).all()
+            }
+            for case_id in accepted_ids:
+                existing_fb = existing_fbs.get(case_id)
+                if existing_fb:
+                    existing_fb.review_memo = note_text
+                else:
+                    new_rows.append(ReviewerQcFeedback(
+                        case_id=case_id,
+                        reviewer_id=user["id"],
+                        has_disagreement=False,
+                        review_memo=note_text,
+                    ))
+
+        db.add_all(new_rows)
+        db.commit()
+        return len(accepted_ids)
+    finally:
+        db.close()
+
+
+def _request_case_rework(case_id: int, user: dict, reason: str, rework_tags: str, idempotency_key: str) -> None:
+    """
+    재작업 요청 저장 (ReviewNote + 검수 코멘트 + REJECT Event + Case 상태를 한 번에 commit).
+    같은 idempotency_key의 Event가 이미 있으면 (중복 확정) 아무것도 하지 않음.
+    """
+    db = get_db()
+    try:
+        if db.query(Event.id).filter(Event.idempotency_key == idempotency_key).first():
+            return
+        case = db.query(Case).filter(Case.id == case_id).first()
+        now = datetime.now(TIMEZONE)
+
+        tags_json = None
+        if rework_tags.strip():
+            tags_list = [t.strip() for t in rework_tags.split(",") if t.strip()]
+            tags_json = json.dumps(tags_list)
+
+        # Create review note
+        note = ReviewNote(
+            case_id=case.id,
+            reviewer_user_id=user["id"],
+            note_text=reason.strip(),
+            qc_summary_confirmed=False,
+            extra_tags_json=tags_json,
+            created_at=now,
+        )
+        new_rows = [note]
+
+        # ReviewerQcFeedback에 코멘트 추가 (불일치 기록은 이미 별도 저장됨)
+        existing_fb = db.query(ReviewerQcFeedback).filter(
+            ReviewerQcFeedback.case_id == case.id,
+            ReviewerQcFeedback.reviewer_id == user["id"]
+        ).first()
+
+        if existing_fb:
+            existing_fb.review_memo = reason.strip()
+        else:
+            new_fb = ReviewerQcFeedback(
+                case_id=case.id,
+                reviewer_id=user["id"],
+                has_disagreement=False,
+                review_memo=reason.strip(),
+            )
+            new_rows.append(new_fb)
+
+        # Create REWORK event (REJECT)
+        event = Event(
+            case_id=case.id,
+            user_id=user["id"],
+            event_type=EventType.REJECT,
+            idempotency_key=idempotency_key,
+            event_code=f"반려: {reason.strip()[:30]}...",
+            payload_json=json.dumps({"reason": reason.strip()}, ensure_ascii=False),
+            created_at=now,
+        )
+        new_rows.append(event)
+        db.add_all(new_rows)
+        case.status = CaseStatus.REWORK
+        case.revision += 1
+        db.commit()
+    finally:
+        db.close()
+
+
+@_fragment
+def _render_review_actions_fragment(case_id: int, user: dict, has_autoqc: bool):
+    """
+    검수 승인/재작업 요청 영역 (fragment 단위 rerun).
+    입력 폼 열기/취소는 이 영역만 rerun, 확정 시에는 목록 갱신을 위해 전체 rerun.
+    """
+    col_a, col_b = st.columns(2)
+
+    with col_a:
+        # Accept with optional note
+        accept_key = f"accept_mode_{case_id}"
+        st.session_state.setdefault(accept_key, False)
+
+        if not st.session_state[accept_key]:
+            if st.button("승인", key=f"accept_{case_id}", type="primary"):
+                st.session_state[accept_key] = True
+                _rerun_fragment()
+        else:
+            st.markdown("**승인 (메모 선택사항):**")
+            accept_idempotency_key = get_confirmation_idempotency_key(case_id, "ACCEPTED")
+
+            # QC summary confirmed checkbox (only if AutoQC exists)
+            qc_confirmed = False
+            if has_autoqc:
+                qc_confirmed = st.checkbox(
+                    "Auto-QC 결과 정확성 확인",
+                    key=f"qc_confirm_{case_id}"
+                )
+
+            accept_note = st.text_area(
+                "메모 (선택)",
+                key=f"accept_note_{case_id}",
+                placeholder="케이스에 대한 코멘트..."
+            )
+
+            accept_tags = st.text_input(
+                "태그 (쉼표 구분, 선택)",
+                key=f"accept_tags_{case_id}",
+                placeholder="예: edge_case, needs_review"
+            )
+
+            col_x, col_y = st.columns(2)
+            with col_x:
+                if st.button("승인 확인", key=f"confirm_accept_{case_id}", type="primary"):
+                    _accept_submitted_case(
+                        case_id, user, accept_note, qc_confirmed, accept_tags, accept_idempotency_key,
+                    )
+                    st.session_state[accept_key] = False
+                    clear_confirmation_idempotency_key(case_id, "ACCEPTED")
+                    st.success("케이스가 승인되었습니다!")
+                    st.rerun()
+            with col_y:
+                if st.button("취소", key=f"cancel_accept_{case_id}"):
+                    st.session_state[accept_key] = False
+                    clear_confirmation_idempotency_key(case_id, "ACCEPTED")
+                    _rerun_fragment()
 
-                        with col_cancel:
-                            if st.button("취소", key=f"cancel_disagree_{case.id}"):
-                                st.session_state[edit_mode_key] = False
-                                st.session_state[add_mode_key] = False
-                                st.rerun()
+    with col_b:
+        rework_key = f"rework_mode_{case_id}"
+        st.session_state.setdefault(rework_key, False)
 
-            st.markdown("---")
+        if not st.session_state[rework_key]:
+            if st.button("재작업 요청", key=f"rework_{case_id}"):
+                st.session_state[rework_key] = True
+                _rerun_fragment()
+        else:
+            st.markdown("**재작업 요청:**")
+            rework_idempotency_key = get_confirmation_idempotency_key(case_id, "REJECT")
 
-            # Review actions with enhanced ReviewNote input
-            col_a, col_b = st.columns(2)
+            reason = st.text_area(
+                "사유 (필수)",
+                key=f"rework_reason_{case_id}",
+                placeholder="수정이 필요한 내용을 설명하세요..."
+            )
 
-            with col_a:
-                # Accept with optional note
-                accept_key = f"accept_mode_{case.id}"
-                if accept_key not in st.session_state:
-                    st.session_state[accept_key] = False
+            rework_tags = st.text_input(
+                "태그 (쉼표 구분, 선택)",
+                key=f"rework_tags_{case_id}",
+                placeholder="예: missing_segment, boundary_error"
+            )
 
-                if not st.session_state[accept_key]:
-                    if st.button("승인", key=f"accept_{case.id}", type="primary"):
-                        st.session_state[accept_key] = True
+            col_x, col_y = st.columns(2)
+            with col_x:
+                if st.button("재작업 확인", key=f"confirm_rework_{case_id}"):
+                    if not reason.strip():
+                        st.error("사유는 필수 입력 항목입니다!")
+                    else:
+                        _request_case_rework(case_id, user, reason, rework_tags, rework_idempotency_key)
+                        st.session_state[rework_key] = False
+                        clear_confirmation_idempotency_key(case_id, "REJECT")
+                        st.success("재작업이 요청되었습니다!")
                         st.rerun()
-                else:
-                    st.markdown("**승인 (메모 선택사항):**")
-
-                    # QC summary confirmed checkbox (only if AutoQC exists)
-                    qc_confirmed = False
-                    if autoqc:
-                        qc_confirmed = st.checkbox(
-                            "Auto-QC 결과 정확성 확인",
-                            key=f"qc_confirm_{case.id}"
-                        )
+            with col_y:
+                if st.button("취소", key=f"cancel_rework_{case_id}"):
+                    st.session_state[rework_key] = False
+                    clear_confirmation_idempotency_key(case_id, "REJECT")
+                    _rerun_fragment()
 
-                    accept_note = st.text_area(
-                        "메모 (선택)",
-                        key=f"accept_note_{case.id}",
-                        placeholder="케이스에 대한 코멘트..."
-                    )
 
-                    accept_tags = st.text_input(
-                        "태그 (쉼표 구분, 선택)",
-                        key=f"accept_tags_{case.id}",
-                        placeholder="예: edge_case, needs_review"
-                    )
+@_fragment
+def _render_reviewer_disagreement_fragment(case_id: int, user: dict):
+    """
+    검수자 Auto-QC 불일치 기록 영역 (fragment 단위 rerun).
+    fragment rerun 시 바깥 세션은 닫혀 있으므로 세션을 따로 열어 조회/저장.
+    """
+    st.markdown("**Auto-QC 불일치 기록**")
 
-                    col_x, col_y = st.columns(2)
-                    with col_x:
-                        if st.button("승인 확인", key=f"confirm_accept_{case.id}", type="primary"):
-                            now = datetime.now(TIMEZONE)
+    db = get_db()
+    try:
+        # 기존 불일치 기록 로드
+        existing_reviewer_fb = db.query(ReviewerQcFeedback).filter(
+            ReviewerQcFeedback.case_id == case_id,
+            ReviewerQcFeedback.reviewer_id == user["id"]
+        ).first()
 
-                            # Create review note if there's any input
-                            if accept_note.strip() or qc_confirmed or accept_tags.strip():
-                                tags_json = None
-                                if accept_tags.strip():
-                                    tags_list = [t.strip() for t in accept_tags.split(",") if t.strip()]
-                                    tags_json = json.dumps(tags_list)
+        # 세션 키 정의
+        edit_mode_key = f"disagree_edit_mode_{case_id}"
+        add_mode_key = f"disagree_add_mode_{case_id}"
 
-                                note = ReviewNote(
-                                    case_id=case.id,
-                                    reviewer_user_id=user["id"],
-                                    note_text=accept_note.strip() or "승인됨",
-                                    qc_summary_confirmed=qc_confirmed,
-                                    extra_tags_json=tags_json,
-                                    created_at=now,
-                                )
-                                db.add(note)
+        st.session_state.setdefault(edit_mode_key, False)
+        st.session_state.setdefault(add_mode_key, False)
 
-                            # ReviewerQcFeedback에 코멘트 추가 (불일치 기록은 이미 별도 저장됨)
-                            if accept_note.strip():
-                                existing_fb = db.query(ReviewerQcFeedback).filter(
-                                    ReviewerQcFeedback.case_id == case.id,
-                                    ReviewerQcFeedback.reviewer_id == user["id"]
-                                ).first()
+        has_record = existing_reviewer_fb and existing_reviewer_fb.has_disagreement
+        is_editing = st.session_state[edit_mode_key]
+        is_adding = st.session_state[add_mode_key]
 
-                                if existing_fb:
-                                    existing_fb.review_memo = accept_note.strip()
-                                else:
-                                    new_fb = ReviewerQcFeedback(
-                                        case_id=case.id,
-                                        reviewer_id=user["id"],
-                                        has_disagreement=False,
-                                        review_memo=accept_note.strip(),
-                                    )
-                                    db.add(new_fb)
-
-                            event = Event(
-                                case_id=case.id,
-                                user_id=user["id"],
-                                event_type=EventType.ACCEPTED,
-                                idempotency_key=generate_idempotency_key(case.id, "ACCEPTED"),
-                                event_code=f"승인: {accept_note.strip()[:30] if accept_note.strip() else '메모 없음'}",
-                                payload_json=json.dumps({"feedback": accept_note.strip() or ""}, ensure_ascii=False),
-                                created_at=now,
-                            )
-                            db.add(event)
-                            case.status = CaseStatus.ACCEPTED
-                            case.accepted_at = now
-                            db.commit()
-                            st.session_state[accept_key] = False
-                            st.success("케이스가 승인되었습니다!")
-                            st.rerun()
-                    with col_y:
-                        if st.button("취소", key=f"cancel_accept_{case.id}"):
-                            st.session_state[accept_key] = False
-                            st.rerun()
+        # 상단 [불일치 추가] 버튼 (편집/추가 모드가 아닐 때만)
+        if not is_editing and not is_adding:
+            # 기존 기록이 있으면 추가 버튼 비활성화 (case당 1개 제한)
+            if not has_record:
+                if st.button("불일치 추가", key=f"add_disagree_btn_{case_id}"):
+                    st.session_state[add_mode_key] = True
+                    _rerun_fragment()
 
-            with col_b:
-                rework_key = f"rework_mode_{case.id}"
-                if rework_key not in st.session_state:
-                    st.session_state[rework_key] = False
+        # 저장된 불일치 기록 목록 표시 (편집/추가 모드가 아닐 때)
+        if has_record and not is_editing and not is_adding:
+            with st.container(border=True):
+                # 세그먼트 파싱
+                segments_str = "-"
+                if existing_reviewer_fb.disagreement_segments_json:
+                    try:
+                        segments = json.loads(existing_reviewer_fb.disagreement_segments_json)
+                        segments_str = ", ".join(segments) if segments else "-"
+                    except json.JSONDecodeError:
+                        pass
 
-                if not st.session_state[rework_key]:
-                    if st.button("재작업 요청", key=f"rework_{case.id}"):
-                        st.session_state[rework_key] = True
-                        st.rerun()
-                else:
-                    st.markdown("**재작업 요청:**")
+                # 유형 표시
+                type_display = "놓친 문제" if existing_reviewer_fb.disagreement_type == "MISSED" else "잘못된 경고"
+
+                # 테이블 형식으로 표시
+                col_type, col_detail, col_seg = st.columns([1, 2, 1.5])
+                with col_type:
+                    st.markdown(f"**유형:** {type_display}")
+                with col_detail:
+                    st.markdown(f"**상세:** {existing_reviewer_fb.disagreement_detail or '-'}")
+                with col_seg:
+                    st.markdown(f"**세그먼트:** {segments_str}")
+
+                # 수정/삭제 버튼
+                col_edit, col_del, col_space = st.columns([1, 1, 3])
+                with col_edit:
+                    if st.button("수정", key=f"edit_disagree_{case_id}"):
+                        st.session_state[edit_mode_key] = True
+                        _rerun_fragment()
+                with col_del:
+                    if st.button("삭제", key=f"delete_disagree_{case_id}"):
+                        existing_reviewer_fb.has_disagreement = False
+                        existing_reviewer_fb.disagreement_type = None
+                        existing_reviewer_fb.disagreement_detail = None
+                        existing_reviewer_fb.disagreement_segments_json = None
+                        db.commit()
+                        st.success("불일치 기록이 삭제되었습니다.")
+                        _rerun_fragment()
 
-                    reason = st.text_area(
-                        "사유 (필수)",
-                        key=f"rework_reason_{case.id}",
-                        placeholder="수정이 필요한 내용을 설명하세요..."
-                    )
+        # 기록이 없고 추가 모드도 아닐 때 안내 문구
+        elif not has_record and not is_adding:
+            st.caption("아직 저장된 불일치 기록이 없습니다.")
 
-                    rework_tags = st.text_input(
-                        "태그 (쉼표 구분, 선택)",
-                        key=f"rework_tags_{case.id}",
-                        placeholder="예: missing_segment, boundary_error"
-                    )
+        # 불일치 기록 입력 폼 (추가 또는 수정 모드)
+        if is_editing or is_adding:
+            mode_label = "수정" if is_editing else "추가"
+            st.info(f"불일치 기록 {mode_label} 중...")
 
-                    col_x, col_y = st.columns(2)
-                    with col_x:
-                        if st.button("재작업 확인", key=f"confirm_rework_{case.id}"):
-                            if not reason.strip():
-                                st.error("사유는 필수 입력 항목입니다!")
-                            else:
-                                now = datetime.now(TIMEZONE)
+            with st.container(border=True):
+                st.markdown("**불일치 유형:**")
+                disagree_type_options = ["놓친 문제 (PASS였는데 문제 발견)", "잘못된 경고 (WARN/INCOMPLETE였는데 문제 없음)"]
+
+                # 수정 모드일 때 기존 값으로 초기화
+                default_type_idx = 0
+                if is_editing and existing_reviewer_fb and existing_reviewer_fb.disagreement_type == "FALSE_ALARM":
+                    default_type_idx = 1
+
+                disagree_type = st.radio(
+                    "유형 선택",
+                    options=disagree_type_options,
+                    index=default_type_idx,
+                    key=f"disagree_type_{case_id}",
+                    label_visibility="collapsed"
+                )
 
-                                tags_json = None
-                                if rework_tags.strip():
-                                    tags_list = [t.strip() for t in rework_tags.split(",") if t.strip()]
-                                    tags_json = json.dumps(tags_list)
+                st.markdown("**상세 내용 (선택):**")
+                default_detail = ""
+                if is_editing and existing_reviewer_fb and existing_reviewer_fb.disagreement_detail:
+                    default_detail = existing_reviewer_fb.disagreement_detail
+
+                disagree_detail = st.text_area(
+                    "상세 내용",
+                    value=default_detail,
+                    key=f"disagree_detail_{case_id}",
+                    placeholder="어떤 문제를 놓쳤는지 / 왜 문제없는지 입력...",
+                    label_visibility="collapsed"
+                )
 
-                                # Create review note
-                                note = ReviewNote(
-                                    case_id=case.id,
-                                    reviewer_user_id=user["id"],
-                                    note_text=reason.strip(),
-                                    qc_summary_confirmed=False,
-                                    extra_tags_json=tags_json,
-                                    created_at=now,
-                                )
-                                db.add(note)
+                st.markdown("**해당 세그먼트 (선택):**")
+                # 기존 세그먼트 목록 로드
+                existing_segments = []
+                if is_editing and existing_reviewer_fb and existing_reviewer_fb.disagreement_segments_json:
+                    try:
+                        existing_segments = json.loads(existing_reviewer_fb.disagreement_segments_json)
+                    except json.JSONDecodeError:
+                        pass
 
-                                # ReviewerQcFeedback에 코멘트 추가 (불일치 기록은 이미 별도 저장됨)
-                                existing_fb = db.query(ReviewerQcFeedback).filter(
-                                    ReviewerQcFeedback.case_id == case.id,
-                                    ReviewerQcFeedback.reviewer_id == user["id"]
-                                ).first()
+                # 세그먼트 입력 (쉼표 구분)
+                segment_input = st.text_input(
+                    "세그먼트 (쉼표 구분)",
+                    value=", ".join(existing_segments) if existing_segments else "",
+                    key=f"disagree_segments_{case_id}",
+                    placeholder="예: IVC, Aorta, Portal_vein",
+                    label_visibility="collapsed"
+                )
 
-                                if existing_fb:
-                                    existing_fb.review_memo = reason.strip()
-                                else:
-                                    new_fb = ReviewerQcFeedback(
-                                        case_id=case.id,
-                                        reviewer_id=user["id"],
-                                        has_disagreement=False,
-                                        review_memo=reason.strip(),
-                                    )
-                                    db.add(new_fb)
-
-                                # Create REWORK event (REJECT)
-                                event = Event(
-                                    case_id=case.id,
-                                    user_id=user["id"],
-                                    event_type=EventType.REJECT,
-                                    idempotency_key=generate_idempotency_key(case.id, "REJECT"),
-                                    event_code=f"반려: {reason.strip()[:30]}...",
-                                    payload_json=json.dumps({"reason": reason.strip()}, ensure_ascii=False),
-                                    created_at=now,
-                                )
-                                db.add(event)
-                                case.status = CaseStatus.REWORK
-                                case.revision += 1
-                                db.commit()
-                                st.session_state[rework_key] = False
-                                st.success("재작업이 요청되었습니다!")
-                                st.rerun()
-                    with col_y:
-                        if st.button("취소", key=f"cancel_rework_{case.id}"):
-                            st.session_state[rework_key] = False
-                            st.rerun()
+                # 버튼 행
+                col_save, col_cancel, col_sp = st.columns([1, 1, 3])
 
+                with col_save:
+                    if st.button("저장", key=f"save_disagree_{case_id}", type="primary"):
+                        # 유형 변환
+                        disagree_type_code = "MISSED" if "놓친 문제" in disagree_type else "FALSE_ALARM"
 
-def show_all_cases(db: Session):
-    """Show all cases with AG Grid table (Google Sheets style filtering)."""
-    st.subheader("전체 케이스")
+                        # 세그먼트 파싱
+                        segments_list = [s.strip() for s in segment_input.split(",") if s.strip()] if segment_input.strip() else []
+                        segments_json = json.dumps(segments_list, ensure_ascii=False) if segments_list else None
+
+                        if existing_reviewer_fb:
+                            # 기존 레코드 업데이트
+                            existing_reviewer_fb.has_disagreement = True
+                            existing_reviewer_fb.disagreement_type = disagree_type_code
+                            existing_reviewer_fb.disagreement_detail = disagree_detail.strip() or None
+                            existing_reviewer_fb.disagreement_segments_json = segments_json
+                        else:
+                            # 새로 생성
+                            new_fb = ReviewerQcFeedback(
+                                case_id=case_id,
+                                reviewer_id=user["id"],
+                                has_disagreement=True,
+                                disagreement_type=disagree_type_code,
+                                disagreement_detail=disagree_detail.strip() or None,
+                                disagreement_segments_json=segments_json,
+                            )
+                            db.add(new_fb)
 
-    auto_timeout = get_config_value(db, "auto_timeout_minutes", 120)
-    workday_hours = get_config_value(db, "workday_hours", 8)
+                        db.commit()
+                        st.session_state[edit_mode_key] = False
+                        st.session_state[add_mode_key] = False
+                        st.success("불일치 기록이 저장되었습니다!")
+                        _rerun_fragment()
+
+                with col_cancel:
+                    if st.button("취소", key=f"cancel_disagree_{case_id}"):
+                        st.session_state[edit_mode_key] = False
+                        st.session_state[add_mode_key] = False
+                        _rerun_fragment()
+    finally:
+        db.close()
 
-    # 전체 케이스 조회 (DB 필터 없음 - AG Grid에서 필터링)
-    cases = db.query(Case).order_by(Case.created_at.desc()).limit(500).all()
-    total_count = len(cases)
 
-    # 건수 표시
-    st.caption(f"총 {total_count}건 표시 중")
+@st.cache_data(ttl=30, show_spinner=False, max_entries=32)
+def _build_all_cases_df(data_version: tuple, _db: Session) -> tuple[pd.DataFrame, list]:
+    """
+    전체 케이스 테이블 DataFrame과 케이스 ID 목록 구성 (캐시).
+    data_version(케이스 수, 최신 Case/Event/WorkLog id)이 같으면
+    필터 클릭 등 rerun에서 ORM 조회/DataFrame 구성을 건너뜀.
+    새 id 없이 제자리 수정되는 값(중단 사유 수정 등)은 수정 시 clear()로 무효화하고,
+    ttl 30초는 그 밖의 누락에 대한 안전망.
+    """
+    # 전체 케이스 조회 (DB 필터 없음 - AG Grid에서 필터링)
+    cases = _db.query(Case).options(
+        selectinload(Case.project),
+        selectinload(Case.part),
+        selectinload(Case.assigned_user),
+    ).order_by(Case.created_at.desc()).limit(500).all()
 
-    if not cases:
-        st.info("케이스가 없습니다.")
-        return
+    # 상태/일시중지 사유에는 케이스별 마지막 WorkLog만 필요 (한 번의 쿼리)
+    last_log_by_case = get_last_worklog_rows_by_case(_db, [c.id for c in cases])
 
-    # DataFrame 구성 (AG Grid용)
-    data = []
-    case_map = {}  # id -> case 매핑 (상세 조회용)
+    # 계산 컬럼 (상태/일시중지 사유)은 한 번의 루프로 준비
+    status_col, pause_reason_col = [], []
     for c in cases:
-        worklogs = db.query(WorkLog).filter(WorkLog.case_id == c.id).order_by(WorkLog.timestamp).all()
-        work_seconds = compute_work_seconds(worklogs, auto_timeout)
+        last_log = last_log_by_case.get(c.id)
 
         # Determine status with pause info
         status_display = c.status.value
         pause_reason = ""
-        if c.status == CaseStatus.IN_PROGRESS and worklogs:
-            last_log = worklogs[-1]
+        if c.status == CaseStatus.IN_PROGRESS and last_log:
             if last_log.action_type == ActionType.PAUSE:
                 status_display = "IN_PROGRESS (PAUSED)"
                 if last_log.reason_code:
                     pause_reason = last_log.reason_code
 
-        # 작업일수/시간 통합 포맷
-        man_days = compute_man_days(work_seconds, workday_hours)
-        work_time_str = format_duration(work_seconds)
-        work_days_time = f"{man_days:.2f}일 ({work_time_str})" if work_seconds > 0 else "-"
+        status_col.append(status_display)
+        pause_reason_col.append(pause_reason or "-")
+
+    # DataFrame 구성 (AG Grid용, 컬럼 단위)
+    df = prepare_case_filter_columns(pd.DataFrame({
+        UI_LABELS["id"]: [c.id for c in cases],
+        UI_LABELS["case_uid"]: [c.case_uid for c in cases],
+        UI_LABELS["original_name"]: [c.original_name or c.display_name for c in cases],
+        UI_LABELS["project"]: [c.project.name for c in cases],
+        UI_LABELS["part"]: [c.part.name for c in cases],
+        UI_LABELS["hospital"]: [c.hospital or UI_LABELS["unassigned"] for c in cases],
+        UI_LABELS["slice_thickness"]: [c.slice_thickness_mm or "-" for c in cases],
+        UI_LABELS["difficulty"]: [c.difficulty.value for c in cases],
+        UI_LABELS["status"]: status_col,
+        UI_LABELS["pause_reason"]: pause_reason_col,
+        UI_LABELS["revision"]: [c.revision for c in cases],
+        UI_LABELS["assignee"]: [c.assigned_user.username if c.assigned_user else "-" for c in cases],
+    }))
+
+    return df, [c.id for c in cases]
+
+
+def show_all_cases(db: Session, auto_timeout: int, workday_hours: int):
+    """Show all cases with AG Grid table (Google Sheets style filtering)."""
+    st.subheader("전체 케이스")
 
-        row = {
-            UI_LABELS["id"]: c.id,
-            UI_LABELS["case_uid"]: c.case_uid,
-            UI_LABELS["original_name"]: c.original_name if c.original_name else c.display_name,
-            UI_LABELS["project"]: c.project.name,
-            UI_LABELS["part"]: c.part.name,
-            UI_LABELS["hospital"]: c.hospital or UI_LABELS["unassigned"],
-            UI_LABELS["slice_thickness"]: c.slice_thickness_mm if c.slice_thickness_mm else "-",
-            UI_LABELS["difficulty"]: c.difficulty.value,
-            UI_LABELS["status"]: status_display,
-            UI_LABELS["pause_reason"]: pause_reason if pause_reason else "-",
-            UI_LABELS["revision"]: c.revision,
-            UI_LABELS["assignee"]: c.assigned_user.username if c.assigned_user else "-",
-        }
-        data.append(row)
-        case_map[c.id] = c
+    # 데이터 버전: 케이스 추가/상태·배정 변경(Event)/작업시간(WorkLog)이 바뀌면 갱신
+    from sqlalchemy import func
+
+    case_count, max_case_id = db.query(func.count(Case.id), func.max(Case.id)).one()
+    data_version = (
+        case_count,
+        max_case_id,
+        db.query(func.max(Event.id)).scalar(),
+        db.query(func.max(WorkLog.id)).scalar(),
+    )
+
+    df, case_ids = _build_all_cases_df(data_version, db)
+    total_count = len(case_ids)
 
-    df = pd.DataFrame(data)
+    # 건수 표시
+    st.caption(f"총 {total_count}건 표시 중")
+
+    if not case_ids:
+        st.info("케이스가 없습니다.")
+        return
 
     # 필터 UI + DataFrame 필터링
     filtered_df = render_case_filters(df, "all_cases", show_assignee=True)
+    if filtered_df.empty:
+        # 그리드/케이스 선택/상세 렌더링 생략
+        st.info("조건에 맞는 케이스가 없습니다.")
+        return
 
     # 데이터 개수에 따라 높이 자동 계산 (최대 25행)
     row_count = len(filtered_df)
@@ -3215,6 +3989,7 @@ def show_all_cases(db: Session):
         filtered_df,
         key="all_cases_grid",
         height=auto_height,
+        hide_columns=[CASE_UID_SEARCH_COLUMN],
         user_role="admin",
     )
 
@@ -3231,7 +4006,6 @@ def show_all_cases(db: Session):
 
     # 선택되지 않은 경우 selectbox로 선택
     if selected_case_id is None:
-        case_ids = [c.id for c in cases]
         selected_case_id = st.selectbox("케이스 선택", options=case_ids, format_func=lambda x: f"케이스 {x}")
 
     if selected_case_id:
@@ -3240,18 +4014,29 @@ def show_all_cases(db: Session):
 
 def show_case_detail(db: Session, case_id: int, auto_timeout: int, workday_hours: int):
     """Show detailed case view with metrics."""
-    case = db.query(Case).filter(Case.id == case_id).first()
+    case = db.query(Case).options(
+        joinedload(Case.project),
+        joinedload(Case.part),
+        joinedload(Case.assigned_user),
+        joinedload(Case.preqc_summary),
+        joinedload(Case.autoqc_summary),
+        selectinload(Case.events).selectinload(Event.user),
+        selectinload(Case.review_notes).selectinload(ReviewNote.reviewer),
+    ).filter(Case.id == case_id).first()
     if not case:
         st.error("케이스를 찾을 수 없습니다")
         return
 
-    worklogs = db.query(WorkLog).filter(WorkLog.case_id == case.id).order_by(WorkLog.timestamp).all()
+    worklogs = db.query(WorkLog).options(selectinload(WorkLog.user)).filter(
+        WorkLog.case_id == case.id
+    ).order_by(WorkLog.timestamp).all()
     work_seconds = compute_work_seconds(worklogs, auto_timeout)
     first_start, last_end = get_timeline_dates(worklogs)
 
     # 중단 사유 확인 (PAUSED 상태일 때)
     pause_reason = ""
-    last_action = get_last_worklog_action(db, case.id)
+    # 마지막 작업 기록은 timestamp 순으로 이미 조회한 worklogs에서 사용 (추가 쿼리 없음)
+    last_action = worklogs[-1].action_type if worklogs else None
     is_paused = last_action == ActionType.PAUSE
     if is_paused and worklogs:
         last_log = worklogs[-1]
@@ -3298,37 +4083,40 @@ def show_case_detail(db: Session, case_id: int, auto_timeout: int, workday_hours
 
     # WorkLog timeline
     if worklogs:
-        st.markdown("**작업 기록:**")
-        for wl in worklogs:
-            reason_str = f" ({wl.reason_code})" if wl.reason_code else ""
-            st.write(f"- {wl.timestamp.strftime('%Y-%m-%d %H:%M:%S')} | {wl.action_type.value}{reason_str} | {wl.user.username}")
+        # 기록 전체를 markdown 요소 1개로 전송 (행마다 요소 생성 방지)
+        st.markdown("**작업 기록:**\n" + "\n".join(
+            f"- {wl.timestamp.strftime('%Y-%m-%d %H:%M:%S')} | {wl.action_type.value}"
+            f"{f' ({wl.reason_code})' if wl.reason_code else ''} | {wl.user.username}"
+            for wl in worklogs
+        ))
 
     # Events
     if case.events:
-        st.markdown("**이벤트 이력:**")
         event_icons = {
             "STARTED": "▶️", "SUBMITTED": "📤", "REWORK_REQUESTED": "🔄", "ACCEPTED": "✅",
             "ASSIGN": "📋", "REASSIGN": "🔀", "REJECT": "❌",
             "FEEDBACK_CREATED": "💬", "FEEDBACK_UPDATED": "✏️", "FEEDBACK_DELETED": "🗑️",
             "FEEDBACK_SUBMIT": "📝", "CANCEL": "⛔", "EDIT": "📝",
         }
-        for e in case.events:
-            icon = event_icons.get(e.event_type.value, "📌")
-            detail = f" | {e.event_code}" if e.event_code else ""
-            st.write(f"- {e.created_at.strftime('%m-%d %H:%M')} | {icon} {e.event_type.value} | {e.user.username}{detail}")
+        st.markdown("**이벤트 이력:**\n" + "\n".join(
+            f"- {e.created_at.strftime('%m-%d %H:%M')} | {event_icons.get(e.event_type.value, '📌')} "
+            f"{e.event_type.value} | {e.user.username}{f' | {e.event_code}' if e.event_code else ''}"
+            for e in case.events
+        ))
 
     # Review Notes
     if case.review_notes:
-        st.markdown("**검수 메모:**")
-        for n in case.review_notes:
-            st.write(f"- {n.created_at.strftime('%Y-%m-%d %H:%M')} | {n.reviewer.username}: {n.note_text}")
+        st.markdown("**검수 메모:**\n" + "\n".join(
+            f"- {n.created_at.strftime('%Y-%m-%d %H:%M')} | {n.reviewer.username}: {n.note_text}"
+            for n in case.review_notes
+        ))
 
     # QC 정보
     st.markdown("---")
     st.markdown("### QC 정보")
 
-    preqc = db.query(PreQcSummary).filter(PreQcSummary.case_id == case.id).first()
-    autoqc = db.query(AutoQcSummary).filter(AutoQcSummary.case_id == case.id).first()
+    preqc = case.preqc_summary
+    autoqc = case.autoqc_summary
 
     qc_col1, qc_col2 = st.columns(2)
 
@@ -3410,7 +4198,7 @@ def show_case_detail(db: Session, case_id: int, auto_timeout: int, workday_hours
                     current_issue_count = 0
                     if autoqc.issue_count_json:
                         try:
-                            counts = json.loads(autoqc.issue_count_json)
+                            counts = _json_loads(autoqc.issue_count_json)
                             current_issue_count = counts.get("warn_level", 0) + counts.get("incomplete_level", 0)
                         except json.JSONDecodeError:
                             pass
@@ -3429,7 +4217,7 @@ def show_case_detail(db: Session, case_id: int, auto_timeout: int, workday_hours
                 st.write("📋 누락 세그먼트:")
                 if autoqc.missing_segments_json:
                     try:
-                        missing = json.loads(autoqc.missing_segments_json)
+                        missing = _json_loads(autoqc.missing_segments_json)
                         if missing:
                             for seg in missing:
                                 st.caption(f"  • {seg}")
@@ -3445,7 +4233,7 @@ def show_case_detail(db: Session, case_id: int, auto_timeout: int, workday_hours
                 mismatches = []
                 if autoqc.name_mismatches_json:
                     try:
-                        mismatches = json.loads(autoqc.name_mismatches_json)
+                        mismatches = _json_loads(autoqc.name_mismatches_json)
                         mismatch_count = len(mismatches) if mismatches else 0
                     except json.JSONDecodeError:
                         pass
@@ -3465,7 +4253,7 @@ def show_case_detail(db: Session, case_id: int, auto_timeout: int, workday_hours
                 st.write("📋 이슈 목록:")
                 if autoqc.issues_json:
                     try:
-                        issues = json.loads(autoqc.issues_json)
+                        issues = _json_loads(autoqc.issues_json)
                         if issues:
                             severity_icons = {"WARN": "⚠️", "INCOMPLETE": "❌", "INFO": "ℹ️"}
                             for issue in issues[:10]:
@@ -3487,7 +4275,7 @@ def show_case_detail(db: Session, case_id: int, auto_timeout: int, workday_hours
                 extra_segments_display = "없음"
                 if autoqc.extra_segments_json:
                     try:
-                        extra = json.loads(autoqc.extra_segments_json)
+                        extra = _json_loads(autoqc.extra_segments_json)
                         if extra:
                             extra_segments_display = ", ".join(extra)
                     except json.JSONDecodeError:
@@ -3501,7 +4289,7 @@ def show_case_detail(db: Session, case_id: int, auto_timeout: int, workday_hours
                 inc_cnt = 0
                 if autoqc.issue_count_json:
                     try:
-                        counts = json.loads(autoqc.issue_count_json)
+                        counts = _json_loads(autoqc.issue_count_json)
                         warn_cnt = counts.get("warn_level", 0)
                         inc_cnt = counts.get("incomplete_level", 0)
                     except json.JSONDecodeError:
@@ -3511,6 +4299,30 @@ def show_case_detail(db: Session, case_id: int, auto_timeout: int, workday_hours
                 st.caption("Auto-QC 데이터 없음")
 
 
+def render_page_selector(total: int, page_size: int, key: str) -> int:
+    """
+    총 건수 기준 페이지 번호 입력 (1부터).
+    한 페이지 이하이면 입력 없이 1, 건수가 줄어 범위를 벗어난 페이지는 마지막 페이지로 보정.
+    """
+    page_count = max((total + page_size - 1) // page_size, 1)
+    if page_count == 1:
+        return 1
+    if st.session_state.get(key, 1) > page_count:
+        st.session_state[key] = page_count
+    page = st.number_input(
+        f"페이지 (전체 {page_count})",
+        min_value=1,
+        max_value=page_count,
+        step=1,
+        key=key,
+    )
+    return int(page)
+
+
+# 케이스 배정 표 페이지당 케이스 수
+ASSIGN_PAGE_SIZE = 25
+
+
 def show_assign_cases(db: Session):
     """Show case assignment interface."""
     st.subheader("케이스 배정")
@@ -3521,79 +4333,93 @@ def show_assign_cases(db: Session):
         st.error("로그인이 필요합니다")
         return
 
-    # Get unassigned TODO cases
-    unassigned = db.query(Case).filter(
+    # Get unassigned TODO cases (건수는 COUNT, 행은 표시할 만큼만 조회)
+    from sqlalchemy import func
+
+    unassigned_query = db.query(Case).filter(
         Case.status == CaseStatus.TODO,
         Case.assigned_user_id == None
-    ).order_by(Case.created_at.asc()).all()
+    )
+    total_unassigned = unassigned_query.with_entities(func.count(Case.id)).scalar()
 
-    if not unassigned:
+    if not total_unassigned:
         st.info("미배정 케이스가 없습니다.")
         return
 
-    # Get workers
-    workers = db.query(User).filter(
-        User.role == UserRole.WORKER,
-        User.is_active == True
-    ).all()
+    workers = get_active_workers(db)
 
     if not workers:
         st.warning("활성 작업자가 없습니다.")
         return
 
-    worker_options = {w.username: w.id for w in workers}
-
-    st.write(f"**미배정 케이스 {len(unassigned)}건**")
-
-    for case in unassigned:
-        col1, col2, col3 = st.columns([3, 2, 1])
-
-        with col1:
-            st.write(f"**{case.display_name}** ({case.case_uid})")
-            hospital_info = case.hospital or UI_LABELS["unassigned"]
-            st.caption(f"{case.project.name} / {case.part.name} / {hospital_info} / {case.difficulty.value}")
-
-        with col2:
-            selected_worker = st.selectbox(
+    worker_options = {username: worker_id for worker_id, username in workers}
+
+    st.write(f"**미배정 케이스 {total_unassigned}건**")
+
+    # 오래된 순으로 현재 페이지만 SQL에서 잘라 조회
+    page = render_page_selector(total_unassigned, ASSIGN_PAGE_SIZE, key="assign_cases_page")
+    unassigned = unassigned_query.options(
+        selectinload(Case.project),
+        selectinload(Case.part),
+    ).order_by(Case.created_at.asc()).offset((page - 1) * ASSIGN_PAGE_SIZE).limit(ASSIGN_PAGE_SIZE).all()
+
+    # 케이스별 selectbox/버튼 대신 표 하나에서 담당자를 고르고 한 번에 적용
+    assign_df = pd.DataFrame({
+        UI_LABELS["id"]: [c.id for c in unassigned],
+        UI_LABELS["case_uid"]: [c.case_uid for c in unassigned],
+        UI_LABELS["display_name"]: [c.display_name for c in unassigned],
+        UI_LABELS["project"]: [c.project.name for c in unassigned],
+        UI_LABELS["part"]: [c.part.name for c in unassigned],
+        UI_LABELS["hospital"]: [c.hospital or UI_LABELS["unassigned"] for c in unassigned],
+        UI_LABELS["difficulty"]: [c.difficulty.value for c in unassigned],
+        UI_LABELS["assignee"]: [None] * len(unassigned),
+    })
+    # data_editor는 행 위치 기준으로 편집값을 기억하므로, 페이지가 바뀌거나 배정을 적용해
+    # 다른 케이스가 같은 행에 들어오면 이전 선택이 옮겨 붙지 않도록 키를 새로 만듦
+    editor_nonce = st.session_state.setdefault("assign_cases_editor_nonce", 0)
+    edited_df = st.data_editor(
+        assign_df,
+        key=f"assign_cases_editor_{page}_{editor_nonce}",
+        hide_index=True,
+        use_container_width=True,
+        disabled=[col for col in assign_df.columns if col != UI_LABELS["assignee"]],
+        column_config={
+            UI_LABELS["assignee"]: st.column_config.SelectboxColumn(
                 "담당자 지정",
                 options=list(worker_options.keys()),
-                key=f"assign_select_{case.id}"
-            )
+            ),
+        },
+    )
 
-        with col3:
-            st.write("")
-            if st.button("배정", key=f"assign_btn_{case.id}"):
-                import uuid
-                prev_worker = case.assigned_user.username if case.assigned_user else None
-                new_worker_id = worker_options[selected_worker]
-
-                # 이전 담당자가 있으면 REASSIGN, 없으면 ASSIGN
-                if prev_worker:
-                    event_type = EventType.REASSIGN
-                    event_code = f"{prev_worker} → {selected_worker}"
-                    payload = {"from": prev_worker, "to": selected_worker}
-                else:
-                    event_type = EventType.ASSIGN
-                    event_code = f"{selected_worker}에게 배정"
-                    payload = {"worker": selected_worker}
+    selected = edited_df[edited_df[UI_LABELS["assignee"]].notna()]
+    if st.button(f"배정 적용 ({len(selected)}건)", key="assign_apply_btn", type="primary", disabled=selected.empty):
+        cases_by_id = {c.id: c for c in unassigned}
+        events = []
+        for case_id, worker_name in zip(selected[UI_LABELS["id"]], selected[UI_LABELS["assignee"]]):
+            case = cases_by_id[int(case_id)]
+            case.assigned_user_id = worker_options[worker_name]
 
-                case.assigned_user_id = new_worker_id
+            # Event 생성 (미배정 케이스만 대상이므로 항상 ASSIGN)
+            events.append(Event(
+                case_id=case.id,
+                user_id=user["id"],
+                event_type=EventType.ASSIGN,
+                idempotency_key=f"{EventType.ASSIGN.value}_{case.id}_{uuid.uuid4().hex[:8]}",
+                event_code=f"{worker_name}에게 배정",
+                payload_json=json.dumps({"worker": worker_name}, ensure_ascii=False),
+            ))
+
+        # 배정 변경 + Event를 한 번에 commit
+        db.add_all(events)
+        db.commit()
+        st.session_state.pop(f"assign_cases_editor_{page}_{editor_nonce}", None)
+        st.session_state["assign_cases_editor_nonce"] = editor_nonce + 1
+        st.success(f"{len(events)}건 배정되었습니다")
+        st.rerun()
 
-                # Event 생성
-                event = Event(
-                    case_id=case.id,
-                    user_id=user["id"],
-                    event_type=event_type,
-                    idempotency_key=f"{event_type.value}_{case.id}_{uuid.uuid4().hex[:8]}",
-                    event_code=event_code,
-                    payload_json=json.dumps(payload, ensure_ascii=False),
-                )
-                db.add(event)
-                db.commit()
-                st.success(f"{selected_worker}에게 배정되었습니다")
-                st.rerun()
 
-        st.markdown("---")
+# 이벤트 로그 페이지당 건수 (Event + WorkLog 통합 최신순)
+EVENT_LOG_PAGE_SIZE = 50
 
 
 def show_event_log(db: Session):
@@ -3627,17 +4453,33 @@ def show_event_log(db: Session):
         "REWORK_START": "🔄",
     }
 
-    # Event 조회
-    events = db.query(Event).order_by(Event.created_at.desc()).limit(100).all()
+    from sqlalchemy import func
+
+    total_logs = db.query(func.count(Event.id)).scalar() + db.query(func.count(WorkLog.id)).scalar()
+    if not total_logs:
+        st.info("이벤트가 없습니다.")
+        return
+
+    page = render_page_selector(total_logs, EVENT_LOG_PAGE_SIZE, key="event_log_page")
+    page_end = page * EVENT_LOG_PAGE_SIZE
+
+    # 통합 목록의 page_end번째까지는 각 테이블의 최근 page_end건 안에 있으므로 그만큼만 조회
+    # 케이스/사용자는 selectinload로 한 번에 조회 (행별 쿼리 방지)
+    events = db.query(Event).options(
+        selectinload(Event.case),
+        selectinload(Event.user),
+    ).order_by(Event.created_at.desc()).limit(page_end).all()
 
-    # WorkLog 조회
-    worklogs = db.query(WorkLog).order_by(WorkLog.timestamp.desc()).limit(100).all()
+    worklogs = db.query(WorkLog).options(
+        selectinload(WorkLog.case),
+        selectinload(WorkLog.user),
+    ).order_by(WorkLog.timestamp.desc()).limit(page_end).all()
 
     # 통합 리스트 생성
     all_logs = []
 
     for e in events:
-        case = db.query(Case).filter(Case.id == e.case_id).first()
+        case = e.case
         icon = EVENT_ICONS.get(e.event_type.value, "📌")
         all_logs.append({
             "시간": e.created_at,
@@ -3649,7 +4491,7 @@ def show_event_log(db: Session):
         })
 
     for wl in worklogs:
-        case = db.query(Case).filter(Case.id == wl.case_id).first()
+        case = wl.case
         icon = EVENT_ICONS.get(wl.action_type.value, "⏱️")
         all_logs.append({
             "시간": wl.timestamp,
@@ -3660,15 +4502,9 @@ def show_event_log(db: Session):
             "상세": wl.reason_code or "-",
         })
 
-    if not all_logs:
-        st.info("이벤트가 없습니다.")
-        return
-
-    # 시간순 정렬
+    # 시간순 정렬 후 현재 페이지만 표시
     all_logs.sort(key=lambda x: x["시간"], reverse=True)
-
-    # 상위 50개만 표시
-    display_logs = all_logs[:50]
+    display_logs = all_logs[page_end - EVENT_LOG_PAGE_SIZE:page_end]
 
     # DataFrame 변환
     df = pd.DataFrame(display_logs)
@@ -3681,11 +4517,7 @@ def show_timeoff_management(db: Session, user: dict):
     """Show time-off management interface (ADMIN)."""
     st.subheader("휴무 관리")
 
-    # Get all workers
-    workers = db.query(User).filter(
-        User.role == UserRole.WORKER,
-        User.is_active == True
-    ).all()
+    workers = get_active_workers(db)
 
     if not workers:
         st.info("활성 작업자가 없습니다.")
@@ -3697,7 +4529,7 @@ def show_timeoff_management(db: Session, user: dict):
     col1, col2, col3, col4, col5 = st.columns([2, 2, 2, 2, 1])
 
     with col1:
-        worker_options = {w.username: w.id for w in workers}
+        worker_options = {username: worker_id for worker_id, username in workers}
         selected_worker = st.selectbox(
             "작업자",
             options=list(worker_options.keys()),
@@ -3732,30 +4564,10 @@ def show_timeoff_management(db: Session, user: dict):
             if timeoff_start > timeoff_end:
                 st.error("시작일이 종료일보다 앞서야 합니다")
             else:
-                # Register time-off for each day in range
-                current_date = timeoff_start
-                added_count = 0
-                skipped_dates = []
-
-                while current_date <= timeoff_end:
-                    # Check for duplicate
-                    existing = db.query(UserTimeOff).filter(
-                        UserTimeOff.user_id == worker_options[selected_worker],
-                        UserTimeOff.date == current_date
-                    ).first()
-
-                    if existing:
-                        skipped_dates.append(str(current_date))
-                    else:
-                        timeoff = UserTimeOff(
-                            user_id=worker_options[selected_worker],
-                            date=current_date,
-                            type=TimeOffType(timeoff_type),
-                        )
-                        db.add(timeoff)
-                        added_count += 1
-
-                    current_date += timedelta(days=1)
+                # Register time-off for each day in range (기존 날짜는 건너뜀)
+                added_count, skipped_dates = add_timeoff_range(
+                    db, worker_options[selected_worker], timeoff_start, timeoff_end, TimeOffType(timeoff_type),
+                )
 
                 if added_count > 0:
                     db.commit()
@@ -3787,7 +4599,7 @@ def show_timeoff_management(db: Session, user: dict):
     with col3:
         # Worker filter
         worker_filter_options = {"전체": None}
-        worker_filter_options.update({w.username: w.id for w in workers})
+        worker_filter_options.update({username: worker_id for worker_id, username in workers})
         selected_worker_filter = st.selectbox(
             "작업자",
             options=list(worker_filter_options.keys()),
@@ -3850,10 +4662,7 @@ def show_timeoff_management(db: Session, user: dict):
             st.warning(f"{days_count}개의 연속 휴무가 삭제됩니다.")
 
         if st.button("삭제", key="delete_timeoff_btn"):
-            for tid in selected_ids:
-                timeoff = db.query(UserTimeOff).filter(UserTimeOff.id == tid).first()
-                if timeoff:
-                    db.delete(timeoff)
+            delete_timeoffs(db, selected_ids)
             db.commit()
             st.success(f"{days_count}건 휴무 삭제됨")
             st.rerun()
@@ -3872,7 +4681,7 @@ def show_holiday_management(db: Session, user: dict):
         db.refresh(calendar)
 
     holidays_list = json.loads(calendar.holidays_json)
-    holidays = [date.fromisoformat(d) for d in holidays_list]
+    holidays = _parse_holidays(calendar.holidays_json)
 
     st.write(f"**타임존:** {calendar.timezone}")
     st.write(f"**총 공휴일:** {len(holidays)}일")
@@ -3928,13 +4737,8 @@ def show_holiday_management(db: Session, user: dict):
         st.info("등록된 공휴일이 없습니다.")
         return
 
-    # Group by year
-    holidays_by_year = {}
-    for h in sorted(holidays):
-        year = h.year
-        if year not in holidays_by_year:
-            holidays_by_year[year] = []
-        holidays_by_year[year].append(h)
+    # Group by year (JSON 문자열 기준 캐시)
+    holidays_by_year = _group_holidays_by_year(calendar.holidays_json)
 
     weekday_korean = {
         "Monday": "월요일",
@@ -3980,6 +4784,73 @@ def show_work_statistics(db: Session):
         show_utilization_stats(db)
 
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def _parse_holidays(holidays_json: str) -> tuple:
+    """
+    WorkCalendar.holidays_json → 정렬된 date 튜플 (캐시).
+    JSON 문자열이 캐시 키이므로 공휴일이 추가/삭제되면 자동으로 다시 파싱.
+    """
+    return tuple(sorted(date.fromisoformat(d) for d in json.loads(holidays_json)))
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _group_holidays_by_year(holidays_json: str) -> dict:
+    """연도별 공휴일 목록 {year: [date, ...]} (캐시, 연도 내 날짜 오름차순)."""
+    holidays_by_year = defaultdict(list)
+    for h in _parse_holidays(holidays_json):
+        holidays_by_year[h.year].append(h)
+    return dict(holidays_by_year)
+
+
+def _holidays_in_range(holidays: tuple, start_date: date, end_date: date) -> tuple:
+    """정렬된 공휴일 튜플에서 기간 내 날짜만 이진 탐색으로 잘라냄."""
+    return holidays[bisect.bisect_left(holidays, start_date):bisect.bisect_right(holidays, end_date)]
+
+
+@st.cache_data(show_spinner=False)
+def _cached_count_workdays(start_date: date, end_date: date, holidays: tuple) -> int:
+    """count_workdays 결과 캐시 (입력이 날짜/공휴일뿐인 순수 계산)."""
+    return count_workdays(start_date, end_date, list(holidays))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _compute_performance_stats_cached(
+    start_date: date,
+    end_date: date,
+    workdays: int,
+    selected_workers: tuple,
+    year: int,
+    data_version: tuple,
+    _db: Session,
+) -> tuple[dict, list[dict]]:
+    """
+    성과 탭 집계 (캐시): (compute_performance_stats 결과, compute_monthly_performance 결과).
+    _db는 캐시 키에서 제외되고, 승인 케이스의 데이터 버전이 바뀌면 다시 계산.
+    """
+    cases = _db.query(Case).options(selectinload(Case.assigned_user)).filter(
+        Case.status == CaseStatus.ACCEPTED,
+        Case.accepted_at >= datetime.combine(start_date, datetime.min.time()).replace(tzinfo=TIMEZONE),
+        Case.accepted_at <= datetime.combine(end_date, datetime.max.time()).replace(tzinfo=TIMEZONE),
+    ).all()
+
+    workers = list(selected_workers) or None
+    stats = compute_performance_stats(
+        cases=cases,
+        start_date=start_date,
+        end_date=end_date,
+        workdays=workdays,
+        selected_workers=workers,
+    )
+    monthly_stats = compute_monthly_performance(
+        cases=cases,
+        year=year,
+        start_date=start_date,
+        end_date=end_date,
+        selected_workers=workers,
+    )
+    return stats, monthly_stats
+
+
 def show_performance_tab(db: Session):
     """성과 탭 - 요약 카드 + 작업자별 테이블 + 월별 추이."""
     from calendar import monthrange
@@ -3993,11 +4864,7 @@ def show_performance_tab(db: Session):
 
     # 공휴일 목록 조회
     calendar = db.query(WorkCalendar).first()
-    if calendar:
-        holidays_list = json.loads(calendar.holidays_json)
-        holidays = [date.fromisoformat(d) for d in holidays_list]
-    else:
-        holidays = []
+    holidays = _parse_holidays(calendar.holidays_json) if calendar else ()
 
     # ========== 필터 영역 ==========
     with st.expander("필터", expanded=True):
@@ -4045,23 +4912,19 @@ def show_performance_tab(db: Session):
         st.error("시작일이 종료일보다 앞서야 합니다.")
         return
 
-    # ========== 데이터 조회 ==========
-    cases = db.query(Case).filter(
-        Case.status == CaseStatus.ACCEPTED,
-        Case.accepted_at >= datetime.combine(start_date, datetime.min.time()).replace(tzinfo=TIMEZONE),
-        Case.accepted_at <= datetime.combine(end_date, datetime.max.time()).replace(tzinfo=TIMEZONE),
-    ).all()
-
     # 근무일 수 계산
-    workdays = count_workdays(start_date, end_date, holidays)
+    workdays = _cached_count_workdays(start_date, end_date, _holidays_in_range(holidays, start_date, end_date))
 
-    # 성과 통계 계산
-    stats = compute_performance_stats(
-        cases=cases,
-        start_date=start_date,
-        end_date=end_date,
-        workdays=workdays,
-        selected_workers=selected_workers if selected_workers else None,
+    # ========== 데이터 조회 + 성과 통계 계산 (승인 케이스 데이터 버전 기준 캐시) ==========
+    from sqlalchemy import func
+
+    data_version = tuple(
+        db.query(func.count(Case.id), func.max(Case.id), func.max(Case.accepted_at))
+        .filter(Case.status == CaseStatus.ACCEPTED)
+        .one()
+    )
+    stats, monthly_stats = _compute_performance_stats_cached(
+        start_date, end_date, workdays, tuple(selected_workers), year, data_version, db,
     )
 
     # ========== 1) 전체 요약 (상단 카드 4개) ==========
@@ -4128,14 +4991,6 @@ def show_performance_tab(db: Session):
 
     if month_select == "전체":
         # 전체: 12개월 표시
-        monthly_stats = compute_monthly_performance(
-            cases=cases,
-            year=year,
-            start_date=start_date,
-            end_date=end_date,
-            selected_workers=selected_workers if selected_workers else None,
-        )
-
         monthly_data = []
         for m in monthly_stats:
             if m["in_range"]:
@@ -4212,28 +5067,14 @@ def show_performance_tab(db: Session):
         # 특정월: 1행만 표시
         month_num = int(month_select.replace("월", ""))
 
-        # 해당 월 집계 (이미 조회된 cases에서 필터링)
-        completed = 0
-        rework = 0
-        for case in cases:
-            if not case.assigned_user:
-                continue
-            if selected_workers and case.assigned_user.username not in selected_workers:
-                continue
-            completed += 1
-            if case.revision > 1:
-                rework += 1
-
-        first_pass = completed - rework
-        rework_rate = (rework / completed * 100) if completed > 0 else 0
-        first_pass_rate = (first_pass / completed * 100) if completed > 0 else 0
-
+        # 조회 기간이 해당 월이므로 전체 합계가 곧 월 집계
+        totals = stats["totals"]
         monthly_data = [{
             "월": f"{year}-{month_num:02d}",
-            "완료": completed,
-            "재작업": rework,
-            "재작업률(%)": round(rework_rate, 1),
-            "1차 통과율(%)": round(first_pass_rate, 1),
+            "완료": totals["completed"],
+            "재작업": totals["rework"],
+            "재작업률(%)": totals["rework_rate"],
+            "1차 통과율(%)": totals["first_pass_rate"],
         }]
 
         monthly_df = pd.DataFrame(monthly_data)
@@ -4255,9 +5096,13 @@ def show_performance_tab(db: Session):
 
 def show_distribution_stats(db: Session):
     """분포 - 병원별/부위별."""
-    # 작업자 목록 조회
-    workers = db.query(User).filter(User.role == UserRole.WORKER).all()
-    worker_names = sorted([w.username for w in workers])
+    from sqlalchemy import func
+
+    # 작업자 이름만 DB에서 정렬/중복 제거해 조회 (필터 옵션용)
+    worker_names = [
+        row.username
+        for row in db.query(User.username).filter(User.role == UserRole.WORKER).distinct().order_by(User.username).all()
+    ]
 
     # 필터
     with st.expander("필터", expanded=False):
@@ -4276,33 +5121,38 @@ def show_distribution_stats(db: Session):
             key="dist_worker_filter"
         )
 
-    # 케이스 조회
-    cases = db.query(Case).filter(
-        Case.created_at >= datetime.combine(start_date, datetime.min.time()).replace(tzinfo=TIMEZONE),
-        Case.created_at <= datetime.combine(end_date, datetime.max.time()).replace(tzinfo=TIMEZONE),
-    ).all()
+    # (작업자, 병원/부위)별 케이스 수를 DB에서 GROUP BY로 집계 (케이스별 관계 lazy load 방지)
+    key_column = Case.hospital if dist_type == "병원별" else Part.name
+    rows = (
+        db.query(User.username, key_column, func.count(Case.id))
+        .select_from(Case)
+        .outerjoin(User, Case.assigned_user_id == User.id)
+        .join(Part, Case.part_id == Part.id)
+        .filter(
+            Case.created_at >= datetime.combine(start_date, datetime.min.time()).replace(tzinfo=TIMEZONE),
+            Case.created_at <= datetime.combine(end_date, datetime.max.time()).replace(tzinfo=TIMEZONE),
+        )
+        .group_by(User.username, key_column)
+        .all()
+    )
 
-    if not cases:
+    if not rows:
         st.info("해당 기간에 케이스가 없습니다.")
         return
 
     # 집계
     distribution = {}
-    for case in cases:
-        username = case.assigned_user.username if case.assigned_user else "미배정"
+    for username, key, count in rows:
+        username = username or "미배정"
 
         # 작업자 필터 적용
         if selected_workers and username not in selected_workers:
             continue
 
-        if dist_type == "병원별":
-            key = case.hospital or "미지정"
-        else:
-            key = case.part.name
-
+        key = key or "미지정"
         if username not in distribution:
             distribution[username] = {}
-        distribution[username][key] = distribution[username].get(key, 0) + 1
+        distribution[username][key] = distribution[username].get(key, 0) + count
 
     if not distribution:
         st.info("해당 조건에 맞는 데이터가 없습니다.")
@@ -4346,13 +5196,32 @@ def show_capacity_metrics(db: Session):
     """Show team capacity metrics."""
     st.markdown("### 팀 가용량 지표")
 
+    # 기간/작업자 필터 변경 시 가용량 영역만 rerun
+    _render_capacity_metrics_fragment()
+
+
+@_fragment
+def _render_capacity_metrics_fragment():
+    """
+    가용량 필터/집계 영역 (fragment 단위 rerun).
+    fragment rerun 시 바깥 세션은 닫혀 있으므로 세션을 따로 열어 조회.
+    """
+    db = get_db()
+    try:
+        _render_capacity_metrics_body(db)
+    finally:
+        db.close()
+
+
+def _render_capacity_metrics_body(db: Session):
+    """가용량 필터 + 기간 요약 + 작업자별/팀 가용량."""
     # Get configs
     workday_hours = get_config_value(db, "workday_hours", 8)
     auto_timeout = get_config_value(db, "auto_timeout_minutes", 120)
 
     # 작업자 목록 조회
-    all_workers = db.query(User).filter(User.role == UserRole.WORKER, User.is_active == True).all()
-    worker_names = sorted([w.username for w in all_workers])
+    all_workers = get_active_workers(db)
+    worker_names = sorted([username for _, username in all_workers])
 
     # 필터
     with st.expander("필터", expanded=False):
@@ -4388,15 +5257,12 @@ def show_capacity_metrics(db: Session):
         return
 
     # Get holidays
+    # 기간 내 공휴일만 사용 (캐시 키/작업자별 계산 모두 기간 크기에 비례)
     calendar = db.query(WorkCalendar).first()
-    if calendar:
-        holidays_list = json.loads(calendar.holidays_json)
-        holidays = [date.fromisoformat(d) for d in holidays_list]
-    else:
-        holidays = []
+    holidays = list(_holidays_in_range(_parse_holidays(calendar.holidays_json), start_date, end_date)) if calendar else []
 
     # Count workdays in period
-    total_workdays = count_workdays(start_date, end_date, holidays)
+    total_workdays = _cached_count_workdays(start_date, end_date, tuple(holidays))
 
     st.markdown("---")
 
@@ -4414,7 +5280,7 @@ def show_capacity_metrics(db: Session):
 
     # Get workers (filtered)
     if selected_workers:
-        workers = [w for w in all_workers if w.username in selected_workers]
+        workers = [(worker_id, username) for worker_id, username in all_workers if username in selected_workers]
     else:
         workers = all_workers
 
@@ -4424,33 +5290,42 @@ def show_capacity_metrics(db: Session):
 
     st.markdown("### 작업자별 가용량")
 
-    # Calculate metrics for each worker
+    # 작업자 전체의 휴무/WorkLog를 한 번씩 조회 후 user_id로 묶음 (작업자별 쿼리 방지)
+    worker_ids = [worker_id for worker_id, _ in workers]
+    timeoffs_by_user = defaultdict(list)
+    for t in db.query(UserTimeOff).filter(
+        UserTimeOff.user_id.in_(worker_ids),
+        UserTimeOff.date >= start_date,
+        UserTimeOff.date <= end_date
+    ).all():
+        timeoffs_by_user[t.user_id].append(t)
+
+    # compute_work_seconds는 timestamp/action_type만 쓰므로 WorkLog 엔티티 대신 컬럼만 조회
+    worklogs_by_user = defaultdict(list)
+    for wl in db.query(WorkLog.user_id, WorkLog.timestamp, WorkLog.action_type).filter(
+        WorkLog.user_id.in_(worker_ids),
+        WorkLog.timestamp >= datetime.combine(start_date, datetime.min.time()).replace(tzinfo=TIMEZONE),
+        WorkLog.timestamp <= datetime.combine(end_date, datetime.max.time()).replace(tzinfo=TIMEZONE),
+    ).order_by(WorkLog.user_id, WorkLog.timestamp).all():
+        worklogs_by_user[wl.user_id].append(wl)
+
+    # Calculate metrics for each worker (공휴일 set은 작업자 루프 밖에서 한 번만 생성)
+    holiday_set = frozenset(holidays)
     worker_data = []
     total_available = 0.0
     total_actual = 0.0
 
-    for worker in workers:
-        # Get time-offs
-        timeoffs = db.query(UserTimeOff).filter(
-            UserTimeOff.user_id == worker.id,
-            UserTimeOff.date >= start_date,
-            UserTimeOff.date <= end_date
-        ).all()
-
-        # Get worklogs
-        worklogs = db.query(WorkLog).filter(
-            WorkLog.user_id == worker.id,
-            WorkLog.timestamp >= datetime.combine(start_date, datetime.min.time()).replace(tzinfo=TIMEZONE),
-            WorkLog.timestamp <= datetime.combine(end_date, datetime.max.time()).replace(tzinfo=TIMEZONE),
-        ).order_by(WorkLog.timestamp).all()
+    for worker_id, username in workers:
+        timeoffs = timeoffs_by_user[worker_id]
+        worklogs = worklogs_by_user[worker_id]
 
         # Compute metrics
         metrics = compute_capacity_metrics(
-            user_id=worker.id,
-            username=worker.username,
+            user_id=worker_id,
+            username=username,
             start_date=start_date,
             end_date=end_date,
-            holidays=holidays,
+            holidays=holiday_set,
             timeoffs=timeoffs,
             worklogs=worklogs,
             workday_hours=workday_hours,
@@ -4548,30 +5423,10 @@ def show_worker_timeoff(db: Session, user: dict):
             if my_timeoff_start > my_timeoff_end:
                 st.error("시작일이 종료일보다 앞서야 합니다")
             else:
-                # Register time-off for each day in range
-                current_date = my_timeoff_start
-                added_count = 0
-                skipped_dates = []
-
-                while current_date <= my_timeoff_end:
-                    # Check for duplicate
-                    existing = db.query(UserTimeOff).filter(
-                        UserTimeOff.user_id == user["id"],
-                        UserTimeOff.date == current_date
-                    ).first()
-
-                    if existing:
-                        skipped_dates.append(str(current_date))
-                    else:
-                        timeoff = UserTimeOff(
-                            user_id=user["id"],
-                            date=current_date,
-                            type=TimeOffType(timeoff_type),
-                        )
-                        db.add(timeoff)
-                        added_count += 1
-
-                    current_date += timedelta(days=1)
+                # Register time-off for each day in range (기존 날짜는 건너뜀)
+                added_count, skipped_dates = add_timeoff_range(
+                    db, user["id"], my_timeoff_start, my_timeoff_end, TimeOffType(timeoff_type),
+                )
 
                 if added_count > 0:
                     db.commit()
@@ -4630,10 +5485,7 @@ def show_worker_timeoff(db: Session, user: dict):
             st.warning(f"{days_count}개의 연속 휴무가 취소됩니다.")
 
         if st.button("휴무 취소", key="delete_my_timeoff_btn"):
-            for tid in selected_ids:
-                timeoff = db.query(UserTimeOff).filter(UserTimeOff.id == tid).first()
-                if timeoff:
-                    db.delete(timeoff)
+            delete_timeoffs(db, selected_ids)
             db.commit()
             st.success(f"{days_count}건 휴무 취소됨")
             st.rerun()
@@ -4768,7 +5620,7 @@ def show_qc_summary(db: Session):
             missing_segments = "-"
             if aqc.missing_segments_json:
                 try:
-                    missing_list = json.loads(aqc.missing_segments_json)
+                    missing_list = _json_loads(aqc.missing_segments_json)
                     if missing_list:
                         missing_segments = ", ".join(missing_list)
                 except json.JSONDecodeError:
@@ -4778,7 +5630,7 @@ def show_qc_summary(db: Session):
             name_mismatch_count = "-"
             if aqc.name_mismatches_json:
                 try:
-                    mismatches = json.loads(aqc.name_mismatches_json)
+                    mismatches = _json_loads(aqc.name_mismatches_json)
                     if mismatches:
                         name_mismatch_count = str(len(mismatches))
                 except json.JSONDecodeError:
@@ -4789,7 +5641,7 @@ def show_qc_summary(db: Session):
             incomplete_count = 0
             if aqc.issue_count_json:
                 try:
-                    counts = json.loads(aqc.issue_count_json)
+                    counts = _json_loads(aqc.issue_count_json)
                     warn_count = counts.get("warn_level", 0)
                     incomplete_count = counts.get("incomplete_level", 0)
                 except json.JSONDecodeError:
@@ -5139,6 +5991,31 @@ def _get_reviewer_disagreement_stats(db: Session, start_date=None, end_date=None
     검수자 기록 기반 불일치 통계를 계산하는 공통 함수.
     요약 섹션과 상세 섹션에서 동일한 기준으로 사용.
 
+    ReviewerQcFeedback 테이블의 데이터 버전(건수/최대 ID/최종 수정 시각)을
+    캐시 키에 포함하므로, 기록이 추가/수정/삭제되면 즉시 다시 계산됨.
+    (필터와 무관한 rerun에서만 재계산을 건너뜀)
+
+    Returns:
+        dict: _compute_reviewer_disagreement_stats 참고
+    """
+    from sqlalchemy import func
+
+    data_version = tuple(
+        db.query(
+            func.count(ReviewerQcFeedback.id),
+            func.max(ReviewerQcFeedback.id),
+            func.max(ReviewerQcFeedback.updated_at),
+        ).one()
+    )
+    return _compute_reviewer_disagreement_stats(db, start_date, end_date, data_version)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _compute_reviewer_disagreement_stats(_db: Session, start_date, end_date, data_version: tuple):
+    """
+    불일치 통계 실제 계산 (캐시).
+    _db는 캐시 키에서 제외되고 (start_date, end_date, data_version)이 키가 됨.
+
     Returns:
         dict: {
             "missed_count": int,
@@ -5153,7 +6030,7 @@ def _get_reviewer_disagreement_stats(db: Session, start_date=None, end_date=None
 
     # 기본 쿼리
     query = (
-        db.query(ReviewerQcFeedback, Case)
+        _db.query(ReviewerQcFeedback, Case)
         .join(Case, ReviewerQcFeedback.case_id == Case.id)
         .filter(ReviewerQcFeedback.has_disagreement == True)
     )
@@ -5214,6 +6091,50 @@ def _get_reviewer_disagreement_stats(db: Session, start_date=None, end_date=None
     }
 
 
+def _build_discrepancy_df(records: list[dict]) -> pd.DataFrame:
+    """불일치 기록 요약 테이블 생성 (상세 내용 20자 제한, 벡터 연산)."""
+    df = pd.DataFrame(records)
+    detail = df["detail"].fillna("-").replace("", "-")
+    detail = detail.where(detail.str.len() <= 20, detail.str.slice(0, 20) + "...")
+    return pd.DataFrame({
+        "케이스 ID": df["case_uid"],
+        "세그먼트": df["segments"].map(lambda segs: ", ".join(segs) if segs else "-"),
+        "상세 내용": detail,
+        "검수자": df["reviewer"],
+        "날짜": df["created_at"],
+    })
+
+
+def _render_discrepancy_section(header: str, records: list[dict]) -> None:
+    """불일치 유형별 상세 섹션 렌더링 (요약 테이블 + 기록별 expander)."""
+    st.markdown(header)
+    if not records:
+        st.caption("없음")
+        return
+
+    # 요약 테이블 (20자 제한)
+    render_table_df(_build_discrepancy_df(records), max_rows=10)
+
+    # 상세 내용 expander (expander당 markdown 요소 1개로 묶어서 전송)
+    st.markdown("##### 상세 내용 보기")
+    for r in records:
+        segments_text = ", ".join(r["segments"]) if r["segments"] else "-"
+        detail_html = html.escape(r["detail"] if r["detail"] else "-").replace("\n", "<br>")
+        with st.expander(f"📋 {r['case_uid']} - {r['reviewer']} ({r['created_at']})"):
+            st.markdown(
+                "<div>"
+                f"<b>케이스 ID:</b> {html.escape(r['case_uid'])}<br>"
+                f"<b>검수자:</b> {html.escape(r['reviewer'])}<br>"
+                f"<b>날짜:</b> {html.escape(r['created_at'])}<br>"
+                f"<b>세그먼트:</b> {html.escape(segments_text)}<br>"
+                "<b>상세 내용:</b>"
+                "<div style='border:1px solid rgba(49,51,63,0.2);border-radius:0.5rem;"
+                f"padding:8px 12px;margin-top:4px'>{detail_html}</div>"
+                "</div>",
+                unsafe_allow_html=True,
+            )
+
+
 def show_qc_disagreement_analysis(db: Session):
     """Show QC disagreement analysis (ADMIN only)."""
     st.subheader("QC 불일치 분석")
@@ -5226,6 +6147,25 @@ def show_qc_disagreement_analysis(db: Session):
 
     st.markdown("---")
 
+    # 기간 변경 시 불일치 집계 영역만 rerun
+    _render_qc_disagreement_fragment()
+
+
+@_fragment
+def _render_qc_disagreement_fragment():
+    """
+    QC 불일치 기간 필터/집계 영역 (fragment 단위 rerun).
+    fragment rerun 시 바깥 세션은 닫혀 있으므로 세션을 따로 열어 조회.
+    """
+    db = get_db()
+    try:
+        _render_qc_disagreement_body(db)
+    finally:
+        db.close()
+
+
+def _render_qc_disagreement_body(db: Session):
+    """QC 불일치 기간 필터 + 요약 + 상세."""
     # Date range filter
     col1, col2 = st.columns(2)
     with col1:
@@ -5267,87 +6207,21 @@ def show_qc_disagreement_analysis(db: Session):
     if stats["total_count"] == 0:
         st.info("선택한 기간에 검수자가 기록한 불일치 내용이 없습니다.")
     else:
-        # ===== 놓친 문제 상세 테이블 =====
-        st.markdown("#### 놓친 문제 상세")
-        if missed_records:
-            # 요약 테이블 (20자 제한)
-            missed_data = []
-            for r in missed_records:
-                detail_text = r["detail"] if r["detail"] else "-"
-                truncated = (detail_text[:20] + "...") if len(detail_text) > 20 else detail_text
-                missed_data.append({
-                    "케이스 ID": r["case_uid"],
-                    "세그먼트": ", ".join(r["segments"]) if r["segments"] else "-",
-                    "상세 내용": truncated,
-                    "검수자": r["reviewer"],
-                    "날짜": r["created_at"],
-                })
-            missed_df = pd.DataFrame(missed_data)
-            render_table_df(missed_df, max_rows=10)
-
-            # 상세 내용 expander
-            st.markdown("##### 상세 내용 보기")
-            for i, r in enumerate(missed_records):
-                with st.expander(f"📋 {r['case_uid']} - {r['reviewer']} ({r['created_at']})"):
-                    st.markdown(f"**케이스 ID:** {r['case_uid']}")
-                    st.markdown(f"**검수자:** {r['reviewer']}")
-                    st.markdown(f"**날짜:** {r['created_at']}")
-                    st.markdown(f"**세그먼트:** {', '.join(r['segments']) if r['segments'] else '-'}")
-                    st.markdown("**상세 내용:**")
-                    detail_text = r["detail"] if r["detail"] else "-"
-                    with st.container(border=True):
-                        st.markdown(detail_text)
-        else:
-            st.caption("없음")
-
-        # ===== 잘못된 경고 상세 테이블 =====
-        st.markdown("#### 잘못된 경고 상세")
-        if false_alarm_records:
-            # 요약 테이블 (20자 제한)
-            false_alarm_data = []
-            for r in false_alarm_records:
-                detail_text = r["detail"] if r["detail"] else "-"
-                truncated = (detail_text[:20] + "...") if len(detail_text) > 20 else detail_text
-                false_alarm_data.append({
-                    "케이스 ID": r["case_uid"],
-                    "세그먼트": ", ".join(r["segments"]) if r["segments"] else "-",
-                    "상세 내용": truncated,
-                    "검수자": r["reviewer"],
-                    "날짜": r["created_at"],
-                })
-            false_alarm_df = pd.DataFrame(false_alarm_data)
-            render_table_df(false_alarm_df, max_rows=10)
-
-            # 상세 내용 expander
-            st.markdown("##### 상세 내용 보기")
-            for i, r in enumerate(false_alarm_records):
-                with st.expander(f"📋 {r['case_uid']} - {r['reviewer']} ({r['created_at']})"):
-                    st.markdown(f"**케이스 ID:** {r['case_uid']}")
-                    st.markdown(f"**검수자:** {r['reviewer']}")
-                    st.markdown(f"**날짜:** {r['created_at']}")
-                    st.markdown(f"**세그먼트:** {', '.join(r['segments']) if r['segments'] else '-'}")
-                    st.markdown("**상세 내용:**")
-                    detail_text = r["detail"] if r["detail"] else "-"
-                    with st.container(border=True):
-                        st.markdown(detail_text)
-        else:
-            st.caption("없음")
+        # ===== 놓친 문제 / 잘못된 경고 상세 테이블 =====
+        _render_discrepancy_section("#### 놓친 문제 상세", missed_records)
+        _render_discrepancy_section("#### 잘못된 경고 상세", false_alarm_records)
 
         # ===== 세그먼트별 불일치 통계 테이블 =====
         st.markdown("#### 세그먼트별 불일치 통계")
         if segment_stats:
-            segment_data = []
-            for seg, stats in sorted(segment_stats.items()):
-                total = stats["missed"] + stats["false_alarm"]
-                segment_data.append({
-                    "세그먼트": seg,
-                    "놓친 문제": stats["missed"],
-                    "잘못된 경고": stats["false_alarm"],
-                    "총": total,
-                })
-            # 총 건수 기준 내림차순 정렬
-            segment_data.sort(key=lambda x: x["총"], reverse=True)
-            segment_df = pd.DataFrame(segment_data)
+            segment_df = pd.DataFrame({
+                "세그먼트": list(segment_stats.keys()),
+                "놓친 문제": [v["missed"] for v in segment_stats.values()],
+                "잘못된 경고": [v["false_alarm"] for v in segment_stats.values()],
+            })
+            segment_df["총"] = segment_df["놓친 문제"] + segment_df["잘못된 경고"]
+            # 총 건수 내림차순, 동률이면 세그먼트 이름순 (정렬 1회)
+            segment_df = segment_df.sort_values(["총", "세그먼트"], ascending=[False, True], ignore_index=True)
             render_table_df(segment_df, max_rows=10)
         else:
             st.caption("세그먼트 정보가 없습니다.")
@@ -5356,6 +6230,8 @@ def show_qc_disagreement_analysis(db: Session):
 # ============== Main ==============
 def main():
     """Main entry point."""
+    inject_global_css()
+
     if st.session_state.user is None:
         show_login()
     else:
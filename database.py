@@ -5,24 +5,47 @@ Uses SQLite with WAL mode for concurrency stability.
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
-from config import DATABASE_URL
+from config import API_THREAD_LIMIT, DATABASE_URL
 from models import Base
 
+# 파일 DB는 QueuePool 크기를 명시 (API 동시 요청 + 대시보드 세션이 커넥션을 재사용)
+# 동기 엔드포인트 스레드마다 get_db 세션을 잡으므로 최대 커넥션 수 = API_THREAD_LIMIT
+# (풀이 더 작으면 남는 스레드가 pool_timeout 후 TimeoutError로 실패)
+# SQLite 쓰기는 여전히 한 번에 하나이며, 동시 쓰기는 busy_timeout 안에서 순서대로 대기
+# :memory: DB는 SingletonThreadPool이라 풀 크기 옵션을 받지 않음
+POOL_SIZE = 20
+_pool_options = {} if ":memory:" in DATABASE_URL else {
+    "pool_size": POOL_SIZE,
+    "max_overflow": max(API_THREAD_LIMIT - POOL_SIZE, 0),
+    "pool_timeout": 30,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+}
+
 # Create engine with SQLite optimizations
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # Required for SQLite with FastAPI
     echo=False,
+    **_pool_options,
 )
 
 
 # Enable WAL mode for better concurrency
+# WAL + synchronous=NORMAL: commit은 WAL 파일에 append만 하고 fsync는 체크포인트 때만 수행.
+# 따라서 UI 핸들러의 동기 commit도 짧으며, 쓰기 지연(write-behind) 큐는 두지 않음
+# (commit 직후 rerun에서 WIP/상태를 다시 읽으므로 비동기 쓰기는 정합성을 깨뜨림).
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.execute("PRAGMA busy_timeout=5000")
+    # 읽기 경로 튜닝: 페이지 캐시 64MB, 파일 mmap 256MB, 임시 테이블/정렬은 메모리
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA wal_autocheckpoint=1000")
     cursor.close()
 
 
@@ -34,6 +57,11 @@ def init_db():
     """Create all tables."""
     Base.metadata.create_all(bind=engine)
 
+    # create_all은 기존 테이블에 새 인덱스를 추가하지 않으므로 누락분만 생성
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
 
 def get_db():
     """Dependency for FastAPI to get DB session."""
@@ -2,9 +2,11 @@
 FastAPI Main Application.
 Sync mode for simplicity and SQLite compatibility.
 """
-from fastapi import FastAPI
+from anyio.to_thread import current_default_thread_limiter
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from config import API_THREAD_LIMIT
 from database import init_db
 from routes import router, TAGS_METADATA
 
@@ -54,12 +56,13 @@ X-API-Key: your_api_key_here
 )
 
 # CORS (allow Streamlit dashboard)
+# 메서드/헤더는 API가 실제로 쓰는 것만 명시 (와일드카드는 요청마다 요청 헤더를 그대로 반사)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["X-API-Key", "Content-Type"],
 )
 
 # Include routes
@@ -70,6 +73,13 @@ app.include_router(router)
 def on_startup():
     """Initialize database on startup."""
     init_db()
+    # 동기 엔드포인트가 기본 40스레드에서 줄 서지 않도록 스레드풀 확장
+    current_default_thread_limiter().total_tokens = API_THREAD_LIMIT
+
+
+# 헬스 체크 응답 본문은 고정이므로 미리 직렬화 (프로브마다 JSON 인코딩 생략)
+_ROOT_BODY = b'{"status":"ok","service":"qc-management-system"}'
+_HEALTH_BODY = b'{"status":"healthy"}'
 
 
 @app.get(
@@ -78,9 +88,9 @@ def on_startup():
     summary="서비스 상태 확인",
     description="서비스가 정상 동작 중인지 확인합니다. 인증 불필요.",
 )
-def root():
+async def root():
     """Health check."""
-    return {"status": "ok", "service": "qc-management-system"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get(
@@ -89,6 +99,6 @@ def root():
     summary="헬스 체크",
     description="서비스 헬스 체크 엔드포인트. 인증 불필요.",
 )
-def health():
+async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -2,12 +2,36 @@
 Metrics calculation functions.
 All metrics are computed on-the-fly, never stored in DB.
 """
-from datetime import date, datetime, timedelta
-from typing import Optional
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional, Union
 
 from config import TIMEZONE
 from models import ActionType, TimeOffType, UserTimeOff, WorkLog
 
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 compute_work_seconds는 항상 스칼라 루프 사용
+    np = None
+
+# compute_work_seconds 벡터 경로 최소 로그 수 (이보다 적으면 배열 생성 비용이 더 큼)
+_VECTORIZE_MIN_WORKLOGS = 64
+
+# 작업 세션 시작/종료 액션 (로그마다 튜플을 만들지 않도록 모듈 상수로 둠)
+_START_ACTIONS = frozenset({ActionType.START, ActionType.RESUME, ActionType.REWORK_START})
+_END_ACTIONS = frozenset({ActionType.PAUSE, ActionType.SUBMIT})
+# RESUME을 제외한 시작 (타임라인의 최초 시작 시각 기준)
+_HARD_START = frozenset({ActionType.START, ActionType.REWORK_START})
+
+# 휴무 유형별 차감 시간
+_TIMEOFF_HOURS = {TimeOffType.VACATION: 8.0, TimeOffType.HALF_DAY: 4.0}
+
+# 세션 시작 = 1, 세션 종료 = -1, 그 외 = 0
+_ACTION_CODE = {
+    **{action: 1 for action in _START_ACTIONS},
+    **{action: -1 for action in _END_ACTIONS},
+}
+
 
 def ensure_tz_aware(dt: Optional[datetime]) -> Optional[datetime]:
     """
@@ -51,15 +75,18 @@ def compute_work_seconds(
         reference_time = datetime.now(TIMEZONE)
 
     timeout_seconds = auto_timeout_minutes * 60
+    if np is not None and len(worklogs) >= _VECTORIZE_MIN_WORKLOGS:
+        return _compute_work_seconds_vectorized(worklogs, timeout_seconds, reference_time)
+
     total_seconds = 0
     session_start: Optional[datetime] = None
 
     for log in worklogs:
         log_timestamp = ensure_tz_aware(log.timestamp)
-        if log.action_type in (ActionType.START, ActionType.RESUME, ActionType.REWORK_START):
+        if log.action_type in _START_ACTIONS:
             # Begin new session
             session_start = log_timestamp
-        elif log.action_type in (ActionType.PAUSE, ActionType.SUBMIT):
+        elif log.action_type in _END_ACTIONS:
             # End session
             if session_start is not None:
                 duration = (log_timestamp - session_start).total_seconds()
@@ -78,6 +105,48 @@ def compute_work_seconds(
     return int(total_seconds)
 
 
+def _compute_work_seconds_vectorized(
+    worklogs: list[WorkLog],
+    timeout_seconds: int,
+    reference_time: datetime,
+) -> int:
+    """
+    compute_work_seconds의 NumPy 경로 (스칼라 루프와 같은 규칙).
+
+    시작/종료 로그만 남기면 세션은 (시작, 종료)로 바로 이웃한 쌍이고,
+    마지막 로그가 시작이면 reference_time까지 진행 중인 세션.
+    시각은 마이크로초 정수로 계산해 합산 오차를 없앰.
+    """
+    count = len(worklogs)
+    timestamps = np.fromiter(
+        (round(ensure_tz_aware(log.timestamp).timestamp() * 1_000_000) for log in worklogs),
+        dtype=np.int64,
+        count=count,
+    )
+    codes = np.fromiter(
+        (_ACTION_CODE.get(log.action_type, 0) for log in worklogs),
+        dtype=np.int8,
+        count=count,
+    )
+
+    marked = np.flatnonzero(codes)
+    if marked.size == 0:
+        return 0
+    timestamps, codes = timestamps[marked], codes[marked]
+
+    timeout_us = timeout_seconds * 1_000_000
+    is_session = (codes[:-1] == 1) & (codes[1:] == -1)
+    durations = timestamps[1:][is_session] - timestamps[:-1][is_session]
+    total_us = int(np.minimum(durations, timeout_us).sum())
+
+    # Handle ongoing session (started but not paused/submitted)
+    if codes[-1] == 1:
+        ongoing_us = round(reference_time.timestamp() * 1_000_000) - int(timestamps[-1])
+        total_us += min(ongoing_us, timeout_us)
+
+    return int(total_us / 1_000_000)
+
+
 def format_duration(seconds: int) -> str:
     """
     Format seconds into human-readable duration.
@@ -95,7 +164,12 @@ def format_duration(seconds: int) -> str:
     """
     if seconds < 0:
         seconds = 0
+    return _format_duration(seconds)
 
+
+@lru_cache(maxsize=8192)
+def _format_duration(seconds: int) -> str:
+    """format_duration 본체 (음수 보정 후 값 기준 캐시; 표마다 같은 값이 반복됨)."""
     hours = seconds // 3600
     minutes = (seconds % 3600) // 60
 
@@ -171,13 +245,13 @@ def get_timeline_dates(worklogs: list[WorkLog]) -> tuple[Optional[datetime], Opt
 
     for log in worklogs:
         log_timestamp = ensure_tz_aware(log.timestamp)
-        if log.action_type in (ActionType.START, ActionType.REWORK_START):
+        if log.action_type in _HARD_START:
             if first_start is None:
                 first_start = log_timestamp
             is_working = True
         elif log.action_type == ActionType.RESUME:
             is_working = True
-        elif log.action_type in (ActionType.PAUSE, ActionType.SUBMIT):
+        elif log.action_type in _END_ACTIONS:
             last_end = log_timestamp
             is_working = False
 
@@ -212,7 +286,7 @@ def weighted_throughput(
 def count_workdays(
     start_date: date,
     end_date: date,
-    holidays: list[date],
+    holidays: Union[list[date], frozenset[date]],
 ) -> int:
     """
     Count workdays between two dates (inclusive), excluding weekends and holidays.
@@ -220,7 +294,7 @@ def count_workdays(
     Args:
         start_date: Start date (inclusive)
         end_date: End date (inclusive)
-        holidays: List of holiday dates
+        holidays: List of holiday dates (set/frozenset이면 그대로 사용)
 
     Returns:
         Number of workdays
@@ -228,16 +302,19 @@ def count_workdays(
     if start_date > end_date:
         return 0
 
-    holiday_set = set(holidays)
-    workdays = 0
-    current = start_date
-
-    while current <= end_date:
-        # weekday(): 0=Monday, 6=Sunday
-        if current.weekday() < 5 and current not in holiday_set:
-            workdays += 1
-        current += timedelta(days=1)
-
+    # 일 단위 루프 대신 주 단위로 계산: 완전한 주는 5일, 남은 날(7일 미만)만 요일 확인
+    full_weeks, remainder = divmod((end_date - start_date).days + 1, 7)
+    start_weekday = start_date.weekday()  # 0=Monday, 6=Sunday
+    workdays = full_weeks * 5 + sum(
+        1 for offset in range(remainder) if (start_weekday + offset) % 7 < 5
+    )
+
+    # 기간 내 평일 공휴일만 차감 (중복 날짜는 1회)
+    holiday_set = holidays if isinstance(holidays, (set, frozenset)) else frozenset(holidays)
+    workdays -= sum(
+        1 for holiday in holiday_set
+        if start_date <= holiday <= end_date and holiday.weekday() < 5
+    )
     return workdays
 
 
@@ -257,22 +334,16 @@ def compute_timeoff_hours(
     Returns:
         Total time-off hours (VACATION=8h, HALF_DAY=4h)
     """
-    total_hours = 0.0
-
-    for timeoff in timeoffs:
-        if start_date <= timeoff.date <= end_date:
-            if timeoff.type == TimeOffType.VACATION:
-                total_hours += 8.0
-            elif timeoff.type == TimeOffType.HALF_DAY:
-                total_hours += 4.0
-
-    return total_hours
+    return sum(
+        (_TIMEOFF_HOURS.get(timeoff.type, 0.0) for timeoff in timeoffs if start_date <= timeoff.date <= end_date),
+        0.0,
+    )
 
 
 def compute_available_hours(
     start_date: date,
     end_date: date,
-    holidays: list[date],
+    holidays: Union[list[date], frozenset[date]],
     timeoffs: list[UserTimeOff],
     workday_hours: int = 8,
 ) -> float:
@@ -302,7 +373,7 @@ def compute_capacity_metrics(
     username: str,
     start_date: date,
     end_date: date,
-    holidays: list[date],
+    holidays: Union[list[date], frozenset[date]],
     timeoffs: list[UserTimeOff],
     worklogs: list[WorkLog],
     workday_hours: int = 8,
@@ -409,8 +480,12 @@ def compute_performance_stats(
             }
         }
     """
-    # 작업자별 집계
-    worker_stats = {}
+    # 작업자별 집계 (작업자 인덱스로 접근하는 항목별 리스트)
+    worker_index: dict[str, int] = {}
+    completed_counts: list[int] = []
+    rework_counts: list[int] = []
+    days_totals: list[int] = []
+    days_counts: list[int] = []
 
     for case in cases:
         if not case.assigned_user:
@@ -422,39 +497,37 @@ def compute_performance_stats(
         if selected_workers and username not in selected_workers:
             continue
 
-        if username not in worker_stats:
-            worker_stats[username] = {
-                "completed": 0,
-                "rework": 0,
-                "total_days": 0,
-                "days_count": 0,
-            }
+        idx = worker_index.get(username)
+        if idx is None:
+            idx = worker_index[username] = len(worker_index)
+            completed_counts.append(0)
+            rework_counts.append(0)
+            days_totals.append(0)
+            days_counts.append(0)
 
-        worker_stats[username]["completed"] += 1
+        completed_counts[idx] += 1
 
         # 재작업 여부: revision > 1 이면 재작업 발생한 케이스
         if case.revision > 1:
-            worker_stats[username]["rework"] += 1
+            rework_counts[idx] += 1
 
         # 소요일 계산 (started_at ~ worker_completed_at 또는 accepted_at)
         if case.started_at:
             end_dt = case.worker_completed_at or case.accepted_at
             if end_dt:
-                days = (end_dt.date() - case.started_at.date()).days + 1
-                worker_stats[username]["total_days"] += days
-                worker_stats[username]["days_count"] += 1
+                days_totals[idx] += (end_dt.date() - case.started_at.date()).days + 1
+                days_counts[idx] += 1
 
     # 결과 계산
     by_worker = []
-    total_completed = 0
-    total_rework = 0
-    total_days = 0
-    total_days_count = 0
-
-    for username in sorted(worker_stats.keys()):
-        stats = worker_stats[username]
-        completed = stats["completed"]
-        rework = stats["rework"]
+    total_completed = sum(completed_counts)
+    total_rework = sum(rework_counts)
+    total_days = sum(days_totals)
+    total_days_count = sum(days_counts)
+
+    for username, idx in sorted(worker_index.items()):
+        completed = completed_counts[idx]
+        rework = rework_counts[idx]
         first_pass = completed - rework
         rework_rate = (rework / completed * 100) if completed > 0 else 0
         first_pass_rate = (first_pass / completed * 100) if completed > 0 else 0
@@ -468,11 +541,6 @@ def compute_performance_stats(
             "first_pass_rate": round(first_pass_rate, 1),
         })
 
-        total_completed += completed
-        total_rework += rework
-        total_days += stats["total_days"]
-        total_days_count += stats["days_count"]
-
     # 전체 합계
     total_first_pass = total_completed - total_rework
     total_rework_rate = (total_rework / total_completed * 100) if total_completed > 0 else 0
@@ -531,6 +599,25 @@ def compute_monthly_performance(
     """
     from calendar import monthrange
 
+    # 케이스를 한 번만 순회해 (기간 내 승인일 기준) 월별 [완료, 재작업] 집계
+    # 월 구간과 기간의 교집합 = 기간 내 승인일 중 해당 월인 날짜이므로 경계 월도 그대로 맞음
+    month_counts: dict[int, list[int]] = {}
+    for case in cases:
+        if not case.assigned_user:
+            continue
+        if selected_workers and case.assigned_user.username not in selected_workers:
+            continue
+        if not case.accepted_at:
+            continue
+
+        accepted_date = case.accepted_at.date()
+        if accepted_date.year != year or not (start_date <= accepted_date <= end_date):
+            continue
+        counts = month_counts.setdefault(accepted_date.month, [0, 0])
+        counts[0] += 1
+        if case.revision > 1:
+            counts[1] += 1
+
     monthly_data = []
 
     for month in range(1, 13):
@@ -555,23 +642,7 @@ def compute_monthly_performance(
             })
             continue
 
-        # 해당 월/교집합 구간의 케이스 필터링
-        completed = 0
-        rework = 0
-
-        for case in cases:
-            if not case.assigned_user:
-                continue
-            if selected_workers and case.assigned_user.username not in selected_workers:
-                continue
-            if not case.accepted_at:
-                continue
-
-            accepted_date = case.accepted_at.date()
-            if intersect_start <= accepted_date <= intersect_end:
-                completed += 1
-                if case.revision > 1:
-                    rework += 1
+        completed, rework = month_counts.get(month, (0, 0))
 
         first_pass = completed - rework
         rework_rate = (rework / completed * 100) if completed > 0 else 0
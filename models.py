@@ -15,6 +15,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -150,6 +151,18 @@ class Part(Base):
 
 class Case(Base):
     __tablename__ = "cases"
+    __table_args__ = (
+        # 작업자별 케이스 목록 (assigned_user_id 필터 + created_at 정렬)
+        Index("ix_case_user_created", "assigned_user_id", "created_at"),
+        # 작업자별 WIP 집계 (assigned_user_id + status 필터)
+        Index("ix_case_user_status", "assigned_user_id", "status"),
+        # 검수 대기 목록 (status 필터 + worker_completed_at 정렬)
+        Index("ix_case_status_completed", "status", "worker_completed_at"),
+        # 전체/최근 등록 케이스 목록 (created_at 내림차순 + LIMIT)
+        Index("ix_case_created", "created_at"),
+        # 성과 집계 (ACCEPTED 필터 + accepted_at 기간)
+        Index("ix_case_status_accepted", "status", "accepted_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     case_uid: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
@@ -333,6 +346,12 @@ class AppConfig(Base):
 
 class WorkLog(Base):
     __tablename__ = "worklogs"
+    __table_args__ = (
+        # 케이스별 작업 기록 조회/마지막 기록 윈도 함수 (case_id 필터 + timestamp 정렬)
+        Index("ix_worklog_case_ts", "case_id", "timestamp"),
+        # 가용량 집계 (작업자 IN 필터 + timestamp 기간)
+        Index("ix_worklog_user_ts", "user_id", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     case_id: Mapped[int] = mapped_column(
@@ -507,6 +526,8 @@ class WorkerQcFeedback(Base):
     __tablename__ = "worker_qc_feedbacks"
     __table_args__ = (
         UniqueConstraint("case_id", "user_id", name="uq_case_worker_feedback"),
+        # 케이스별 최신 피드백 (case_id 필터 + created_at 내림차순)
+        Index("ix_wqcf_case_created", "case_id", "created_at"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
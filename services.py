@@ -4,12 +4,14 @@ All state changes go through Event-based transitions.
 WorkLog handles time tracking separately.
 """
 import json
+from collections import Counter, defaultdict
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import update
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, contains_eager
 
 
 @contextmanager
@@ -190,23 +192,27 @@ def get_config(db: Session, key: str) -> any:
 
 
 def get_or_create_project(db: Session, name: str) -> Project:
-    """Get or create a project by name."""
-    project = db.query(Project).filter(Project.name == name).first()
-    if not project:
-        project = Project(name=name, is_active=True)
-        db.add(project)
-        db.flush()
-    return project
+    """
+    Get or create a project by name.
+    INSERT ... ON CONFLICT(name) DO NOTHING 후 조회하므로
+    동시 등록에서도 중복 INSERT(UNIQUE 위반)가 발생하지 않음.
+    """
+    db.execute(
+        sqlite_insert(Project)
+        .values(name=name, is_active=True)
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    return db.query(Project).filter(Project.name == name).one()
 
 
 def get_or_create_part(db: Session, name: str) -> Part:
-    """Get or create a part by name."""
-    part = db.query(Part).filter(Part.name == name).first()
-    if not part:
-        part = Part(name=name, is_active=True)
-        db.add(part)
-        db.flush()
-    return part
+    """Get or create a part by name (Project와 동일하게 UPSERT 후 조회)."""
+    db.execute(
+        sqlite_insert(Part)
+        .values(name=name, is_active=True)
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    return db.query(Part).filter(Part.name == name).one()
 
 
 def get_user_wip_count(db: Session, user_id: int, exclude_paused: bool = True) -> int:
@@ -1255,7 +1261,8 @@ def get_team_capacity(
     # Get holidays
     calendar = get_work_calendar(db)
     holidays_list = json.loads(calendar.holidays_json)
-    holidays = [date_type.fromisoformat(d) for d in holidays_list]
+    # 작업자마다 count_workdays에서 set을 다시 만들지 않도록 한 번만 변환
+    holidays = frozenset(date_type.fromisoformat(d) for d in holidays_list)
 
     # Get all active workers
     workers = db.query(User).filter(User.role == UserRole.WORKER, User.is_active == True).all()
@@ -1264,33 +1271,36 @@ def get_team_capacity(
     workday_hours = get_config(db, "workday_hours")
     auto_timeout = get_config(db, "auto_timeout_minutes")
 
+    # 기간 경계 시각은 작업자와 무관하므로 루프 밖에서 한 번만 계산
+    period_start = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=TIMEZONE)
+    period_end = datetime.combine(end_date, datetime.max.time()).replace(tzinfo=TIMEZONE)
+
+    # 작업자 전체의 휴무/WorkLog를 한 번씩 조회 후 user_id로 묶음 (작업자별 쿼리 방지)
+    worker_ids = [worker.id for worker in workers]
+    timeoffs_by_user = defaultdict(list)
+    for timeoff in db.query(UserTimeOff).filter(
+        UserTimeOff.user_id.in_(worker_ids),
+        UserTimeOff.date >= start_date,
+        UserTimeOff.date <= end_date,
+    ).all():
+        timeoffs_by_user[timeoff.user_id].append(timeoff)
+
+    # compute_work_seconds는 timestamp/action_type만 쓰므로 WorkLog 엔티티 대신 컬럼만 조회
+    worklogs_by_user = defaultdict(list)
+    for worklog in db.query(WorkLog.user_id, WorkLog.timestamp, WorkLog.action_type).filter(
+        WorkLog.user_id.in_(worker_ids),
+        WorkLog.timestamp >= period_start,
+        WorkLog.timestamp <= period_end,
+    ).order_by(WorkLog.user_id, WorkLog.timestamp).all():
+        worklogs_by_user[worklog.user_id].append(worklog)
+
     user_metrics = []
     total_available = 0.0
     total_actual = 0.0
 
     for worker in workers:
-        # Get user's time-offs
-        timeoffs = (
-            db.query(UserTimeOff)
-            .filter(
-                UserTimeOff.user_id == worker.id,
-                UserTimeOff.date >= start_date,
-                UserTimeOff.date <= end_date,
-            )
-            .all()
-        )
-
-        # Get user's worklogs in the period
-        worklogs = (
-            db.query(WorkLog)
-            .filter(
-                WorkLog.user_id == worker.id,
-                WorkLog.timestamp >= datetime.combine(start_date, datetime.min.time()).replace(tzinfo=TIMEZONE),
-                WorkLog.timestamp <= datetime.combine(end_date, datetime.max.time()).replace(tzinfo=TIMEZONE),
-            )
-            .order_by(WorkLog.timestamp)
-            .all()
-        )
+        timeoffs = timeoffs_by_user[worker.id]
+        worklogs = worklogs_by_user[worker.id]
 
         metrics = compute_capacity_metrics(
             user_id=worker.id,
@@ -1613,6 +1623,22 @@ def get_autoqc_summary(db: Session, case_id: int) -> Optional[AutoQcSummaryRespo
 # QC Disagreement Services
 # ============================================================
 
+def _get_rework_requested_at_by_case(db: Session, case_ids: Optional[list[int]] = None) -> dict:
+    """
+    Auto-QC가 있는 케이스별 첫 REWORK_REQUESTED 시각 (한 번의 GROUP BY 쿼리).
+    케이스마다 case.events를 lazy load하지 않도록 불일치 조회/통계에서 사용.
+    case_ids를 주면 해당 케이스만 조회.
+    """
+    query = (
+        db.query(Event.case_id, func.min(Event.created_at))
+        .join(AutoQcSummary, AutoQcSummary.case_id == Event.case_id)
+        .filter(Event.event_type == EventType.REWORK_REQUESTED)
+    )
+    if case_ids is not None:
+        query = query.filter(Event.case_id.in_(case_ids))
+    return dict(query.group_by(Event.case_id).all())
+
+
 def get_qc_disagreements(
     db: Session,
     part_name: Optional[str] = None,
@@ -1634,6 +1660,7 @@ def get_qc_disagreements(
         db.query(Case, AutoQcSummary)
         .join(AutoQcSummary, Case.id == AutoQcSummary.case_id)
         .join(Part, Case.part_id == Part.id)
+        .options(contains_eager(Case.part))
     )
 
     # Apply filters
@@ -1648,13 +1675,21 @@ def get_qc_disagreements(
     if end_date:
         query = query.filter(Case.created_at <= datetime.combine(end_date, datetime.max.time()).replace(tzinfo=TIMEZONE))
 
+    # 불일치 조건도 WHERE로 내려 불일치 케이스만 조회 (분류는 아래 루프에서)
+    rework_case_ids = select(Event.case_id).where(Event.event_type == EventType.REWORK_REQUESTED)
+    query = query.filter(or_(
+        and_(AutoQcSummary.status.in_(("WARN", "INCOMPLETE")), Case.status == CaseStatus.ACCEPTED),
+        and_(AutoQcSummary.status == "PASS", Case.id.in_(rework_case_ids)),
+    ))
+
     results = query.all()
+    rework_requested_at = _get_rework_requested_at_by_case(db, [case.id for case, _ in results])
 
     disagreements = []
 
     for case, autoqc in results:
         # Check for disagreement
-        has_rework_event = any(e.event_type == EventType.REWORK_REQUESTED for e in case.events)
+        has_rework_event = case.id in rework_requested_at
         is_accepted = case.status == CaseStatus.ACCEPTED
 
         disagreement_type = None
@@ -1668,12 +1703,6 @@ def get_qc_disagreements(
             disagreement_type = "FALSE_POSITIVE"
 
         if disagreement_type:
-            # Find rework event timestamp
-            rework_event = next(
-                (e for e in case.events if e.event_type == EventType.REWORK_REQUESTED),
-                None
-            )
-
             disagreements.append(QcDisagreementItem(
                 case_id=case.id,
                 case_uid=case.case_uid,
@@ -1685,7 +1714,7 @@ def get_qc_disagreements(
                 case_status=case.status,
                 disagreement_type=disagreement_type,
                 accepted_at=case.accepted_at,
-                rework_requested_at=rework_event.created_at if rework_event else None,
+                rework_requested_at=rework_requested_at.get(case.id),
             ))
 
     return QcDisagreementListResponse(
@@ -1694,6 +1723,20 @@ def get_qc_disagreements(
     )
 
 
+def _disagreement_breakdown(keys: list, flags: list) -> dict:
+    """항목별 {total, disagreements, rate} (keys와 flags는 케이스 순서로 같은 길이)."""
+    totals = Counter(keys)
+    disagreements = Counter(key for key, flag in zip(keys, flags) if flag)
+    return {
+        key: {
+            "total": total,
+            "disagreements": disagreements[key],
+            "rate": round(disagreements[key] / total, 4),
+        }
+        for key, total in totals.items()
+    }
+
+
 def get_qc_disagreement_stats(
     db: Session,
     start_date: Optional["date"] = None,
@@ -1709,6 +1752,7 @@ def get_qc_disagreement_stats(
         db.query(Case, AutoQcSummary)
         .join(AutoQcSummary, Case.id == AutoQcSummary.case_id)
         .join(Part, Case.part_id == Part.id)
+        .options(contains_eager(Case.part))
     )
 
     if start_date:
@@ -1717,18 +1761,17 @@ def get_qc_disagreement_stats(
         query = query.filter(Case.created_at <= datetime.combine(end_date, datetime.max.time()).replace(tzinfo=TIMEZONE))
 
     results = query.all()
+    rework_requested_at = _get_rework_requested_at_by_case(db)
 
     total_cases = len(results)
     false_positives = 0
     false_negatives = 0
 
-    # Stats by category
-    by_part: dict = {}
-    by_hospital: dict = {}
-    by_difficulty: dict = {}
+    # 케이스별 (부위, 병원, 난이도) 키와 불일치 여부를 모은 뒤 Counter로 집계
+    part_keys, hospital_keys, difficulty_keys, disagreement_flags = [], [], [], []
 
     for case, autoqc in results:
-        has_rework_event = any(e.event_type == EventType.REWORK_REQUESTED for e in case.events)
+        has_rework_event = case.id in rework_requested_at
         is_accepted = case.status == CaseStatus.ACCEPTED
 
         is_disagreement = False
@@ -1741,39 +1784,18 @@ def get_qc_disagreement_stats(
             false_positives += 1
             is_disagreement = True
 
-        # Update by_part stats
-        part_name = case.part.name
-        if part_name not in by_part:
-            by_part[part_name] = {"total": 0, "disagreements": 0}
-        by_part[part_name]["total"] += 1
-        if is_disagreement:
-            by_part[part_name]["disagreements"] += 1
-
-        # Update by_hospital stats
-        hosp = case.hospital or "Unknown"
-        if hosp not in by_hospital:
-            by_hospital[hosp] = {"total": 0, "disagreements": 0}
-        by_hospital[hosp]["total"] += 1
-        if is_disagreement:
-            by_hospital[hosp]["disagreements"] += 1
-
-        # Update by_difficulty stats
-        diff = case.difficulty.value
-        if diff not in by_difficulty:
-            by_difficulty[diff] = {"total": 0, "disagreements": 0}
-        by_difficulty[diff]["total"] += 1
-        if is_disagreement:
-            by_difficulty[diff]["disagreements"] += 1
+        part_keys.append(case.part.name)
+        hospital_keys.append(case.hospital or "Unknown")
+        difficulty_keys.append(case.difficulty.value)
+        disagreement_flags.append(is_disagreement)
 
     # Calculate rates
     total_disagreements = false_positives + false_negatives
     disagreement_rate = round(total_disagreements / total_cases, 4) if total_cases > 0 else 0.0
 
-    for stats in [by_part, by_hospital, by_difficulty]:
-        for key in stats:
-            t = stats[key]["total"]
-            d = stats[key]["disagreements"]
-            stats[key]["rate"] = round(d / t, 4) if t > 0 else 0.0
+    by_part = _disagreement_breakdown(part_keys, disagreement_flags)
+    by_hospital = _disagreement_breakdown(hospital_keys, disagreement_flags)
+    by_difficulty = _disagreement_breakdown(difficulty_keys, disagreement_flags)
 
     return QcDisagreementStats(
         total_cases_with_autoqc=total_cases,
@@ -2359,10 +2381,14 @@ def save_or_update_worker_feedback(
     memo: Optional[str] = None,
     qc_result_error: bool = False,
     feedback_text: Optional[str] = None,
+    commit: bool = True,
 ) -> WorkerQcFeedback:
     """
     Save or update worker feedback (upsert pattern).
     One feedback per case per worker.
+
+    commit=False면 flush만 하고 commit은 호출자에게 맡김
+    (제출처럼 다른 변경과 한 트랜잭션으로 묶을 때 사용).
     """
     import uuid
 
@@ -2399,7 +2425,10 @@ def save_or_update_worker_feedback(
             }, ensure_ascii=False),
         )
         db.add(event)
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
         return existing
     else:
         # Create new
@@ -2430,7 +2459,10 @@ def save_or_update_worker_feedback(
             }, ensure_ascii=False),
         )
         db.add(event)
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
         return feedback
 
 
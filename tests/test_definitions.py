@@ -5,7 +5,10 @@ Verifies API Contract: docs/API_CONTRACT.md Section 7
 import pytest
 from starlette.testclient import TestClient
 
-from models import User, Project, DefinitionSnapshot
+from models import (
+    AutoQcSummary, Case, CaseStatus, Difficulty, Event, EventType,
+    Part, Project, User, DefinitionSnapshot,
+)
 from tests.conftest import admin_headers, worker_headers
 
 
@@ -296,6 +299,70 @@ class TestQcDisagreements:
 
         assert response.status_code == 200
 
+    def test_get_qc_disagreements_classification(
+        self,
+        client: TestClient,
+        db_session,
+        admin_user: User,
+        test_project: Project,
+        test_part: Part,
+    ):
+        """
+        GET /api/admin/qc_disagreements should classify disagreements.
+
+        - WARN + ACCEPTED              -> FALSE_NEGATIVE
+        - PASS + REWORK_REQUESTED 이벤트 -> FALSE_POSITIVE
+        - PASS + ACCEPTED              -> 제외 (불일치 아님)
+        """
+        seeds = [
+            ("DISAGREE-FN", "WARN", CaseStatus.ACCEPTED, False),
+            ("DISAGREE-FP", "PASS", CaseStatus.REWORK, True),
+            ("AGREE-PASS", "PASS", CaseStatus.ACCEPTED, False),
+        ]
+        case_ids = {}
+        for case_uid, autoqc_status, case_status, rework in seeds:
+            case = Case(
+                case_uid=case_uid,
+                display_name=case_uid,
+                hospital="Test Hospital",
+                project_id=test_project.id,
+                part_id=test_part.id,
+                difficulty=Difficulty.NORMAL,
+                status=case_status,
+                revision=1,
+            )
+            db_session.add(case)
+            db_session.flush()
+            db_session.add(AutoQcSummary(case_id=case.id, status=autoqc_status))
+            if rework:
+                db_session.add(Event(
+                    case_id=case.id,
+                    user_id=admin_user.id,
+                    event_type=EventType.REWORK_REQUESTED,
+                    idempotency_key=f"test-rework-{case_uid}",
+                ))
+            case_ids[case_uid] = case.id
+        db_session.commit()
+
+        response = client.get(
+            "/api/admin/qc_disagreements",
+            headers=admin_headers(admin_user),
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        types = {item["case_id"]: item["disagreement_type"] for item in data["disagreements"]}
+        assert types == {
+            case_ids["DISAGREE-FN"]: "FALSE_NEGATIVE",
+            case_ids["DISAGREE-FP"]: "FALSE_POSITIVE",
+        }
+        fp_item = next(
+            item for item in data["disagreements"]
+            if item["case_id"] == case_ids["DISAGREE-FP"]
+        )
+        assert fp_item["rework_requested_at"] is not None
+
     def test_get_qc_disagreements_stats(self, client: TestClient, admin_user: User):
         """
         GET /api/admin/qc_disagreements/stats should return disagreement statistics.
@@ -0,0 +1,288 @@
+"""
+Tests for metrics calculation functions.
+Verifies that optimized paths match the straightforward implementations.
+"""
+import random
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import metrics
+from config import TIMEZONE
+from models import ActionType
+
+
+def make_worklog_history(rng: random.Random, count: int) -> list:
+    """Random worklog history mixing naive and tz-aware timestamps."""
+    actions = list(ActionType)
+    current = datetime(2024, 3, 4, 9, 0, 0)
+    worklogs = []
+    for _ in range(count):
+        current += timedelta(
+            seconds=rng.randint(1, 4 * 60 * 60),
+            microseconds=rng.randint(0, 999_999),
+        )
+        aware = current.replace(tzinfo=TIMEZONE)
+        # naive = SQLite가 돌려주는 시각 (KST로 간주)
+        timestamp = rng.choice([current, aware, aware.astimezone(timezone.utc)])
+        worklogs.append(SimpleNamespace(
+            action_type=rng.choice(actions),
+            timestamp=timestamp,
+        ))
+    return worklogs
+
+
+def make_accepted_cases(rng: random.Random, count: int) -> list:
+    """Random accepted-case stand-ins for the performance aggregations."""
+    workers = [SimpleNamespace(username=name) for name in ("alice", "bob", "carol", "dave")]
+    cases = []
+    for _ in range(count):
+        started_at = datetime(2023, 11, 1, 9, 0, tzinfo=TIMEZONE) + timedelta(
+            hours=rng.randint(0, 24 * 500)
+        )
+        worker_completed_at = (
+            started_at + timedelta(hours=rng.randint(1, 24 * 10))
+            if rng.random() < 0.7 else None
+        )
+        accepted_at = (
+            started_at + timedelta(hours=rng.randint(1, 24 * 15))
+            if rng.random() < 0.9 else None
+        )
+        cases.append(SimpleNamespace(
+            assigned_user=rng.choice(workers) if rng.random() < 0.95 else None,
+            revision=rng.choice([1, 1, 1, 2, 3]),
+            started_at=started_at if rng.random() < 0.9 else None,
+            worker_completed_at=worker_completed_at,
+            accepted_at=accepted_at,
+        ))
+    return cases
+
+
+class TestComputeWorkSeconds:
+    """Test compute_work_seconds scalar vs NumPy paths."""
+
+    def test_vectorized_matches_scalar(self, monkeypatch):
+        """
+        The NumPy path must return the same total as the scalar loop,
+        including naive timestamps and an ongoing session at the end.
+        """
+        pytest.importorskip("numpy")
+        rng = random.Random(20240304)
+
+        for _ in range(200):
+            count = rng.randint(metrics._VECTORIZE_MIN_WORKLOGS, 300)
+            worklogs = make_worklog_history(rng, count)
+            reference_time = metrics.ensure_tz_aware(worklogs[-1].timestamp) + timedelta(
+                minutes=rng.randint(0, 300)
+            )
+            timeout = rng.choice([30, 60, 120])
+
+            vectorized = metrics.compute_work_seconds(worklogs, timeout, reference_time)
+            with monkeypatch.context() as patch:
+                patch.setattr(metrics, "np", None)
+                scalar = metrics.compute_work_seconds(worklogs, timeout, reference_time)
+
+            assert vectorized == scalar
+
+    def test_vectorized_without_session_actions(self):
+        """Histories without any start/end action count as zero work."""
+        pytest.importorskip("numpy")
+        worklogs = [
+            SimpleNamespace(action_type="UNKNOWN", timestamp=datetime(2024, 3, 4, 9, 0))
+            for _ in range(metrics._VECTORIZE_MIN_WORKLOGS)
+        ]
+
+        assert metrics.compute_work_seconds(worklogs) == 0
+
+
+class TestGetTimelineDates:
+    """Test get_timeline_dates action matching."""
+
+    def test_plain_string_actions_match_enum(self):
+        """
+        Raw action strings (str-Enum values) must be treated like ActionType,
+        so a string RESUME after PAUSE still marks the case as in progress.
+        """
+        start = datetime(2024, 3, 4, 9, 0, tzinfo=TIMEZONE)
+        actions = ["START", "PAUSE", "RESUME"]
+        for action_types in (actions, [ActionType(a) for a in actions]):
+            worklogs = [
+                SimpleNamespace(action_type=action, timestamp=start + timedelta(hours=i))
+                for i, action in enumerate(action_types)
+            ]
+
+            assert metrics.get_timeline_dates(worklogs) == (start, None)
+
+
+class TestCountWorkdays:
+    """Test count_workdays against a day-by-day count."""
+
+    @staticmethod
+    def count_by_day(start_date: date, end_date: date, holidays) -> int:
+        holiday_set = set(holidays)
+        workdays = 0
+        current = start_date
+        while current <= end_date:
+            if current.weekday() < 5 and current not in holiday_set:
+                workdays += 1
+            current += timedelta(days=1)
+        return workdays
+
+    def test_matches_day_by_day_count(self):
+        """Random ranges with weekend, duplicate and out-of-range holidays."""
+        rng = random.Random(20240101)
+        base = date(2024, 1, 1)
+
+        for _ in range(500):
+            start_date = base + timedelta(days=rng.randint(0, 400))
+            end_date = start_date + timedelta(days=rng.randint(-3, 120))
+            holidays = [
+                base + timedelta(days=rng.randint(0, 530))
+                for _ in range(rng.randint(0, 20))
+            ]
+            expected = self.count_by_day(start_date, end_date, holidays)
+
+            assert metrics.count_workdays(start_date, end_date, holidays) == expected
+            assert metrics.count_workdays(start_date, end_date, frozenset(holidays)) == expected
+
+
+class TestComputeMonthlyPerformance:
+    """Test compute_monthly_performance against a per-month scan."""
+
+    @staticmethod
+    def scan_by_month(cases, year, start_date, end_date, selected_workers=None):
+        from calendar import monthrange
+
+        monthly_data = []
+        for month in range(1, 13):
+            intersect_start = max(date(year, month, 1), start_date)
+            intersect_end = min(date(year, month, monthrange(year, month)[1]), end_date)
+            month_label = f"{year}-{month:02d}"
+            if intersect_start > intersect_end:
+                monthly_data.append({
+                    "month": month_label,
+                    "in_range": False,
+                    "completed": None,
+                    "rework": None,
+                    "rework_rate": None,
+                    "first_pass_rate": None,
+                })
+                continue
+
+            completed = rework = 0
+            for case in cases:
+                if not case.assigned_user or not case.accepted_at:
+                    continue
+                if selected_workers and case.assigned_user.username not in selected_workers:
+                    continue
+                if intersect_start <= case.accepted_at.date() <= intersect_end:
+                    completed += 1
+                    if case.revision > 1:
+                        rework += 1
+
+            monthly_data.append({
+                "month": month_label,
+                "in_range": True,
+                "completed": completed,
+                "rework": rework,
+                "rework_rate": round(rework / completed * 100, 1) if completed else 0,
+                "first_pass_rate": (
+                    round((completed - rework) / completed * 100, 1) if completed else 0
+                ),
+            })
+        return monthly_data
+
+    def test_matches_per_month_scan(self):
+        """Periods crossing year and month boundaries, with and without a worker filter."""
+        rng = random.Random(20240601)
+        cases = make_accepted_cases(rng, 400)
+        base = date(2023, 10, 1)
+
+        for _ in range(100):
+            start_date = base + timedelta(days=rng.randint(0, 500))
+            end_date = start_date + timedelta(days=rng.randint(-5, 300))
+            year = rng.choice([start_date.year, end_date.year, 2024])
+            selected_workers = rng.choice([None, [], ["alice"], ["bob", "dave"]])
+
+            assert metrics.compute_monthly_performance(
+                cases, year, start_date, end_date, selected_workers
+            ) == self.scan_by_month(cases, year, start_date, end_date, selected_workers)
+
+
+class TestComputePerformanceStats:
+    """Test compute_performance_stats against per-worker dict aggregation."""
+
+    @staticmethod
+    def aggregate_by_dict(cases, workdays, selected_workers=None):
+        worker_stats = {}
+        for case in cases:
+            if not case.assigned_user:
+                continue
+            username = case.assigned_user.username
+            if selected_workers and username not in selected_workers:
+                continue
+            stats = worker_stats.setdefault(
+                username, {"completed": 0, "rework": 0, "total_days": 0, "days_count": 0}
+            )
+            stats["completed"] += 1
+            if case.revision > 1:
+                stats["rework"] += 1
+            if case.started_at:
+                end_dt = case.worker_completed_at or case.accepted_at
+                if end_dt:
+                    stats["total_days"] += (end_dt.date() - case.started_at.date()).days + 1
+                    stats["days_count"] += 1
+
+        by_worker = []
+        for username in sorted(worker_stats):
+            stats = worker_stats[username]
+            completed, rework = stats["completed"], stats["rework"]
+            by_worker.append({
+                "worker": username,
+                "completed": completed,
+                "rework": rework,
+                "rework_rate": round(rework / completed * 100, 1),
+                "first_pass": completed - rework,
+                "first_pass_rate": round((completed - rework) / completed * 100, 1),
+            })
+
+        total_completed = sum(s["completed"] for s in worker_stats.values())
+        total_rework = sum(s["rework"] for s in worker_stats.values())
+        total_days = sum(s["total_days"] for s in worker_stats.values())
+        total_days_count = sum(s["days_count"] for s in worker_stats.values())
+        rework_rate = round(total_rework / total_completed * 100, 1) if total_completed else 0
+        first_pass_rate = (
+            round((total_completed - total_rework) / total_completed * 100, 1)
+            if total_completed else 0
+        )
+        return {
+            "summary": {
+                "total_completed": total_completed,
+                "avg_days": round(total_days / total_days_count, 2) if total_days_count else 0,
+                "rework_rate": rework_rate,
+                "daily_avg": round(total_completed / workdays, 2) if workdays > 0 else 0,
+            },
+            "by_worker": by_worker,
+            "totals": {
+                "completed": total_completed,
+                "rework": total_rework,
+                "rework_rate": rework_rate,
+                "first_pass": total_completed - total_rework,
+                "first_pass_rate": first_pass_rate,
+            },
+        }
+
+    def test_matches_dict_aggregation(self):
+        """Random case sets, worker filters and workday counts (including zero)."""
+        rng = random.Random(20240901)
+        start_date, end_date = date(2024, 1, 1), date(2024, 12, 31)
+
+        for _ in range(100):
+            cases = make_accepted_cases(rng, rng.randint(0, 200))
+            workdays = rng.choice([0, 1, 21, 250])
+            selected_workers = rng.choice([None, [], ["carol"], ["alice", "bob"], ["nobody"]])
+
+            assert metrics.compute_performance_stats(
+                cases, start_date, end_date, workdays, selected_workers
+            ) == self.aggregate_by_dict(cases, workdays, selected_workers)
@@ -2,8 +2,10 @@
 Tests for TimeOff and Holiday endpoints.
 Verifies API Contract: docs/API_CONTRACT.md Section 5
 """
+import random
 import pytest
 from datetime import date, timedelta
+from types import SimpleNamespace
 from starlette.testclient import TestClient
 
 from models import User, UserTimeOff, TimeOffType, WorkCalendar
@@ -320,3 +322,79 @@ class TestHolidays:
         )
 
         assert response.status_code == 403
+
+
+class TestGroupConsecutiveTimeoffs:
+    """Test dashboard time-off grouping against the row-by-row loop."""
+
+    @staticmethod
+    def group_row_by_row(timeoffs: list) -> list[dict]:
+        groups = []
+        current_group = None
+        for t in sorted(timeoffs, key=lambda t: (t.user.username, t.type.value, t.date)):
+            if (
+                current_group is not None
+                and current_group["user_id"] == t.user_id
+                and current_group["type"] == t.type
+                and (t.date - current_group["end_date"]).days == 1
+            ):
+                current_group["end_date"] = t.date
+                current_group["days"] += 1
+                current_group["ids"].append(t.id)
+                continue
+            if current_group is not None:
+                groups.append(current_group)
+            current_group = {
+                "user_id": t.user_id,
+                "username": t.user.username,
+                "type": t.type,
+                "start_date": t.date,
+                "end_date": t.date,
+                "days": 1,
+                "ids": [t.id],
+            }
+        groups.append(current_group)
+
+        for g in groups:
+            if g["type"] == TimeOffType.VACATION:
+                g["hours"] = g["days"] * 8
+                g["days_display"] = f"{g['days']}일"
+            else:
+                g["hours"] = g["days"] * 4
+                g["days_display"] = f"{g['days'] * 0.5}일"
+            if g["start_date"] == g["end_date"]:
+                g["period"] = g["start_date"].strftime("%Y-%m-%d")
+            else:
+                g["period"] = f"{g['start_date'].strftime('%Y-%m-%d')} ~ {g['end_date'].strftime('%m-%d')}"
+
+        groups.sort(key=lambda x: x["start_date"], reverse=True)
+        return groups
+
+    def test_matches_row_by_row_grouping(self):
+        """
+        Random time-offs (runs across month/year ends, mixed types, gaps)
+        must group the same way as the original loop.
+        """
+        dashboard = pytest.importorskip("dashboard")
+        rng = random.Random(20241201)
+        users = [
+            SimpleNamespace(id=user_id, username=name)
+            for user_id, name in ((1, "kim"), (2, "lee"), (3, "park"))
+        ]
+
+        for _ in range(50):
+            # (user_id, date) 유니크 제약과 같게 생성
+            timeoffs = []
+            for user in users:
+                for offset in sorted(rng.sample(range(60), rng.randint(0, 25))):
+                    timeoffs.append(SimpleNamespace(
+                        id=len(timeoffs) + 1,
+                        user_id=user.id,
+                        user=user,
+                        type=rng.choice(list(TimeOffType)),
+                        date=date(2024, 12, 1) + timedelta(days=offset),
+                    ))
+            rng.shuffle(timeoffs)
+
+            expected = self.group_row_by_row(timeoffs) if timeoffs else []
+            assert dashboard.group_consecutive_timeoffs(timeoffs) == expected